@@ -4,14 +4,27 @@ OpenAI API를 사용하여 게시물을 분석합니다.
 """
 
 import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from openai import OpenAI
 from config import config
+from rate_limiter import RateLimiter
+from analysis_cache import AnalysisCache
+from date_extractor import date_extractor
+from analysis_router import AnalysisRouter
+from metrics import LLM_REQUEST_SECONDS, LLM_TOKENS, bind_run
 
 
 class AISummarizer:
     """AI 요약 및 일정 추출 클래스"""
     
+    # 프롬프트를 바꾸면 올려서 이전 분석 캐시를 무효화
+    PROMPT_VERSION = "1"
+    
+    SYSTEM_PROMPT = "당신은 소셜 미디어 게시물을 분석하는 전문가입니다. 간결하고 정확하게 요약하고, 이벤트 날짜를 추출합니다."
+    
     def __init__(self):
         """OpenAI 클라이언트 초기화"""
         if not config.OPENAI_API_KEY:
@@ -22,10 +35,38 @@ class AISummarizer:
         os.environ['OPENAI_API_KEY'] = config.OPENAI_API_KEY
         
         # 클라이언트 초기화 (api_key 파라미터 없이)
-        self.client = OpenAI()
+        # 재시도는 _request_completion에서 직접 처리
+        # openai는 import만 해도 오래 걸려서 클라이언트를 처음 만들 때 불러옴
+        from openai import OpenAI
+        self.client = OpenAI(base_url=config.OPENAI_BASE_URL, max_retries=0)
         self.model = "gpt-4o-mini"  # 저렴하고 빠른 모델
+        
+        # 동시 요청 수 / 속도 제한
+        self.max_concurrency = config.OPENAI_MAX_CONCURRENCY
+        self.max_retries = config.OPENAI_MAX_RETRIES
+        self.pack_size = config.ANALYSIS_PACK_SIZE
+        
+        # 로컬 날짜 추출 / 분석 경로 규칙
+        self.local_date_extraction = config.LOCAL_DATE_EXTRACTION
+        self.router = AnalysisRouter()
+        self.rate_limiter = RateLimiter(config.OPENAI_RPM, config.OPENAI_TPM)
+        
+        # 분석 결과 캐시
+        self.cache = AnalysisCache()
+        # 마지막 analyze_batch 통계 (동시에 실행되는 동기화끼리 섞이지 않도록 스레드별 저장)
+        self._last_stats = threading.local()
         print("✅ OpenAI 클라이언트 초기화 완료!")
-    
+
+    @property
+    def last_cache_stats(self):
+        """이 스레드에서 마지막으로 실행한 analyze_batch의 캐시 적중/미스"""
+        return getattr(self._last_stats, 'cache', {'hits': 0, 'misses': 0})
+
+    @property
+    def last_route_stats(self):
+        """이 스레드에서 마지막으로 실행한 analyze_batch의 분석 경로별 개수"""
+        return getattr(self._last_stats, 'routes', {})
+
     def analyze_post(self, post_data):
         """
         게시물 분석:
@@ -39,68 +80,363 @@ class AISummarizer:
             dict: 분석 결과 {summary, hasSchedule, scheduleDate}
         """
         try:
-            # 게시물 내용 준비
-            title = post_data.get('title', '')
-            content = post_data.get('content', '')
-            url = post_data.get('url', '')
-            
-            # HTML 태그 제거 (간단 버전)
-            content = self._clean_html(content)
-            
-            # 너무 긴 내용은 잘라내기 (비용 절감)
-            max_length = 2000
-            if len(content) > max_length:
-                content = content[:max_length] + "..."
-            
-            # 프롬프트 생성
-            prompt = self._create_prompt(title, content)
-            
-            # OpenAI API 호출
-            print(f"🤖 AI 분석 중: {title[:30]}...")
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 소셜 미디어 게시물을 분석하는 전문가입니다. 간결하고 정확하게 요약하고, 이벤트 날짜를 추출합니다."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},  # JSON 형식 강제
-                temperature=0.3,  # 일관된 결과를 위해 낮은 온도
-            )
-            
-            # 응답 파싱
-            result = json.loads(response.choices[0].message.content)
+            entry = self._build_entry(post_data)
             
-            print(f"✅ 분석 완료: 일정 {'있음' if result.get('hasSchedule') else '없음'}")
+            # 규칙에 맞는 게시물은 API 호출 없이 처리
+            if entry['mode'] == 'local':
+                print(f"⚡ 로컬 분석: {entry['title'][:30]}...")
+                return self._local_result(entry)
             
-            return result
+            # 같은 내용은 이전 분석 결과 재사용
+            cached = self._cached_result(entry)
+            if cached is not None:
+                print(f"💾 캐시된 분석 사용: {entry['title'][:30]}...")
+                return cached
+            
+            return self._finalize(entry, self._analyze_single(entry))
             
         except Exception as e:
             print(f"❌ AI 분석 실패: {e}")
-            # 실패시 기본값 반환
-            return {
-                "summary": post_data.get('title', '요약 실패')[:100],
-                "hasSchedule": False,
-                "scheduleDate": None
+            return self._default_result(post_data)
+    
+    def _default_result(self, post_data):
+        """분석 실패시 기본값"""
+        return {
+            "summary": post_data.get('title', '요약 실패')[:100],
+            "hasSchedule": False,
+            "scheduleDate": None
+        }
+    
+    def _prepare_post(self, post_data):
+        """
+        분석할 제목과 내용 준비
+        
+        Args:
+            post_data (dict): 게시물 데이터
+            
+        Returns:
+            tuple: (제목, HTML 제거 후 잘라낸 내용)
+        """
+        title = post_data.get('title', '')
+        content = post_data.get('content', '')
+        
+        # HTML 태그 제거 (간단 버전)
+        content = self._clean_html(content)
+        
+        # 너무 긴 내용은 잘라내기 (비용 절감)
+        max_length = 2000
+        if len(content) > max_length:
+            content = content[:max_length] + "..."
+        
+        return title, content
+    
+    def _build_entry(self, post_data, index=0):
+        """
+        분석 항목 생성 (로컬 날짜 추출 + 경로 규칙으로 분석 방식 결정)
+        
+        분석 방식 (mode):
+        - full: 요약 + 일정 모두 LLM에 요청
+        - summary: 요약만 LLM에 요청 (일정은 로컬 추출 결과 사용)
+        - local: LLM 호출 없음 (경로 규칙에 맞고 일정도 로컬에서 확정된 게시물)
+        
+        날짜 표현이 있지만 확실하지 않은 게시물은 규칙에 맞더라도 LLM에 맡깁니다.
+        
+        Args:
+            post_data (dict): 게시물 데이터
+            index (int): 배치 안에서의 위치
+            
+        Returns:
+            dict: {index, post, title, content, mode, route, schedule, cache_key}
+        """
+        title, content = self._prepare_post(post_data)
+        mode, route, schedule = 'full', None, None
+        
+        if self.local_date_extraction:
+            extraction = date_extractor.extract(f"{title} {content}")
+            if extraction['confident']:
+                # 확실한 날짜가 있으면 그대로 사용
+                schedule = {'hasSchedule': True, 'scheduleDate': extraction['scheduleDate']}
+            elif not extraction['hasDateCue']:
+                # 날짜 표현이 전혀 없으면 일정 없음
+                schedule = {'hasSchedule': False, 'scheduleDate': None}
+            
+            if schedule is not None:
+                route = self.router.match(post_data, title, content)
+                mode = 'local' if route else 'summary'
+        
+        # 요약만 요청한 결과는 별도 키로 캐시
+        prompt_version = self.PROMPT_VERSION if mode == 'full' else f"{self.PROMPT_VERSION}:summary"
+        
+        return {
+            'index': index,
+            'post': post_data,
+            'title': title,
+            'content': content,
+            'mode': mode,
+            'route': route,
+            'schedule': schedule,
+            'cache_key': AnalysisCache.make_key(self.model, prompt_version, title, content)
+        }
+    
+    def _finalize(self, entry, result):
+        """모델 결과에 로컬 일정 추출 결과 반영"""
+        result = dict(result)
+        if entry['schedule'] is not None:
+            result.update(entry['schedule'])
+        return result
+    
+    def _local_result(self, entry):
+        """LLM 없이 만든 분석 결과 (정리된 본문을 그대로 요약으로 사용)"""
+        content = entry['content']
+        if entry['route'] == 'empty-youtube' or not content.strip():
+            content = entry['title']
+        summary = content[:100]
+        return self._finalize(entry, {"summary": summary})
+    
+    def _cached_result(self, entry):
+        """캐시된 분석 결과 (없으면 None)"""
+        cached = self.cache.get(entry['cache_key'])
+        if cached is None:
+            return None
+        return self._finalize(entry, cached)
+    
+    def _analyze_single(self, entry):
+        """
+        게시물 하나를 OpenAI로 분석
+        
+        Args:
+            entry (dict): 분석 항목
+            
+        Returns:
+            dict: 모델 분석 결과 (로컬 일정 반영 전)
+        """
+        summary_only = entry['mode'] == 'summary'
+        
+        # 프롬프트 생성
+        prompt = self._create_prompt(entry['title'], entry['content'], summary_only)
+        
+        # OpenAI API 호출
+        print(f"🤖 AI 분석 중: {entry['title'][:30]}...")
+        response = self._request_completion([
+            {
+                "role": "system",
+                "content": self.SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
+        ])
+        
+        # 응답 파싱
+        result = json.loads(response.choices[0].message.content)
+        if summary_only:
+            result = {"summary": result.get('summary') or entry['title'][:100]}
+        self.cache.set(entry['cache_key'], result)
+        
+        if summary_only:
+            print(f"✅ 요약 완료")
+        else:
+            print(f"✅ 분석 완료: 일정 {'있음' if result.get('hasSchedule') else '없음'}")
+        
+        return result
+    
+    def _analyze_pack(self, entries):
+        """
+        여러 게시물을 요청 하나로 묶어서 분석 (같은 mode끼리)
+        
+        응답에 빠졌거나 형식이 잘못된 게시물은 하나씩 다시 분석합니다.
+        
+        Args:
+            entries (list): 분석 항목 리스트
+            
+        Returns:
+            dict: {index: 분석 결과}
+        """
+        results = {}
+        summary_only = entries[0]['mode'] == 'summary'
+        
+        try:
+            print(f"🤖 AI 묶음 분석 중: {len(entries)}개 게시물")
+            response = self._request_completion([
+                {
+                    "role": "system",
+                    "content": self.SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": self._create_pack_prompt(entries, summary_only)
+                }
+            ], expected_outputs=len(entries))
+            
+            items = json.loads(response.choices[0].message.content).get('results', [])
+            by_id = {str(item.get('id')): item for item in items if isinstance(item, dict)}
+            
+            for pack_id, entry in enumerate(entries):
+                result = self._validate_result(by_id.get(str(pack_id)), summary_only)
+                if result is not None:
+                    self.cache.set(entry['cache_key'], result)
+                    results[entry['index']] = self._finalize(entry, result)
+        
+        except Exception as e:
+            print(f"⚠️  묶음 분석 실패: {e}")
+        
+        # 빠진 게시물은 한 개씩 분석
+        missing = [entry for entry in entries if entry['index'] not in results]
+        if missing:
+            print(f"  ↩️  {len(missing)}개 게시물은 개별 분석으로 재시도")
+        for entry in missing:
+            results[entry['index']] = self._analyze_entry(entry)
+        
+        return results
+    
+    def _analyze_entry(self, entry):
+        """분석 항목 하나를 개별 분석 (실패하면 기본값)"""
+        try:
+            return self._finalize(entry, self._analyze_single(entry))
+        except Exception as e:
+            print(f"❌ AI 분석 실패: {e}")
+            return self._finalize(entry, self._default_result(entry['post']))
+    
+    def _validate_result(self, result, summary_only=False):
+        """
+        분석 결과 형식 검증
+        
+        Args:
+            result (dict): 모델이 돌려준 분석 결과
+            summary_only (bool): 요약만 요청했는지 여부
+            
+        Returns:
+            dict: 정리된 분석 결과 (형식이 잘못됐으면 None)
+        """
+        if not isinstance(result, dict):
+            return None
+        
+        summary = result.get('summary')
+        if not isinstance(summary, str) or not summary.strip():
+            return None
+        if summary_only:
+            return {"summary": summary.strip()}
+        
+        has_schedule = result.get('hasSchedule')
+        schedule_date = result.get('scheduleDate')
+        
+        if not isinstance(has_schedule, bool):
+            return None
+        if has_schedule:
+            try:
+                datetime.strptime(schedule_date, '%Y-%m-%d')
+            except (TypeError, ValueError):
+                return None
+        else:
+            schedule_date = None
+        
+        return {
+            "summary": summary.strip(),
+            "hasSchedule": has_schedule,
+            "scheduleDate": schedule_date
+        }
+    
+    def _request_completion(self, messages, expected_outputs=1):
+        """
+        속도 제한을 지키며 OpenAI API 호출
+        
+        429 응답은 Retry-After만큼 모든 요청을 멈춘 뒤 재시도하고,
+        일시적인 오류는 지수 백오프 + 지터로 재시도합니다.
+        
+        Args:
+            messages (list): 채팅 메시지 리스트
+            expected_outputs (int): 응답에 들어갈 분석 결과 수
+            
+        Returns:
+            OpenAI 응답 객체
+        """
+        from openai import RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+        
+        # 한글은 대략 글자당 1토큰, 응답 몫으로 결과당 200토큰 추가
+        estimated_tokens = sum(len(m['content']) for m in messages) + 200 * expected_outputs
+        
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire(estimated_tokens)
+            started = time.monotonic()
+            outcome = 'error'
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},  # JSON 형식 강제
+                    temperature=0.3,  # 일관된 결과를 위해 낮은 온도
+                )
+                outcome = 'ok'
+                self._record_usage(response)
+                return response
+            except RateLimitError as e:
+                outcome = 'rate_limited'
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_after(e) or 2 ** attempt
+                delay += random.uniform(0, delay * 0.25)
+                # 다른 워커도 같이 쉬도록 제한기 전체를 멈춤
+                self.rate_limiter.pause(delay)
+                print(f"  ⏳ 요청 한도 초과 (429), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+            except (APIConnectionError, APITimeoutError, InternalServerError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = 2 ** attempt + random.uniform(0, 1)
+                print(f"  ⚠️  OpenAI 일시적 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {e}")
+            finally:
+                LLM_REQUEST_SECONDS.observe(time.monotonic() - started, model=self.model, outcome=outcome)
+            if outcome == 'error':
+                time.sleep(delay)
+            attempt += 1
     
-    def _create_prompt(self, title, content):
+    def _record_usage(self, response):
+        """응답의 토큰 사용량 기록 (/api/metrics)"""
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return
+        LLM_TOKENS.inc(getattr(usage, 'prompt_tokens', 0) or 0, model=self.model, kind='prompt')
+        LLM_TOKENS.inc(getattr(usage, 'completion_tokens', 0) or 0, model=self.model, kind='completion')
+    
+    def _retry_after(self, error):
+        """429 응답의 Retry-After 값 (초, 없으면 None)"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        headers = response.headers
+        try:
+            if headers.get('retry-after-ms'):
+                return float(headers['retry-after-ms']) / 1000
+            if headers.get('retry-after'):
+                return float(headers['retry-after'])
+        except ValueError:
+            return None
+        return None
+    
+    def _create_prompt(self, title, content, summary_only=False):
         """
         OpenAI용 프롬프트 생성
         
         Args:
             title (str): 게시물 제목
             content (str): 게시물 내용
+            summary_only (bool): 요약만 요청할지 여부
             
         Returns:
             str: 프롬프트
         """
-        today = datetime.now().strftime('%Y-%m-%d')
+        if summary_only:
+            return f"""다음 게시물을 요약하세요:
+
+제목: {title}
+내용: {content}
+
+다음 형식의 JSON으로 반환하세요:
+{{
+  "summary": "게시물 요약 (한글 100자 이내, 핵심만)"
+}}
+"""
         
         prompt = f"""다음 게시물을 분석하세요:
 
@@ -114,7 +450,19 @@ class AISummarizer:
   "scheduleDate": "YYYY-MM-DD" 또는 null
 }}
 
-일정 감지 규칙:
+{self._schedule_rules()}"""
+        return prompt
+    
+    def _schedule_rules(self):
+        """
+        일정 감지 규칙 (단일/묶음 프롬프트 공통)
+        
+        Returns:
+            str: 규칙과 예시
+        """
+        today = datetime.now().strftime('%Y-%m-%d')
+        
+        return f"""일정 감지 규칙:
 - 콘서트, 팬미팅, 공연, 컴백, 앨범 발매, 방송, 라이브, 이벤트 등
 - 구체적인 날짜가 명시된 경우만 true
 - 오늘 날짜: {today}
@@ -128,6 +476,56 @@ class AISummarizer:
 - "곧 컴백합니다" → hasSchedule: false, scheduleDate: null
 - "12월 25일 크리스마스 앨범 발매" → hasSchedule: true, scheduleDate: "2025-12-25"
 """
+    
+    def _create_pack_prompt(self, entries, summary_only=False):
+        """
+        여러 게시물을 한 번에 분석하는 프롬프트 생성
+        
+        Args:
+            entries (list): {title, content} 항목 리스트
+            summary_only (bool): 요약만 요청할지 여부
+            
+        Returns:
+            str: 프롬프트
+        """
+        posts_text = "\n\n".join(
+            f"[id: {pack_id}]\n제목: {entry['title']}\n내용: {entry['content']}"
+            for pack_id, entry in enumerate(entries)
+        )
+        
+        if summary_only:
+            return f"""다음 {len(entries)}개 게시물을 각각 요약하세요:
+
+{posts_text}
+
+다음 형식의 JSON으로 반환하세요 (게시물마다 하나씩, id는 그대로):
+{{
+  "results": [
+    {{
+      "id": "게시물 id",
+      "summary": "게시물 요약 (한글 100자 이내, 핵심만)"
+    }}
+  ]
+}}
+"""
+        
+        prompt = f"""다음 {len(entries)}개 게시물을 각각 분석하세요:
+
+{posts_text}
+
+다음 형식의 JSON으로 반환하세요 (게시물마다 하나씩, id는 그대로):
+{{
+  "results": [
+    {{
+      "id": "게시물 id",
+      "summary": "게시물 요약 (한글 100자 이내, 핵심만)",
+      "hasSchedule": true 또는 false,
+      "scheduleDate": "YYYY-MM-DD" 또는 null
+    }}
+  ]
+}}
+
+{self._schedule_rules()}"""
         return prompt
     
     def _clean_html(self, text):
@@ -150,27 +548,102 @@ class AISummarizer:
         
         return text.strip()
     
-    def analyze_batch(self, posts_list, show_progress=True):
+    def analyze_batch(self, posts_list, show_progress=True, max_concurrency=None, pack_size=None, evict_cache=True):
         """
         여러 게시물을 배치로 분석
         
+        캐시에 없는 게시물을 pack_size개씩 묶어 요청 하나로 분석하고,
+        묶음 요청은 동시에 여러 개 실행합니다.
+        
         Args:
             posts_list (list): 게시물 리스트
             show_progress (bool): 진행상황 표시 여부
+            max_concurrency (int): 동시에 보낼 최대 요청 수 (1이면 순차 실행)
+            pack_size (int): 요청 하나에 묶을 게시물 수 (1이면 게시물마다 요청)
+            evict_cache (bool): 끝난 뒤 오래된 캐시를 정리할지 여부 (여러 번 나눠 호출할 때는 False)
             
         Returns:
-            list: 분석 결과가 추가된 게시물 리스트
+            list: 분석 결과가 추가된 게시물 리스트 (입력 순서 유지)
         """
-        analyzed_posts = []
         total = len(posts_list)
+        max_concurrency = max_concurrency or self.max_concurrency
+        pack_size = max(1, pack_size or self.pack_size)
         
-        for idx, post in enumerate(posts_list, 1):
-            if show_progress:
-                print(f"\n[{idx}/{total}] 분석 중...")
+        # 1) 로컬 분석 / 캐시 확인
+        analyses = [None] * total
+        entries = []
+        shared = {}  # 같은 내용의 게시물 index → 실제로 분석할 게시물 index
+        pending_keys = {}
+        route_counts = {}
+        
+        def count_route(name):
+            route_counts[name] = route_counts.get(name, 0) + 1
+        for index, post in enumerate(posts_list):
+            try:
+                entry = self._build_entry(post, index)
+            except Exception as e:
+                print(f"❌ AI 분석 실패: {e}")
+                analyses[index] = self._default_result(post)
+                continue
             
-            # AI 분석 실행
-            analysis = self.analyze_post(post)
+            if entry['mode'] == 'local':
+                analyses[index] = self._local_result(entry)
+                count_route(f"local:{entry['route']}")
+                continue
+            
+            cached = self._cached_result(entry)
+            if cached is not None:
+                analyses[index] = cached
+                count_route('cache')
+                continue
             
+            # 여러 사용자가 구독한 같은 게시물은 한 번만 분석
+            primary = pending_keys.get(entry['cache_key'])
+            if primary is not None:
+                shared[index] = primary
+                count_route('shared')
+                continue
+            pending_keys[entry['cache_key']] = index
+            
+            count_route(f"llm:{entry['mode']}")
+            entries.append(entry)
+        
+        # 2) 남은 게시물을 같은 분석 방식끼리 묶어서 분석
+        packs = []
+        for mode in ('full', 'summary'):
+            mode_entries = [entry for entry in entries if entry['mode'] == mode]
+            packs.extend(mode_entries[i:i + pack_size] for i in range(0, len(mode_entries), pack_size))
+        done_count = total - len(entries)
+        progress_lock = threading.Lock()
+        
+        def analyze(pack):
+            nonlocal done_count
+            # AI 분석 실행
+            if len(pack) > 1:
+                results = self._analyze_pack(pack)
+            else:
+                results = {pack[0]['index']: self._analyze_entry(pack[0])}
+            if show_progress:
+                with progress_lock:
+                    done_count += len(pack)
+                    print(f"[{done_count}/{total}] 분석 완료")
+            return results
+        
+        if max_concurrency > 1 and len(packs) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(packs))) as executor:
+                # 워커 스레드의 LLM 호출도 이번 동기화 통계에 들어가도록 계측 범위를 넘김
+                pack_results = list(executor.map(bind_run(analyze), packs))
+        else:
+            pack_results = [analyze(pack) for pack in packs]
+        
+        for results in pack_results:
+            for index, analysis in results.items():
+                analyses[index] = analysis
+        for index, primary in shared.items():
+            analyses[index] = dict(analyses[primary])
+        
+        analyzed_posts = []
+        for post, analysis in zip(posts_list, analyses):
             # 분석 결과를 게시물 데이터에 추가
             post['summary'] = analysis.get('summary', post.get('title', '')[:100])
             post['hasSchedule'] = analysis.get('hasSchedule', False)
@@ -181,8 +654,47 @@ class AISummarizer:
         print(f"\n📊 총 {total}개 게시물 분석 완료")
         print(f"📅 일정 있는 게시물: {sum(1 for p in analyzed_posts if p.get('hasSchedule'))}개")
         
+        # 캐시를 조회한 게시물 = 캐시 적중 + LLM 분석 + 같은 게시물 공유
+        cache_hits = route_counts.get('cache', 0)
+        self._last_stats.cache = {
+            'hits': cache_hits,
+            'misses': sum(count for name, count in route_counts.items()
+                          if name.startswith('llm:') or name == 'shared'),
+        }
+        print(f"💾 분석 캐시: 적중 {self.last_cache_stats['hits']}개 / 미스 {self.last_cache_stats['misses']}개")
+        
+        self._last_stats.routes = route_counts
+        avoided = total - len(entries)
+        print(f"🧭 분석 경로: {', '.join(f'{name} {count}개' for name, count in sorted(route_counts.items()))}")
+        print(f"⚡ LLM 분석 생략: {avoided}개 (요청 {len(packs)}회)")
+        
+        # 오래된 캐시 정리
+        if evict_cache:
+            try:
+                self.cache.evict()
+            except Exception as e:
+                print(f"⚠️  분석 캐시 정리 실패: {e}")
+        
         return analyzed_posts
 
 
-# 싱글톤 인스턴스
-ai_summarizer = AISummarizer()
\ No newline at end of file
+# 싱글톤 인스턴스 (처음 사용할 때 생성)
+_ai_summarizer = None
+_ai_summarizer_lock = threading.Lock()
+
+
+def get_ai_summarizer():
+    """AISummarizer 싱글톤 (처음 호출할 때 OpenAI 클라이언트 생성)"""
+    global _ai_summarizer
+    if _ai_summarizer is None:
+        with _ai_summarizer_lock:
+            if _ai_summarizer is None:
+                _ai_summarizer = AISummarizer()
+    return _ai_summarizer
+
+
+def __getattr__(name):
+    # `from ai_summarizer import ai_summarizer`도 처음 접근할 때 생성
+    if name == 'ai_summarizer':
+        return get_ai_summarizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+AI 분석 결과 캐시 모듈
+같은 내용의 게시물은 OpenAI를 다시 호출하지 않도록 분석 결과를 SQLite에 보관합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from config import config
+
+
+class AnalysisCache:
+    """내용 해시 기반 분석 결과 캐시"""
+    
+    def __init__(self, path=None, max_entries=None, max_age_days=None):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (기본: 캐시 디렉토리/analysis_cache.sqlite3)
+            max_entries (int): 최대 보관 개수 (넘으면 오래 안 쓴 것부터 삭제)
+            max_age_days (int): 보관 기간 (일)
+        """
+        self.path = Path(path or Path(config.CACHE_DIR) / 'analysis_cache.sqlite3')
+        self.max_entries = max_entries or config.ANALYSIS_CACHE_MAX_ENTRIES
+        self.max_age = (max_age_days or config.ANALYSIS_CACHE_MAX_AGE_DAYS) * 86400
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analyses_accessed ON analyses (accessed_at)")
+    
+    def _connect(self):
+        return sqlite3.connect(str(self.path), timeout=30)
+    
+    @staticmethod
+    def make_key(model, prompt_version, title, content):
+        """
+        캐시 키 생성
+        
+        Args:
+            model (str): 모델 이름
+            prompt_version (str): 프롬프트 버전
+            title (str): 게시물 제목
+            content (str): 정리/잘라낸 게시물 내용
+            
+        Returns:
+            str: SHA-256 해시
+        """
+        raw = json.dumps([model, prompt_version, title, content], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """
+        캐시된 분석 결과 조회
+        
+        Args:
+            key (str): 캐시 키
+            
+        Returns:
+            dict: 분석 결과 (없거나 만료됐으면 None)
+        """
+        now = time.time()
+        with self._lock:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT result, created_at FROM analyses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and now - row[1] <= self.max_age:
+                    conn.execute("UPDATE analyses SET accessed_at = ? WHERE key = ?", (now, key))
+                    self.hits += 1
+                    return json.loads(row[0])
+            self.misses += 1
+        return None
+    
+    def set(self, key, result):
+        """
+        분석 결과 저장
+        
+        Args:
+            key (str): 캐시 키
+            result (dict): 분석 결과
+        """
+        now = time.time()
+        with self._lock:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO analyses (key, result, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(result, ensure_ascii=False), now, now)
+                )
+    
+    def evict(self):
+        """
+        만료된 항목과 최대 개수를 넘는 항목 삭제
+        
+        Returns:
+            int: 삭제한 항목 수
+        """
+        now = time.time()
+        with self._lock:
+            with self._connect() as conn:
+                removed = conn.execute(
+                    "DELETE FROM analyses WHERE created_at < ?", (now - self.max_age,)
+                ).rowcount
+                total = conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+                if total > self.max_entries:
+                    removed += conn.execute(
+                        "DELETE FROM analyses WHERE key IN ("
+                        "SELECT key FROM analyses ORDER BY accessed_at ASC LIMIT ?)",
+                        (total - self.max_entries,)
+                    ).rowcount
+        return removed
+    
+    def stats(self):
+        """적중/미스 횟수"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
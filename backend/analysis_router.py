@@ -0,0 +1,70 @@
+"""
+분석 경로 결정 모듈
+설정된 규칙에 따라 게시물을 LLM 없이 처리할지(local) 판단합니다.
+"""
+
+import json
+from config import config
+
+
+# 기본 규칙: 위에서부터 처음 맞는 규칙 적용
+DEFAULT_RULES = [
+    # 설명이 비어 있는 유튜브 영상 (요약할 내용이 제목뿐)
+    {'name': 'empty-youtube', 'platform': 'youtube', 'empty_content': True},
+    # 요약 길이(100자) 이하의 짧은 게시물 (짧은 트윗 등) → 본문이 곧 요약
+    {'name': 'short-post', 'max_length': 100},
+]
+
+
+class AnalysisRouter:
+    """규칙 기반 분석 경로 결정 클래스"""
+    
+    def __init__(self, rules=None):
+        """
+        Args:
+            rules (list): 규칙 리스트 (없으면 ANALYSIS_ROUTING_RULES 설정 또는 기본 규칙)
+                각 규칙은 name과 다음 조건의 조합:
+                - platform (str): 게시물 플랫폼 (blog / youtube / twitter)
+                - max_length (int): HTML 제거 후 본문 길이 상한
+                - empty_content (bool): 본문이 비었거나 제목과 같은지
+        """
+        if rules is None:
+            rules = self._load_rules()
+        self.rules = rules
+    
+    def _load_rules(self):
+        """설정에서 규칙 읽기 (JSON, 잘못됐으면 기본 규칙)"""
+        if not config.ANALYSIS_ROUTING_RULES:
+            return DEFAULT_RULES
+        try:
+            rules = json.loads(config.ANALYSIS_ROUTING_RULES)
+            if not isinstance(rules, list):
+                raise ValueError("규칙은 리스트여야 합니다")
+            return rules
+        except ValueError as e:
+            print(f"⚠️  분석 경로 규칙 설정 오류, 기본 규칙 사용: {e}")
+            return DEFAULT_RULES
+    
+    def match(self, post_data, title, content):
+        """
+        게시물에 맞는 로컬 처리 규칙 찾기
+        
+        Args:
+            post_data (dict): 게시물 데이터 (platform 포함)
+            title (str): 게시물 제목
+            content (str): HTML 제거 후 본문
+            
+        Returns:
+            str: 맞는 규칙 이름 (없으면 None → LLM 분석)
+        """
+        for rule in self.rules:
+            if 'platform' in rule and post_data.get('platform') != rule['platform']:
+                continue
+            if 'max_length' in rule and len(content) > rule['max_length']:
+                continue
+            if 'empty_content' in rule:
+                is_empty = not content.strip() or content.strip() == title.strip()
+                if is_empty != rule['empty_content']:
+                    continue
+            return rule.get('name', 'local')
+        return None
@@ -3,165 +3,107 @@ Flask API 서버
 프론트엔드에서 동기화 요청을 받아 처리합니다.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 from datetime import datetime
+import base64
 import threading
+import re
+import json
 
-# 동기화 모듈 import
+# 동기화 모듈 import (Firebase / OpenAI / 피드 수집기는 처음 쓸 때 초기화)
 from config import config
-from firebase_client import firebase_client
-from rss_fetcher import rss_fetcher
-from ai_summarizer import ai_summarizer
+from firebase_client import get_firebase_client
+from post_cache import PostPage, post_page_cache
+from rss_fetcher import get_rss_fetcher
+from ai_summarizer import get_ai_summarizer
+from sync_pipeline import SyncPipeline, SyncCancelled
+from sync_jobs import SyncJobManager
+from metrics import metrics, SYNC_JOBS
+from poll_scheduler import poll_scheduler
 
 app = Flask(__name__)
 CORS(app)  # CORS 허용 (프론트엔드에서 호출 가능하게)
 
-# 동기화 상태 저장
-sync_status = {
-    'is_running': False,
-    'last_run': None,
-    'last_result': None,
-    'error': None
-}
-
-
-def run_sync():
-    """동기화 실행 (백그라운드)"""
-    global sync_status
+def run_sync(rebuild_index=False, force=False, subscriptions=None, scope=None, cancel_token=None, progress=None):
+    """
+    동기화 실행 (백그라운드)
     
+    Args:
+        rebuild_index (bool): 중복 체크 색인을 Firestore에서 다시 만들지 여부
+        force (bool): 수집 일정과 관계없이 모든 구독 수집
+        subscriptions (list): 동기화할 구독 (없으면 전체 구독)
+        scope (dict): 동기화 범위 {userId, subscriptionIds} (결과 표시용)
+        cancel_token (threading.Event): 설정되면 다음 묶음을 처리하기 전에 중단
+        progress (callable): 파이프라인 진행 이벤트를 받을 함수 progress(event, data)
+    """
     try:
-        sync_status['is_running'] = True
-        sync_status['error'] = None
-        
         print("\n" + "=" * 60)
-        print("🚀 DIY News 동기화 시작 (API)")
+        print(f"🚀 DIY News 동기화 시작 (API{f', 범위: {scope}' if scope else ''})")
         print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
         
         # 1️⃣ 설정 검증
-        print("\n[1/5] 설정 검증 중...")
+        print("\n[1/3] 설정 검증 중...")
         config.validate()
         
         # 2️⃣ Firebase에서 구독 목록 가져오기
-        print("\n[2/5] 구독 목록 가져오는 중...")
-        subscriptions = firebase_client.get_subscriptions()
+        print("\n[2/3] 구독 목록 가져오는 중...")
+        if subscriptions is None:
+            subscriptions = get_firebase_client().get_subscriptions()
         
         if not subscriptions:
             result = {
                 'success': False,
                 'message': '구독 계정이 없습니다.',
+                'scope': scope,
                 'stats': {}
             }
-            sync_status['last_result'] = result
-            sync_status['is_running'] = False
-            return result
-        
-        # 3️⃣ RSS 피드 수집
-        print("\n[3/5] RSS 피드 수집 중...")
-        all_posts = rss_fetcher.fetch_multiple_feeds(subscriptions)
-        
-        posts_to_process = []
-        for sub_id, posts in all_posts.items():
-            posts_to_process.extend(posts)
-        
-        if not posts_to_process:
-            result = {
-                'success': True,
-                'message': '새로운 게시물이 없습니다.',
-                'stats': {
-                    'collected': 0,
-                    'new': 0,
-                    'saved': 0,
-                    'schedules': 0
-                }
-            }
-            sync_status['last_result'] = result
-            sync_status['is_running'] = False
             return result
         
-        print(f"\n📊 총 {len(posts_to_process)}개 게시물 수집됨")
-        
-        # 4️⃣ 중복 체크
-        print("\n[4/5] 중복 게시물 확인 중...")
-        existing_urls = firebase_client.get_existing_post_urls()
-        
-        new_posts = [
-            post for post in posts_to_process 
-            if post.get('url') not in existing_urls
-        ]
-        
-        print(f"🆕 새 게시물: {len(new_posts)}개")
-        
-        if not new_posts:
-            result = {
-                'success': True,
-                'message': '저장할 새 게시물이 없습니다.',
-                'stats': {
-                    'collected': len(posts_to_process),
-                    'new': 0,
-                    'saved': 0,
-                    'schedules': 0
-                }
-            }
-            sync_status['last_result'] = result
-            sync_status['is_running'] = False
-            return result
+        # 3️⃣ 수집 → 중복 체크 → AI 분석 → 저장 (단계별로 동시에 진행)
+        print("\n[3/3] 수집 · 분석 · 저장 파이프라인 실행 중...")
+        pipeline = SyncPipeline(get_rss_fetcher(), get_firebase_client(), get_ai_summarizer(), poll_scheduler)
+        stats = pipeline.run(subscriptions, rebuild_index=rebuild_index, force=force,
+                             cancel_token=cancel_token, progress=progress)
         
-        # 5️⃣ AI 분석
-        print("\n[5/5] AI 분석 중...")
-        analyzed_posts = ai_summarizer.analyze_batch(new_posts, show_progress=False)
-        
-        # 6️⃣ Firebase에 저장
-        print("\n[6/6] Firebase에 저장 중...")
-        
-        for post in analyzed_posts:
-            # publishedAt 형식 변환
-            if 'published' in post:
-                published = post['published']
-                if isinstance(published, datetime):
-                    post['publishedAt'] = published.isoformat()
-                else:
-                    post['publishedAt'] = str(published)
-            
-            # userId 추가
-            for sub in subscriptions:
-                if sub.get('accountId') == post.get('accountId'):
-                    post['userId'] = sub.get('userId')
-                    break
-            
-            # 필요없는 필드 제거
-            post.pop('published', None)
-        
-        saved_count = firebase_client.save_posts_batch(analyzed_posts)
-        
-        # 구독 동기화 시간 업데이트
-        for sub_id in all_posts.keys():
-            firebase_client.update_subscription_sync_time(sub_id)
+        if not stats['collected']:
+            message = '새로운 게시물이 없습니다.'
+        elif not stats['new']:
+            message = '저장할 새 게시물이 없습니다.'
+        else:
+            message = '동기화 완료!'
         
         # 결과 저장
         result = {
             'success': True,
-            'message': '동기화 완료!',
-            'stats': {
-                'collected': len(posts_to_process),
-                'new': len(new_posts),
-                'saved': saved_count,
-                'schedules': sum(1 for p in analyzed_posts if p.get('hasSchedule'))
-            }
+            'message': message,
+            'scope': scope,
+            'stats': stats
         }
         
         print("\n" + "=" * 60)
         print("✅ 동기화 완료!")
+        print(f"⏭️  건너뜀: {result['stats']['skipped']}개 (수집 일정 전)")
         print(f"📥 수집: {result['stats']['collected']}개")
         print(f"🆕 새 게시물: {result['stats']['new']}개")
         print(f"💾 저장: {result['stats']['saved']}개")
         print(f"📅 일정 감지: {result['stats']['schedules']}개")
+        print(f"♻️  피드 캐시: 적중 {result['stats']['feedCacheHits']}개 / 미스 {result['stats']['feedCacheMisses']}개")
+        print(f"🔗 고유 피드: {result['stats']['uniqueFeeds']}개")
+        print(f"🔌 HTTP: 요청 {result['stats']['httpRequests']}회 / 새 연결 {result['stats']['httpConnections']}개")
         print(f"⏰ 종료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
-        
-        sync_status['last_result'] = result
-        sync_status['last_run'] = datetime.now().isoformat()
+    
+    except SyncCancelled as e:
+        print(f"\n🛑 동기화 취소됨: {e}")
+        result = {
+            'success': False,
+            'cancelled': True,
+            'message': '동기화가 취소되었습니다.',
+            'scope': scope,
+            'stats': {}
+        }
         
     except Exception as e:
         print(f"\n\n❌ 오류 발생: {e}")
@@ -171,49 +113,399 @@ def run_sync():
         result = {
             'success': False,
             'message': f'오류 발생: {str(e)}',
+            'error': str(e),
+            'scope': scope,
             'stats': {}
         }
-        sync_status['last_result'] = result
-        sync_status['error'] = str(e)
-    
-    finally:
-        sync_status['is_running'] = False
     
     return result
 
 
+def run_job(job):
+    """작업 큐 워커가 호출하는 실행 함수"""
+    return run_sync(
+        rebuild_index=job.rebuild_index,
+        force=job.force,
+        subscriptions=job.subscriptions,
+        scope=job.scope,
+        cancel_token=job.cancel_token,
+        progress=job.publish,
+    )
+
+
+def current_status(user_id=None):
+    """
+    동기화 상태 (마지막 결과 + 지금 작업 큐 상태)
+
+    작업이 여러 개 동시에 끝나도 어긋나지 않도록 요청할 때마다 job_manager에서 새로 읽습니다.
+    마지막 결과는 같은 범위(이 사용자 / 전체 동기화)의 가장 최근에 끝난 작업에서 가져옵니다.
+
+    Args:
+        user_id (str): 이 사용자의 동기화 결과 (None이면 전체 동기화 결과)
+
+    Returns:
+        dict: {is_running, running, queued, last_run, last_result, error}
+    """
+    snapshot = job_manager.snapshot()
+    last_job = job_manager.last_finished(user_id)
+    return {
+        'is_running': bool(snapshot['running']),
+        'running': [
+            {'id': job['id'], 'scope': job['scope'], 'subscriptions': job['subscriptions']}
+            for job in snapshot['running']
+        ],
+        'queued': len(snapshot['queued']),
+        'last_run': last_job.finished_at if last_job else None,
+        'last_result': last_job.result if last_job else None,
+        'error': last_job.error if last_job else None
+    }
+
+
+# 동기화 작업 큐 (같은 요청은 합치고, 구독이 겹치지 않는 작업만 동시에 실행)
+job_manager = SyncJobManager(run_job)
+
+
 @app.route('/api/sync', methods=['POST'])
 def sync():
-    """동기화 API 엔드포인트"""
+    """
+    동기화 API 엔드포인트
+    
+    요청 본문 (모두 선택):
+        userId: 이 사용자의 구독만 동기화
+        subscriptionIds: 이 구독들만 동기화 (userId와 함께 주면 둘 다 만족하는 구독)
+        force: true면 수집 일정과 관계없이 수집
+            (기본: 범위를 지정한 요청은 사용자가 직접 누른 동기화라서 true, 전체 동기화는 false)
+    
+    범위를 주지 않으면 전체 구독을 동기화합니다.
+    요청은 작업 큐에 들어가고, 같은 구독을 대상으로 대기 중인 작업이 있으면 그 작업에 합쳐집니다.
+    진행 상황은 응답의 jobId로 /api/jobs/<jobId>에서 확인합니다.
+    """
+    body = request.get_json(silent=True) or {}
+    user_id = body.get('userId')
+    subscription_ids = body.get('subscriptionIds')
+    force = bool(body.get('force', bool(user_id or subscription_ids)))
     
-    # 이미 실행 중이면 거부
-    if sync_status['is_running']:
+    if user_id is not None and not isinstance(user_id, str):
+        return jsonify({'success': False, 'message': 'userId는 문자열이어야 합니다.'}), 400
+    if subscription_ids is not None and (
+        not isinstance(subscription_ids, list) or not all(isinstance(i, str) for i in subscription_ids)
+    ):
+        return jsonify({'success': False, 'message': 'subscriptionIds는 문자열 배열이어야 합니다.'}), 400
+    
+    # 동기화 범위의 구독 목록
+    scope = {'userId': user_id, 'subscriptionIds': subscription_ids} if (user_id or subscription_ids) else None
+    if subscription_ids:
+        subscriptions = get_firebase_client().get_subscriptions_by_ids(subscription_ids)
+        if user_id:
+            subscriptions = [sub for sub in subscriptions if sub.get('userId') == user_id]
+    else:
+        subscriptions = get_firebase_client().get_subscriptions(user_id)
+    
+    if not subscriptions:
         return jsonify({
             'success': False,
-            'message': '이미 동기화가 진행 중입니다.',
-            'status': sync_status
-        }), 409
+            'message': '구독 계정이 없습니다.',
+            'scope': scope
+        }), 404
+    
+    # 작업 큐에 등록
+    job_manager.start()
+    job, merged = job_manager.submit(subscriptions, scope=scope, force=force)
+    
+    return jsonify({
+        'success': True,
+        'message': '대기 중인 동기화에 합쳤습니다.' if merged else '동기화를 예약했습니다.',
+        'jobId': job.id,
+        'merged': merged,
+        'job': job.to_dict(),
+        'status': current_status(user_id)
+    }), 202
+
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    """실행 중 / 대기 중인 동기화 작업 목록"""
+    return jsonify({
+        'success': True,
+        **job_manager.snapshot()
+    })
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """동기화 작업 상태 확인"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
+    
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """
+    동기화 진행 상황 스트림 (Server-Sent Events)
+    
+    작업이 끝날 때까지 연결을 유지하면서 이벤트를 보냅니다.
+        status: 작업 상태 변경 (queued / running)
+        start: 수집할 구독 수와 건너뛴 구독 수
+        stage: 단계(fetch / dedup / analyze / save) 시작·종료
+        progress: 처리한 피드 수와 누적 collected / new / saved / schedules
+        done: 최종 상태와 결과 (이후 연결 종료)
+    
+    다시 연결할 때 Last-Event-ID 헤더를 보내면 그 다음 이벤트부터 이어서 받습니다.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
+    
+    try:
+        cursor = int(request.headers.get('Last-Event-ID', -1)) + 1
+    except ValueError:
+        cursor = 0
+    
+    def stream():
+        nonlocal cursor
+        closed = False
+        while not closed:
+            events, closed = job.wait_events(cursor, timeout=config.SSE_KEEPALIVE_SECONDS)
+            if not events:
+                # 프록시가 연결을 끊지 않도록 주석 줄 전송
+                yield ': keep-alive\n\n'
+                continue
+            for event in events:
+                data = json.dumps(event['data'], ensure_ascii=False, default=str)
+                yield f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+            cursor = events[-1]['id'] + 1
+    
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """
+    동기화 작업 취소
     
-    # 백그라운드 스레드로 실행
-    thread = threading.Thread(target=run_sync)
-    thread.start()
+    대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 묶음을 처리하기 전에 멈춥니다.
+    """
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': '작업을 찾을 수 없습니다.'}), 404
     
     return jsonify({
         'success': True,
-        'message': '동기화를 시작했습니다.',
-        'status': sync_status
+        'message': '취소를 요청했습니다.',
+        'job': job.to_dict()
     }), 202
 
 
+# /api/posts에서 허용하는 플랫폼 필터
+POST_PLATFORMS = ('blog', 'youtube', 'twitter')
+
+
+def authenticated_user_id():
+    """
+    요청한 사용자 ID (Authorization: Bearer <Firebase ID 토큰>)
+    
+    클라이언트가 보낸 userId는 믿지 않고, 검증한 토큰의 uid만 사용합니다.
+    
+    Returns:
+        str: 사용자 ID (토큰이 없거나 잘못됐으면 None)
+    """
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not token.strip():
+        return None
+    return get_firebase_client().verify_id_token(token.strip())
+
+
+def unauthorized():
+    """401 응답 (로그인 필요)"""
+    return jsonify({'success': False, 'message': '로그인이 필요합니다.'}), 401
+
+
+def encode_cursor(cursor):
+    """(createdAt, 문서 ID) → URL에 넣을 수 있는 커서 문자열"""
+    if cursor is None:
+        return None
+    raw = json.dumps(list(cursor), ensure_ascii=False, default=str).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(value):
+    """커서 문자열 → (createdAt, 문서 ID) (형식이 틀리면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+        created_at, post_id = json.loads(raw)
+    except Exception:
+        raise ValueError('cursor 형식이 올바르지 않습니다.')
+    if not isinstance(post_id, str):
+        raise ValueError('cursor 형식이 올바르지 않습니다.')
+    return created_at, post_id
+
+
+@app.route('/api/posts', methods=['GET'])
+def posts():
+    """
+    게시물 목록 (최신순, 커서 페이지네이션)
+    
+    헤더:
+        Authorization: Bearer <Firebase ID 토큰> (필수, 토큰의 사용자 게시물만 조회)
+    
+    쿼리 파라미터:
+        platform: blog / youtube / twitter (선택)
+        limit: 페이지 크기 (기본 POSTS_PAGE_SIZE, 최대 POSTS_MAX_PAGE_SIZE)
+        cursor: 이전 응답의 nextCursor (선택)
+    
+    같은 페이지는 메모리 캐시에서 바로 응답하고, 게시물이 저장되면 캐시를 비웁니다.
+    If-None-Match가 ETag와 같으면 304, Accept-Encoding에 gzip이 있으면 압축해서 응답합니다.
+    """
+    user_id = authenticated_user_id()
+    platform = request.args.get('platform') or None
+    cursor = request.args.get('cursor') or None
+    
+    if not user_id:
+        return unauthorized()
+    if platform is not None and platform not in POST_PLATFORMS:
+        return jsonify({'success': False, 'message': f'platform은 {", ".join(POST_PLATFORMS)} 중 하나여야 합니다.'}), 400
+    try:
+        limit = int(request.args.get('limit', config.POSTS_PAGE_SIZE))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit은 정수여야 합니다.'}), 400
+    try:
+        page_cursor = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    limit = min(max(limit, 1), config.POSTS_MAX_PAGE_SIZE)
+    
+    def load_page():
+        page_posts, next_cursor = get_firebase_client().get_posts(user_id, platform, limit, page_cursor)
+        return {
+            'success': True,
+            'posts': page_posts,
+            'nextCursor': encode_cursor(next_cursor)
+        }
+    
+    try:
+        page, cached = post_page_cache.get_or_load(user_id, platform, cursor, limit, load_page)
+    except Exception as e:
+        print(f"❌ 게시물 조회 실패: {e}")
+        return jsonify({'success': False, 'message': f'게시물 조회 실패: {str(e)}'}), 500
+    
+    return page_response(page, {'X-Cache': 'HIT' if cached else 'MISS'})
+
+
+def page_response(page, headers=None):
+    """
+    직렬화된 응답 페이지 전송 (If-None-Match가 같으면 304, 가능하면 gzip)
+    
+    Args:
+        page (PostPage): 응답 본문과 ETag
+        headers (dict): 추가 응답 헤더
+    """
+    headers = {
+        'ETag': f'"{page.etag}"',
+        'Cache-Control': 'private, no-cache',  # 매번 ETag로 다시 확인
+        'Vary': 'Accept-Encoding, Authorization',
+        **(headers or {})
+    }
+    if request.if_none_match.contains(page.etag):
+        return Response(status=304, headers=headers)
+    
+    body = page.body
+    if 'gzip' in request.accept_encodings and len(body) > 1024:
+        body = page.gzipped
+        headers['Content-Encoding'] = 'gzip'
+    return Response(body, mimetype='application/json', headers=headers)
+
+
+@app.route('/api/schedules', methods=['GET'])
+def schedules():
+    """
+    한 달치 일정 (캘린더용)
+    
+    헤더:
+        Authorization: Bearer <Firebase ID 토큰> (필수)
+    
+    쿼리 파라미터:
+        month: YYYY-MM (기본: 이번 달)
+    
+    사용자·월별 일정 색인 문서 하나만 읽으므로, 게시물이 많아도 비용이 같습니다.
+    """
+    user_id = authenticated_user_id()
+    month = request.args.get('month') or datetime.now().strftime('%Y-%m')
+    
+    if not user_id:
+        return unauthorized()
+    if not re.fullmatch(r'\d{4}-(0[1-9]|1[0-2])', month):
+        return jsonify({'success': False, 'message': 'month는 YYYY-MM 형식이어야 합니다.'}), 400
+    
+    try:
+        items = get_firebase_client().get_schedules(user_id, month)
+    except Exception as e:
+        print(f"❌ 일정 조회 실패: {e}")
+        return jsonify({'success': False, 'message': f'일정 조회 실패: {str(e)}'}), 500
+    
+    return page_response(PostPage({
+        'success': True,
+        'month': month,
+        'schedules': items
+    }))
+
+
+@app.route('/api/posts/invalidate', methods=['POST'])
+def invalidate_posts():
+    """
+    게시물 조회 캐시 비우기 (프론트엔드에서 게시물을 직접 삭제한 뒤 호출)
+    
+    헤더:
+        Authorization: Bearer <Firebase ID 토큰> (필수, 토큰의 사용자 캐시만 비움)
+    
+    요청 본문:
+        deletedPosts: [{id, scheduleDate}] 삭제한 게시물 (선택, 일정 색인에서도 제거)
+    """
+    user_id = authenticated_user_id()
+    if not user_id:
+        return unauthorized()
+    
+    body = request.get_json(silent=True) or {}
+    deleted_posts = body.get('deletedPosts') or []
+    if not isinstance(deleted_posts, list) or not all(isinstance(post, dict) for post in deleted_posts):
+        return jsonify({'success': False, 'message': 'deletedPosts는 객체 배열이어야 합니다.'}), 400
+    
+    post_page_cache.invalidate([user_id])
+    removed = get_firebase_client().remove_from_schedule_index(user_id, deleted_posts) if deleted_posts else 0
+    return jsonify({'success': True, 'removedSchedules': removed})
+
+
 @app.route('/api/status', methods=['GET'])
 def status():
-    """동기화 상태 확인"""
+    """
+    동기화 상태 확인
+    
+    쿼리 파라미터:
+        userId: 이 사용자의 마지막 동기화 결과 (없으면 전체 동기화 결과)
+    """
     return jsonify({
         'success': True,
-        'status': sync_status
+        'status': current_status(request.args.get('userId') or None)
     })
 
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics_endpoint():
+    """피드 / 단계 / LLM / Firestore 계측값 (Prometheus 텍스트 형식)"""
+    queue_status = job_manager.snapshot()
+    SYNC_JOBS.set(len(queue_status['running']), state='running')
+    SYNC_JOBS.set(len(queue_status['queued']), state='queued')
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """서버 상태 확인"""
@@ -224,15 +516,39 @@ def health():
     })
 
 
+def warm_up():
+    """
+    Firebase / 피드 수집기 / OpenAI 클라이언트 미리 초기화 (백그라운드)
+    
+    서버는 바로 요청을 받고, 첫 동기화 요청은 초기화를 기다리지 않게 합니다.
+    """
+    for name, provider in (('Firebase', get_firebase_client), ('피드 수집기', get_rss_fetcher),
+                           ('OpenAI', get_ai_summarizer)):
+        try:
+            provider()
+        except Exception as e:
+            print(f"⚠️  {name} 초기화 실패 (요청할 때 다시 시도): {e}")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("🚀 Flask API 서버 시작")
     print("📡 주소: http://localhost:5000")
     print("=" * 60)
     print("\n사용 가능한 엔드포인트:")
-    print("  POST   /api/sync     - 동기화 시작")
+    print("  POST   /api/sync     - 동기화 예약 (userId / subscriptionIds로 범위 지정)")
+    print("  GET    /api/jobs     - 실행 중 / 대기 중인 작업 목록")
+    print("  GET    /api/jobs/<id> - 작업 상태 확인")
+    print("  GET    /api/jobs/<id>/events - 작업 진행 상황 스트림 (SSE)")
+    print("  POST   /api/jobs/<id>/cancel - 작업 취소")
+    print("  GET    /api/posts    - 게시물 목록 (로그인 토큰 / platform / cursor)")
+    print("  POST   /api/posts/invalidate - 게시물 조회 캐시 비우기")
+    print("  GET    /api/schedules - 한 달치 일정 (로그인 토큰 / month=YYYY-MM)")
     print("  GET    /api/status   - 동기화 상태 확인")
+    print("  GET    /api/metrics  - 계측값 (Prometheus 형식)")
     print("  GET    /api/health   - 서버 상태 확인")
     print("\n종료하려면 Ctrl+C를 누르세요.\n")
     
+    threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+    
     app.run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""
+피드 날짜 파싱 마이크로 벤치마크
+자주 보는 날짜 형식마다 기존 방식(dateutil)과 fetchers.feed_dates의 속도를 비교하고,
+두 방식의 결과(UTC 기준)가 같은지도 확인합니다.
+
+사용법:
+    python benchmarks/date_parsing_benchmark.py
+    python benchmarks/date_parsing_benchmark.py --number 50000
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import feedparser  # noqa: E402
+from dateutil import parser as date_parser  # noqa: E402
+from fetchers.feed_dates import entry_date, parse_date  # noqa: E402
+
+
+# (형식 이름, 날짜 문자열)
+SAMPLES = (
+    ('RSS (RFC 822, +0900)', 'Tue, 14 Oct 2025 19:30:00 +0900'),
+    ('RSS (RFC 822, GMT)', 'Tue, 14 Oct 2025 10:30:00 GMT'),
+    ('Atom (ISO 8601, Z)', '2025-10-14T10:30:00Z'),
+    ('Atom (ISO 8601, +09:00, 소수 초)', '2025-10-14T19:30:00.123+09:00'),
+    ('YouTube (ISO 8601, +00:00)', '2025-10-14T10:30:00+00:00'),
+    ('Twitter API', 'Tue Oct 14 10:30:00 +0000 2025'),
+)
+
+
+def dateutil_utc(text):
+    """기존 방식: dateutil로 파싱 (비교용으로 UTC 변환)"""
+    value = date_parser.parse(text)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def feed_entry(text):
+    """날짜 하나만 가진 RSS 엔트리 (feedparser가 published_parsed를 채움)"""
+    feed = feedparser.parse(
+        f'<rss version="2.0"><channel><item><title>t</title><pubDate>{text}</pubDate></item></channel></rss>'
+    )
+    return feed.entries[0]
+
+
+def measure(function, number):
+    """한 번 호출 평균 시간 (마이크로초, 5회 중 최솟값)"""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="피드 날짜 파싱 마이크로 벤치마크")
+    parser.add_argument('--number', type=int, default=20000, help="측정마다 반복할 호출 수")
+    args = parser.parse_args()
+
+    print(f"⏱️  날짜 파싱 1회 평균 (µs, {args.number:,}회 x 5)\n")
+    print(f"  {'형식':<34} {'dateutil':>9} {'문자열':>9} {'*_parsed':>9} {'배속':>7}  결과")
+    mismatches = 0
+    for name, text in SAMPLES:
+        entry = feed_entry(text)
+        expected = dateutil_utc(text)
+        same = parse_date(text) == expected and entry_date(entry) == expected.replace(microsecond=0)
+        mismatches += not same
+
+        old = measure(lambda: date_parser.parse(text), args.number)
+        new = measure(lambda: parse_date(text), args.number)
+        parsed = measure(lambda: entry_date(entry), args.number)
+        print(f"  {name:<34} {old:>9.2f} {new:>9.2f} {parsed:>9.2f} {old / min(new, parsed):>6.1f}x  "
+              f"{'✅' if same else '❌'}")
+
+    print("\n  문자열: parse_date(), *_parsed: entry_date() (feedparser가 파싱해 둔 값 사용)")
+    if mismatches:
+        print(f"\n❌ dateutil과 결과가 다른 형식 {mismatches}개")
+        sys.exit(1)
+    print("\n✅ 모든 형식에서 dateutil과 같은 UTC 시각")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,422 @@
+"""
+동기화 벤치마크용 로컬 대역
+실제 서비스 대신 쓰는 가짜 피드 서버 / 가짜 OpenAI 서버 / 메모리 Firestore입니다.
+네트워크나 API 키 없이 sync 파이프라인 전체를 실행할 수 있습니다.
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.sax.saxutils import escape
+
+from bulk_writer import BulkWriter
+from fetchers.http_transport import HttpTransport
+from post_ids import post_doc_id
+
+
+# 생성하는 게시물 제목 (일부는 날짜가 있어서 일정 추출 경로도 거침)
+TITLES = (
+    "신곡 뮤직비디오 공개",
+    "{month}월 {day}일 콘서트 티켓 오픈 안내",
+    "오늘의 비하인드 사진",
+    "{month}/{day} 팬미팅 일정 공지",
+    "라이브 방송 다시보기",
+    "새 앨범 발매 기념 이벤트 ({month}월 {day}일까지)",
+)
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 동시 요청이 많아도 연결이 거부되지 않도록
+    request_queue_size = 256
+
+
+class _StandInServer:
+    """백그라운드 스레드에서 도는 로컬 HTTP 서버 공통 부분"""
+
+    def __init__(self, handler_class):
+        self._server = _QuietServer(('127.0.0.1', 0), handler_class)
+        self._server.stand_in = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+# ---- 피드 서버 ----
+
+class FakeFeedServer(_StandInServer):
+    """
+    가짜 피드 서버
+
+    RewritingTransport가 https://{host}/{path}를 {url}/{host}/{path}로 바꿔서 보냅니다.
+    호스트에 따라 RSS(블로그) / Atom(velog) / YouTube Atom / twitterapi.io JSON을 만들고,
+    ETag로 조건부 요청(304)도 처리합니다.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.5, entries=5):
+        """
+        Args:
+            latency (float): 응답 지연 (초)
+            jitter (float): 지연 변동 비율 (0.5면 ±50%)
+            entries (int): 피드 하나에 담을 게시물 수
+        """
+        super().__init__(_FeedHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.entries = entries
+
+    def delay(self):
+        """지연 시간 한 번 뽑기"""
+        if not self.latency:
+            return 0.0
+        return max(0.0, self.latency * (1 + random.uniform(-self.jitter, self.jitter)))
+
+    def items(self, feed_key):
+        """
+        피드 하나의 게시물 (같은 피드는 항상 같은 내용)
+
+        Returns:
+            list: [{id, title, content, link, published}]
+        """
+        seed = int(hashlib.md5(feed_key.encode('utf-8')).hexdigest()[:8], 16)
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        upcoming = now + timedelta(days=10 + seed % 20)
+        items = []
+        for index in range(self.entries):
+            title = TITLES[(seed + index) % len(TITLES)].format(month=upcoming.month, day=upcoming.day)
+            item_id = f'{seed:08x}{index:02d}'
+            items.append({
+                'id': item_id,
+                'title': title,
+                'content': f"<p>{title}</p><p>{'자세한 내용은 본문을 확인하세요. ' * (3 + seed % 5)}</p>",
+                'link': f'https://example.com/{feed_key}/{item_id}',
+                'published': now - timedelta(hours=6 * index + seed % 6),
+            })
+        return items
+
+
+class _FeedHandler(_Handler):
+
+    def do_GET(self):
+        server = self.server.stand_in
+        server.count_request()
+        time.sleep(server.delay())
+
+        host, _, path = self.path.lstrip('/').partition('/')
+        if host == 'api.twitterapi.io':
+            query = parse_qs(urlsplit(self.path).query)
+            user = query.get('userName', ['unknown'])[0]
+            body = self._tweets(server.items(f'twitter/{user}'))
+            self.send_body(200, body, 'application/json')
+            return
+
+        feed_key = f'{host}/{path}'
+        items = server.items(feed_key)
+        if host == 'www.youtube.com':
+            body, content_type = self._youtube(items), 'application/atom+xml; charset=utf-8'
+        elif host.endswith('velog.io'):
+            body, content_type = self._atom(items), 'application/atom+xml; charset=utf-8'
+        else:
+            body, content_type = self._rss(items), 'application/rss+xml; charset=utf-8'
+
+        etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_body(304, b'', content_type, {'ETag': etag})
+            return
+        self.send_body(200, body, content_type, {'ETag': etag})
+
+    def _rss(self, items):
+        entries = ''.join(
+            f"<item><title>{escape(item['title'])}</title><link>{item['link']}</link>"
+            f"<guid>{item['link']}</guid><pubDate>{format_datetime(item['published'])}</pubDate>"
+            f"<description>{escape(item['content'])}</description></item>"
+            for item in items
+        )
+        return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+                f'<title>bench</title><link>https://example.com</link>{entries}</channel></rss>').encode('utf-8')
+
+    def _atom(self, items):
+        entries = ''.join(
+            f"<entry><title>{escape(item['title'])}</title><link href=\"{item['link']}\"/>"
+            f"<id>{item['link']}</id><published>{item['published'].isoformat()}</published>"
+            f"<content type=\"html\">{escape(item['content'])}</content></entry>"
+            for item in items
+        )
+        return (f'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+                f'<title>bench</title>{entries}</feed>').encode('utf-8')
+
+    def _youtube(self, items):
+        entries = ''.join(
+            f"<entry><id>yt:video:{item['id']}</id><yt:videoId>{item['id']}</yt:videoId>"
+            f"<title>{escape(item['title'])}</title>"
+            f"<link rel=\"alternate\" href=\"https://www.youtube.com/watch?v={item['id']}\"/>"
+            f"<published>{item['published'].isoformat()}</published>"
+            f"<media:group><media:description>{escape(item['title'])}</media:description></media:group></entry>"
+            for item in items
+        )
+        return ('<?xml version="1.0" encoding="UTF-8"?><feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+                'xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">'
+                f'<title>bench</title>{entries}</feed>').encode('utf-8')
+
+    def _tweets(self, items):
+        tweets = [{
+            'id': item['id'],
+            'text': item['title'],
+            'createdAt': item['published'].strftime('%a %b %d %H:%M:%S %z %Y'),
+        } for item in items]
+        return json.dumps({'status': 'success', 'data': {'tweets': tweets}}).encode('utf-8')
+
+
+class RewritingTransport(HttpTransport):
+    """
+    모든 요청을 가짜 피드 서버로 보내는 HttpTransport
+
+    연결 풀은 원래 호스트별로 나누므로 연결 재사용 통계는 실제와 같은 기준입니다.
+    """
+
+    def __init__(self, base_url, **kwargs):
+        """
+        Args:
+            base_url (str): 가짜 피드 서버 주소
+        """
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def get(self, url, headers=None, params=None):
+        parts = urlsplit(url)
+        local_url = f'{self.base_url}/{parts.netloc}{parts.path}'
+        if parts.query:
+            local_url += f'?{parts.query}'
+        return self._session_for(url).get(local_url, headers=headers, params=params, timeout=self.timeout)
+
+
+# ---- OpenAI 서버 ----
+
+class FakeOpenAIServer(_StandInServer):
+    """
+    가짜 OpenAI 서버 (POST /v1/chat/completions)
+
+    묶음 프롬프트의 [id: N]마다 결과를 하나씩 만들고,
+    rate_limit_ratio 비율로 429(retry-after-ms 포함)를 돌려줍니다.
+    """
+
+    def __init__(self, latency=0.3, jitter=0.5, rate_limit_ratio=0.0, retry_after=0.05):
+        """
+        Args:
+            latency (float): 응답 지연 (초)
+            jitter (float): 지연 변동 비율
+            rate_limit_ratio (float): 429로 거절할 요청 비율 (0~1)
+            retry_after (float): 429 응답의 retry-after (초)
+        """
+        super().__init__(_OpenAIHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.rate_limited = 0
+
+    @property
+    def base_url(self):
+        """AISummarizer에 넘길 API 주소 (config.OPENAI_BASE_URL)"""
+        return f'{self.url}/v1'
+
+    def delay(self):
+        return max(0.0, self.latency * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+class _OpenAIHandler(_Handler):
+
+    def do_POST(self):
+        server = self.server.stand_in
+        server.count_request()
+        request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+
+        if random.random() < server.rate_limit_ratio:
+            with server._lock:
+                server.rate_limited += 1
+            body = json.dumps({'error': {'message': 'Rate limit reached', 'type': 'requests',
+                                         'code': 'rate_limit_exceeded'}}).encode('utf-8')
+            self.send_body(429, body, 'application/json',
+                           {'retry-after-ms': str(int(server.retry_after * 1000))})
+            return
+
+        time.sleep(server.delay())
+        prompt = request['messages'][-1]['content']
+        content = json.dumps(self._answer(prompt), ensure_ascii=False)
+        prompt_tokens = sum(len(message['content']) for message in request['messages'])
+        body = json.dumps({
+            'id': f'chatcmpl-bench{server.requests}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'gpt-4o-mini'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': len(content),
+                'total_tokens': prompt_tokens + len(content),
+            },
+        }, ensure_ascii=False).encode('utf-8')
+        self.send_body(200, body, 'application/json')
+
+    def _answer(self, prompt):
+        """프롬프트 형식(단일 / 묶음, 요약만 / 일정 포함)에 맞는 응답"""
+        summary_only = '"hasSchedule"' not in prompt
+
+        def result(title):
+            answer = {'summary': title[:100] or '요약'}
+            if not summary_only:
+                answer['hasSchedule'] = False
+                answer['scheduleDate'] = None
+            return answer
+
+        pack = re.findall(r'\[id: (\d+)\]\n제목: (.*)', prompt)
+        if pack:
+            return {'results': [{'id': pack_id, **result(title)} for pack_id, title in pack]}
+        match = re.search(r'제목: (.*)', prompt)
+        return result(match.group(1) if match else '')
+
+
+# ---- 메모리 Firestore ----
+
+class _MemoryRef:
+    """문서 / 컬렉션 참조 (BulkWriter가 쓰는 id, parent만)"""
+
+    def __init__(self, doc_id, parent=None):
+        self.id = doc_id
+        self.parent = parent
+
+
+class _MemoryBatch:
+
+    def __init__(self, db):
+        self.db = db
+        self.writes = []
+
+    def create(self, doc_ref, data):
+        self.writes.append(('create', doc_ref, data))
+
+    def set(self, doc_ref, data, merge=False):
+        self.writes.append(('set', doc_ref, data))
+
+    def update(self, doc_ref, data):
+        self.writes.append(('update', doc_ref, data))
+
+    def commit(self):
+        time.sleep(self.db.commit_latency)
+        with self.db.lock:
+            # 실제 Firestore처럼 배치 전체가 성공하거나 실패
+            for kind, doc_ref, _ in self.writes:
+                key = (doc_ref.parent.id, doc_ref.id)
+                if kind == 'create' and key in self.db.documents:
+                    raise ValueError(f'이미 존재하는 문서: {doc_ref.id}')
+            for kind, doc_ref, data in self.writes:
+                key = (doc_ref.parent.id, doc_ref.id)
+                if kind == 'create' or key not in self.db.documents:
+                    self.db.documents[key] = dict(data)
+                else:
+                    self.db.documents[key].update(data)
+
+
+class _MemoryDB:
+
+    def __init__(self, commit_latency):
+        self.commit_latency = commit_latency
+        self.documents = {}
+        self.lock = threading.Lock()
+
+    def batch(self):
+        return _MemoryBatch(self)
+
+
+class MemoryFirebaseClient:
+    """
+    FirebaseClient 대역 (SyncPipeline이 쓰는 메서드만)
+
+    쓰기는 실제 BulkWriter로 배치 커밋하므로 묶음 크기 / 병렬 커밋 / 계측도 그대로 거칩니다.
+    """
+
+    def __init__(self, read_latency=0.02, commit_latency=0.05):
+        """
+        Args:
+            read_latency (float): 중복 확인 조회 1회 지연 (초)
+            commit_latency (float): 배치 커밋 1회 지연 (초)
+        """
+        self.read_latency = read_latency
+        self.db = _MemoryDB(commit_latency)
+        self.subscription_states = {}
+        self._posts = _MemoryRef('posts')
+        self._subscriptions = _MemoryRef('subscriptions')
+
+    def filter_new_posts(self, posts, rebuild_index=False):
+        """이미 저장된 게시물 제외 (Firestore 문서 ID 조회 1회로 계산)"""
+        time.sleep(self.read_latency)
+        candidates = {}
+        for post in posts:
+            candidates.setdefault(post_doc_id(post.get('url'), post.get('userId')), post)
+        with self.db.lock:
+            return [post for post_id, post in candidates.items()
+                    if ('posts', post_id) not in self.db.documents]
+
+    def save_posts_batch(self, posts_list):
+        """게시물 배치 저장 (저장된 개수 반환)"""
+        writer = BulkWriter(self.db)
+        for post in posts_list:
+            post_id = post_doc_id(post.get('url'), post.get('userId'))
+            writer.create(_MemoryRef(post_id, self._posts), post)
+        return sum(writer.commit())
+
+    def update_subscription_states(self, states):
+        """구독별 수집 상태 기록"""
+        writer = BulkWriter(self.db)
+        for subscription_id, state in states.items():
+            writer.set(_MemoryRef(subscription_id, self._subscriptions), state, merge=True)
+        writer.commit()
+        self.subscription_states.update(states)
+
+    def post_count(self):
+        with self.db.lock:
+            return sum(1 for collection, _ in self.db.documents if collection == 'posts')
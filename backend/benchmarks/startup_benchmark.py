@@ -0,0 +1,112 @@
+"""
+API 서버 시작 시간 벤치마크
+프로세스를 새로 띄워서 /api/health, /api/status가 처음 응답하기까지 걸리는 시간을 잽니다.
+
+사용법:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --runs 10 --path /api/status
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# import api만으로 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = ('firebase_admin', 'google.cloud.firestore', 'openai', 'feedparser', 'requests')
+
+# 서버 프로세스: import 시간을 출력한 뒤 Flask 서버 실행
+SERVER_SCRIPT = """
+import sys, time, json
+started = time.perf_counter()
+import api
+imported = time.perf_counter()
+print(json.dumps({
+    'importMs': round((imported - started) * 1000, 1),
+    'heavyModules': [m for m in %r if m in sys.modules],
+}), flush=True)
+api.app.run(host='127.0.0.1', port=int(sys.argv[1]), debug=False)
+"""
+
+
+def free_port():
+    """비어 있는 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_once(path, timeout):
+    """
+    서버 프로세스를 한 번 띄워서 첫 응답까지 시간 측정
+
+    Returns:
+        dict: {firstResponseMs, importMs, heavyModules}
+    """
+    port = free_port()
+    env = {**os.environ, 'PYTHONUNBUFFERED': '1'}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-c', SERVER_SCRIPT % (HEAVY_MODULES,), str(port)],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    try:
+        url = f'http://127.0.0.1:{port}{path}'
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f'서버 프로세스가 종료됨 (코드 {process.returncode})')
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        first_response = time.perf_counter() - started
+                        break
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.005)
+        else:
+            raise TimeoutError(f'{timeout}초 안에 {path} 응답 없음')
+
+        # import 중에 출력된 로그는 건너뛰고 측정값 줄만 읽음
+        for line in process.stdout:
+            if line.startswith('{"importMs"'):
+                info = json.loads(line)
+                break
+        return {'firstResponseMs': round(first_response * 1000, 1), **info}
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 서버 시작 시간 벤치마크")
+    parser.add_argument('--runs', type=int, default=5, help="반복 횟수")
+    parser.add_argument('--path', default='/api/health', help="첫 응답을 기다릴 엔드포인트")
+    parser.add_argument('--timeout', type=float, default=60, help="한 번 실행의 최대 대기 시간 (초)")
+    args = parser.parse_args()
+
+    print(f"🚀 {args.path} 첫 응답 시간 측정 ({args.runs}회)")
+    results = []
+    for run in range(args.runs):
+        result = measure_once(args.path, args.timeout)
+        results.append(result)
+        print(f"  #{run + 1}: 첫 응답 {result['firstResponseMs']}ms (import api {result['importMs']}ms)")
+
+    first_response = [result['firstResponseMs'] for result in results]
+    import_ms = [result['importMs'] for result in results]
+    heavy = sorted({module for result in results for module in result['heavyModules']})
+    print(f"\n📊 첫 응답: 중앙값 {statistics.median(first_response)}ms, 최소 {min(first_response)}ms")
+    print(f"📦 import api: 중앙값 {statistics.median(import_ms)}ms")
+    print(f"🐘 import 시 불러온 무거운 모듈: {', '.join(heavy) if heavy else '없음'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+동기화 파이프라인 벤치마크
+가짜 피드 서버 / 가짜 OpenAI 서버 / 메모리 Firestore로 sync.py와 같은 파이프라인을 실행하고
+구독 수별 처리량과 단계별 시간을 잽니다. 네트워크와 API 키가 필요 없습니다.
+
+사용법:
+    python benchmarks/sync_benchmark.py
+    python benchmarks/sync_benchmark.py --sizes 10,100 --feed-latency 0.2 --llm-429 0.1
+    python benchmarks/sync_benchmark.py --json results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from config import config  # noqa: E402
+from stand_ins import FakeFeedServer, FakeOpenAIServer, MemoryFirebaseClient, RewritingTransport  # noqa: E402
+
+
+def make_subscriptions(count, users=10):
+    """
+    플랫폼이 섞인 구독 목록 생성 (블로그 60% / 유튜브 25% / 트위터 15%)
+
+    Args:
+        count (int): 구독 수
+        users (int): 구독을 나눠 가질 사용자 수
+
+    Returns:
+        list: 구독 정보 리스트
+    """
+    subscriptions = []
+    for index in range(count):
+        slot = index % 20
+        if slot < 4:
+            platform, url = 'blog', f'https://blog{index}.tistory.com/rss'
+        elif slot < 8:
+            platform, url = 'blog', f'https://rss.blog.naver.com/user{index}.xml'
+        elif slot < 12:
+            platform, url = 'blog', f'https://v2.velog.io/rss/@user{index}'
+        elif slot < 17:
+            platform, url = 'youtube', f'https://www.youtube.com/channel/UCbench{index:016d}'
+        else:
+            platform, url = 'twitter', f'https://twitter.com/user{index}'
+        subscriptions.append({
+            'id': f'sub{index}',
+            'userId': f'user{index % users}',
+            'accountId': f'account{index}',
+            'name': f'구독 {index}',
+            'platform': platform,
+            'rssUrl': url,
+        })
+    return subscriptions
+
+
+def run_once(subscriptions, feed_server, store, cache_dir):
+    """
+    파이프라인 1회 실행
+
+    Returns:
+        dict: SyncPipeline 통계 + wallSeconds
+    """
+    # 서버를 띄운 뒤에 불러와야 설정(주소 / 캐시 위치)이 반영됨
+    from rss_fetcher import RSSFetcher
+    from ai_summarizer import AISummarizer
+    from poll_scheduler import PollScheduler
+    from sync_pipeline import SyncPipeline
+
+    config.CACHE_DIR = cache_dir
+    fetcher = RSSFetcher(transport=RewritingTransport(feed_server.url, pool_size=config.FETCH_PER_HOST_LIMIT))
+    pipeline = SyncPipeline(fetcher, store, AISummarizer(), PollScheduler())
+
+    started = time.perf_counter()
+    stats = pipeline.run(subscriptions, force=True)
+    stats['wallSeconds'] = round(time.perf_counter() - started, 3)
+    return stats
+
+
+def summarize_run(size, label, stats, llm_server):
+    """보고용 한 줄 요약"""
+    wall = stats['wallSeconds']
+    pipeline = stats['pipeline']
+    return {
+        'subscriptions': size,
+        'run': label,
+        'wallSeconds': wall,
+        'firstSaveSeconds': pipeline['firstSaveSeconds'],
+        'collected': stats['collected'],
+        'saved': stats['saved'],
+        'feedsPerSecond': round(size / wall, 1) if wall else 0.0,
+        'postsPerSecond': round(stats['saved'] / wall, 1) if wall else 0.0,
+        'stageSeconds': {name: stage['busySeconds'] for name, stage in pipeline['stages'].items()},
+        'peakPostsInFlight': pipeline['peakPostsInFlight'],
+        'feeds': {key: stats['metrics']['feeds'][key] for key in ('requests', 'notModified', 'errors', 'bytes')},
+        'llm': {**stats['metrics']['llm'], 'rateLimited': llm_server.rate_limited},
+        'firestore': stats['metrics']['firestore'],
+    }
+
+
+def print_row(row):
+    stages = row['stageSeconds']
+    first_save = row['firstSaveSeconds']
+    print(f"  {row['subscriptions']:>5}개 {row['run']:<4} | 전체 {row['wallSeconds']:>7.2f}초 "
+          f"(첫 저장 {'-' if first_save is None else f'{first_save:.2f}초'}) | "
+          f"피드 {row['feedsPerSecond']:>6}/초, 게시물 {row['postsPerSecond']:>6}/초 "
+          f"(저장 {row['saved']}개)")
+    print(f"        단계 작업 시간: 수집 {stages['fetch']}초 · 중복 {stages['dedup']}초 · "
+          f"분석 {stages['analyze']}초 · 저장 {stages['save']}초 | "
+          f"피드 304 {row['feeds']['notModified']}개 · LLM {row['llm']['requests']}회 "
+          f"(429 {row['llm']['rateLimited']}회) · 커밋 {row['firestore']['commits']}회")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기화 파이프라인 벤치마크 (로컬 대역 사용)")
+    parser.add_argument('--sizes', default='10,100,1000', help="구독 수 목록 (쉼표로 구분)")
+    parser.add_argument('--feed-latency', type=float, default=0.05, help="피드 응답 지연 (초)")
+    parser.add_argument('--entries', type=int, default=5, help="피드 하나의 게시물 수")
+    parser.add_argument('--llm-latency', type=float, default=0.3, help="OpenAI 응답 지연 (초)")
+    parser.add_argument('--llm-429', type=float, default=0.0, help="OpenAI가 429로 거절할 비율 (0~1)")
+    parser.add_argument('--commit-latency', type=float, default=0.05, help="Firestore 배치 커밋 지연 (초)")
+    parser.add_argument('--read-latency', type=float, default=0.02, help="Firestore 중복 확인 조회 지연 (초)")
+    parser.add_argument('--no-warm', action='store_true', help="변경 없는 두 번째 실행(304 경로)은 생략")
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--verbose', action='store_true', help="파이프라인 로그 출력")
+    args = parser.parse_args()
+
+    feed_server = FakeFeedServer(args.feed_latency, entries=args.entries).start()
+    llm_server = FakeOpenAIServer(args.llm_latency, rate_limit_ratio=args.llm_429).start()
+    config.OPENAI_API_KEY = 'benchmark'
+    config.OPENAI_BASE_URL = llm_server.base_url
+    config.TWITTER_API_KEY = 'benchmark'
+
+    print(f"🏁 동기화 벤치마크 (피드 지연 {args.feed_latency}초, LLM 지연 {args.llm_latency}초, "
+          f"429 비율 {args.llm_429}, 커밋 지연 {args.commit_latency}초)")
+    print(f"   OpenAI 제한: 동시 {config.OPENAI_MAX_CONCURRENCY}개, 분당 {config.OPENAI_RPM}회 / "
+          f"{config.OPENAI_TPM:,}토큰 · 수집 워커 {config.FETCH_MAX_WORKERS}개 (호스트당 {config.FETCH_PER_HOST_LIMIT}개)\n")
+
+    rows = []
+    try:
+        for size in (int(value) for value in args.sizes.split(',')):
+            subscriptions = make_subscriptions(size)
+            store = MemoryFirebaseClient(args.read_latency, args.commit_latency)
+            with tempfile.TemporaryDirectory(prefix='diynews-bench-') as cache_dir:
+                runs = ['cold'] if args.no_warm else ['cold', 'warm']
+                for label in runs:
+                    # API처럼 구독 문서를 다시 읽은 것으로 취급 (지난 실행의 수집 상태 반영)
+                    subs = [{**sub, **store.subscription_states.get(sub['id'], {})} for sub in subscriptions]
+                    llm_server.rate_limited = 0
+                    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+                    with output:
+                        stats = run_once(subs, feed_server, store, cache_dir)
+                    row = summarize_run(size, label, stats, llm_server)
+                    rows.append(row)
+                    print_row(row)
+    finally:
+        feed_server.stop()
+        llm_server.stop()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n💾 결과 저장: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""
+Firestore 묶음 쓰기 모듈
+여러 문서 쓰기를 WriteBatch(최대 500개)로 묶어서 병렬로 커밋합니다.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core import exceptions as gcp_exceptions
+from config import config
+from metrics import FIRESTORE_COMMIT_SECONDS, FIRESTORE_WRITES, bind_run
+
+
+# 다시 시도하면 성공할 수 있는 오류
+RETRYABLE_ERRORS = (
+    gcp_exceptions.Aborted,
+    gcp_exceptions.DeadlineExceeded,
+    gcp_exceptions.InternalServerError,
+    gcp_exceptions.ResourceExhausted,
+    gcp_exceptions.ServiceUnavailable,
+    gcp_exceptions.TooManyRequests,
+)
+
+# 서버가 커밋을 적용했는지 알 수 없는 오류 (응답만 못 받았을 수 있음)
+# Aborted / ResourceExhausted / TooManyRequests는 적용되지 않은 것이 확실함
+AMBIGUOUS_ERRORS = (
+    gcp_exceptions.DeadlineExceeded,
+    gcp_exceptions.InternalServerError,
+    gcp_exceptions.ServiceUnavailable,
+)
+
+
+class BulkWriter:
+    """WriteBatch 기반 묶음 쓰기 클래스"""
+    
+    # Firestore 배치 하나에 들어갈 수 있는 최대 쓰기 수
+    MAX_BATCH_SIZE = 500
+    
+    def __init__(self, db, batch_size=None, max_workers=None, max_retries=None):
+        """
+        Args:
+            db: Firestore 클라이언트
+            batch_size (int): 배치당 쓰기 수 (최대 500)
+            max_workers (int): 동시에 커밋할 배치 수
+            max_retries (int): 배치 커밋 재시도 횟수
+        """
+        self.db = db
+        self.batch_size = min(batch_size or config.FIRESTORE_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        self.max_workers = max_workers or config.FIRESTORE_COMMIT_WORKERS
+        self.max_retries = config.FIRESTORE_MAX_RETRIES if max_retries is None else max_retries
+        self._operations = []
+    
+    def create(self, doc_ref, data):
+        """문서 생성 예약 (이미 있으면 실패)"""
+        self._operations.append(('create', doc_ref, data))
+    
+    def set(self, doc_ref, data, merge=False):
+        """문서 쓰기 예약"""
+        self._operations.append(('set', doc_ref, data, merge))
+    
+    def update(self, doc_ref, data):
+        """문서 필드 갱신 예약 (문서가 없으면 실패)"""
+        self._operations.append(('update', doc_ref, data))
+    
+    def __len__(self):
+        return len(self._operations)
+    
+    def commit(self) -> list:
+        """
+        예약된 쓰기를 모두 커밋
+        
+        Returns:
+            list: 예약한 순서대로 각 쓰기의 성공 여부 (bool)
+        """
+        operations, self._operations = self._operations, []
+        if not operations:
+            return []
+        
+        chunks = [
+            operations[i:i + self.batch_size]
+            for i in range(0, len(operations), self.batch_size)
+        ]
+        
+        print(f"📦 {len(operations)}개 쓰기를 {len(chunks)}개 배치로 커밋 중...")
+        
+        workers = max(1, min(self.max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(bind_run(self._commit_chunk), chunks))
+        
+        results = [ok for chunk_result in chunk_results for ok in chunk_result]
+        print(f"📦 배치 커밋 완료: {sum(results)}/{len(results)}개 성공")
+        return results
+    
+    def _apply(self, batch, operation):
+        """배치에 쓰기 하나 추가"""
+        kind, doc_ref, data = operation[0], operation[1], operation[2]
+        if kind == 'create':
+            batch.create(doc_ref, data)
+        elif kind == 'set':
+            batch.set(doc_ref, data, merge=operation[3])
+        else:
+            batch.update(doc_ref, data)
+    
+    def _commit_with_retry(self, operations):
+        """배치 하나 커밋 (일시적 오류는 지수 백오프로 재시도)"""
+        collection = self._collection_of(operations)
+        attempt = 0
+        error = None
+        while True:
+            batch = self.db.batch()
+            for operation in operations:
+                self._apply(batch, operation)
+            started = time.monotonic()
+            outcome = 'error'
+            try:
+                batch.commit()
+                outcome = 'ok'
+                return
+            except gcp_exceptions.AlreadyExists:
+                # 앞선 시도가 응답만 못 받고 실제로는 커밋됐으면 create 재시도가 AlreadyExists로 실패함.
+                # 그 밖의 경우(다른 동기화가 일부 문서를 먼저 만든 경우 등)는 문서별로 다시 시도하도록 실패로 넘김
+                if not isinstance(error, AMBIGUOUS_ERRORS) or not self._already_committed(operations):
+                    raise
+                print(f"  ℹ️  재시도한 배치가 이미 커밋되어 있음 ({len(operations)}개) → 성공으로 처리")
+                outcome = 'ok'
+                return
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                outcome = 'retry'
+                error = e
+            finally:
+                FIRESTORE_COMMIT_SECONDS.observe(time.monotonic() - started, collection=collection, outcome=outcome)
+                FIRESTORE_WRITES.inc(len(operations), collection=collection, outcome=outcome)
+            
+            delay = (2 ** attempt) * 0.5 + random.uniform(0, 0.5)
+            print(f"  ⚠️  배치 커밋 재시도 ({attempt + 1}/{self.max_retries}, {delay:.1f}초 후): {error}")
+            time.sleep(delay)
+            attempt += 1
+    
+    def _already_committed(self, operations):
+        """
+        응답을 받지 못한 앞선 커밋이 실제로 적용됐는지 확인
+        
+        create만 있는 배치에서 대상 문서가 모두 있으면 적용된 것으로 봅니다.
+        (배치는 원자적이라 일부만 있으면 이 배치가 커밋한 것이 아님)
+        
+        Returns:
+            bool: 모든 쓰기가 이미 반영돼 있으면 True
+        """
+        if any(operation[0] != 'create' for operation in operations):
+            return False
+        try:
+            snapshots = self.db.get_all([operation[1] for operation in operations])
+            return all(snapshot.exists for snapshot in snapshots)
+        except Exception as e:
+            print(f"  ⚠️  커밋 반영 여부 확인 실패: {e}")
+            return False
+    
+    def _collection_of(self, operations):
+        """지표 라벨용 컬렉션 이름 (첫 번째 쓰기 기준)"""
+        parent = getattr(operations[0][1], 'parent', None)
+        return getattr(parent, 'id', None) or 'unknown'
+    
+    def _commit_chunk(self, operations) -> list:
+        """
+        배치 하나를 커밋하고 쓰기별 성공 여부 반환
+        
+        배치는 원자적이어서 쓰기 하나만 실패해도 전체가 거부되므로,
+        문서 때문에 실패한 배치(이미 존재, 문서 없음 등)는 쓰기를 하나씩
+        다시 커밋해서 실패한 문서만 골라냅니다.
+        """
+        try:
+            self._commit_with_retry(operations)
+            return [True] * len(operations)
+        except RETRYABLE_ERRORS as e:
+            # 재시도를 다 써버린 일시적 오류는 문서별로 나눠도 소용없음
+            print(f"  ❌ 배치 커밋 실패 ({len(operations)}개): {e}")
+            return [False] * len(operations)
+        except Exception as e:
+            if len(operations) == 1:
+                print(f"  ❌ 쓰기 실패 ({operations[0][1].id}): {e}")
+                return [False]
+            print(f"  ⚠️  배치 커밋 실패 ({e}), 문서별로 다시 시도합니다")
+        
+        results = []
+        for operation in operations:
+            try:
+                self._commit_with_retry([operation])
+                results.append(True)
+            except Exception as e:
+                print(f"  ❌ 쓰기 실패 ({operation[1].id}): {e}")
+                results.append(False)
+        return results
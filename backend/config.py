@@ -17,9 +17,21 @@ class Config:
     
     # OpenAI 설정
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None  # OpenAI 호환 API 주소 (비우면 기본 주소, 벤치마크용 가짜 서버 등)
+    OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', 8))  # 동시에 보낼 최대 요청 수
+    OPENAI_RPM = int(os.getenv('OPENAI_RPM', 500))  # 분당 최대 요청 수
+    OPENAI_TPM = int(os.getenv('OPENAI_TPM', 200000))  # 분당 최대 토큰 수
+    OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 5))  # 429 / 일시적 오류 재시도 횟수
+    ANALYSIS_PACK_SIZE = int(os.getenv('ANALYSIS_PACK_SIZE', 5))  # 요청 하나에 묶어서 분석할 게시물 수
+    LOCAL_DATE_EXTRACTION = os.getenv('LOCAL_DATE_EXTRACTION', 'true').lower() == 'true'  # 규칙 기반 날짜 추출 사용
+    ANALYSIS_ROUTING_RULES = os.getenv('ANALYSIS_ROUTING_RULES', '')  # LLM 생략 규칙 (JSON, 비우면 기본 규칙)
+    ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv('ANALYSIS_CACHE_MAX_ENTRIES', 50000))  # 분석 결과 캐시 최대 개수
+    ANALYSIS_CACHE_MAX_AGE_DAYS = int(os.getenv('ANALYSIS_CACHE_MAX_AGE_DAYS', 30))  # 분석 결과 캐시 보관 기간
     
     # YouTube 설정
     YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY', '')
+    YOUTUBE_CHANNEL_CACHE_DAYS = int(os.getenv('YOUTUBE_CHANNEL_CACHE_DAYS', 90))  # @사용자명 → 채널 ID 캐시 기간
+    YOUTUBE_CHANNEL_NEGATIVE_CACHE_HOURS = int(os.getenv('YOUTUBE_CHANNEL_NEGATIVE_CACHE_HOURS', 6))  # 찾지 못한 채널 재시도 간격
     
     # Twitter 설정
     TWITTER_API_KEY = os.getenv('TWITTER_API_KEY', '')
@@ -27,10 +39,44 @@ class Config:
     # Firebase 설정
     FIREBASE_CREDENTIALS_PATH = os.getenv('FIREBASE_CREDENTIALS_PATH', 'serviceAccountKey.json')
     FIREBASE_PROJECT_ID = os.getenv('FIREBASE_PROJECT_ID', 'diynews-4ab48')
+    FIRESTORE_BATCH_SIZE = int(os.getenv('FIRESTORE_BATCH_SIZE', 500))  # 배치당 쓰기 수 (최대 500)
+    FIRESTORE_COMMIT_WORKERS = int(os.getenv('FIRESTORE_COMMIT_WORKERS', 4))  # 동시에 커밋할 배치 수
+    FIRESTORE_MAX_RETRIES = int(os.getenv('FIRESTORE_MAX_RETRIES', 3))  # 배치 커밋 재시도 횟수
     
     # RSS 수집 설정
     DAYS_TO_FETCH = int(os.getenv('DAYS_TO_FETCH', 7))  # 최근 7일
+
+    # 병렬 수집 설정
+    FETCH_MAX_WORKERS = int(os.getenv('FETCH_MAX_WORKERS', 16))  # 동시에 수집할 최대 피드 수
+    FETCH_PER_HOST_LIMIT = int(os.getenv('FETCH_PER_HOST_LIMIT', 4))  # 호스트당 최대 동시 요청 수
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))  # 연결 타임아웃 (초)
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 15))  # 응답 읽기 타임아웃 (초)
+    
+    # 수집 스케줄러 설정
+    POLL_SCHEDULER = os.getenv('POLL_SCHEDULER', 'true').lower() == 'true'  # 게시 주기에 맞춰 수집할 피드만 고르기
+    POLL_MIN_INTERVAL_MINUTES = int(os.getenv('POLL_MIN_INTERVAL_MINUTES', 15))  # 같은 피드 최소 수집 간격 (분)
+    POLL_MAX_INTERVAL_HOURS = int(os.getenv('POLL_MAX_INTERVAL_HOURS', 24))  # 최대 수집 간격 = 최대 지연 (시간)
+    POLL_INTERVAL_FACTOR = float(os.getenv('POLL_INTERVAL_FACTOR', 0.5))  # 예상 게시 주기 대비 수집 간격 비율
+    
+    # 동기화 파이프라인 설정
+    SYNC_QUEUE_SIZE = int(os.getenv('SYNC_QUEUE_SIZE', 8))  # 단계 사이 큐에 쌓아둘 최대 묶음 수
+    SYNC_ANALYZE_BATCH_SIZE = int(os.getenv('SYNC_ANALYZE_BATCH_SIZE', 40))  # 분석 단계에서 한 번에 처리할 최대 게시물 수
+    SYNC_SAVE_BATCH_SIZE = int(os.getenv('SYNC_SAVE_BATCH_SIZE', 200))  # 저장 단계에서 한 번에 커밋할 최대 게시물 수
+    SYNC_JOB_WORKERS = int(os.getenv('SYNC_JOB_WORKERS', 2))  # API에서 동시에 실행할 최대 동기화 작업 수
+    SYNC_JOB_MAX_WAIT_SECONDS = int(os.getenv('SYNC_JOB_MAX_WAIT_SECONDS', 60))  # 이보다 오래 기다린 작업의 구독은 뒤의 작업이 먼저 가져가지 못함 (초)
+    SYNC_JOB_HISTORY = int(os.getenv('SYNC_JOB_HISTORY', 100))  # 조회용으로 보관할 끝난 작업 수
+    SSE_KEEPALIVE_SECONDS = int(os.getenv('SSE_KEEPALIVE_SECONDS', 15))  # 진행 상황 스트림 keep-alive 간격 (초)
     
+    # 게시물 조회 API 설정
+    POSTS_PAGE_SIZE = int(os.getenv('POSTS_PAGE_SIZE', 50))  # /api/posts 기본 페이지 크기
+    POSTS_MAX_PAGE_SIZE = int(os.getenv('POSTS_MAX_PAGE_SIZE', 100))  # /api/posts 최대 페이지 크기
+    POSTS_CACHE_TTL_SECONDS = int(os.getenv('POSTS_CACHE_TTL_SECONDS', 300))  # 조회 결과 캐시 보관 시간 (초, 0이면 캐시 안 함)
+    POSTS_CACHE_MAX_ENTRIES = int(os.getenv('POSTS_CACHE_MAX_ENTRIES', 1000))  # 캐시할 최대 페이지 수
+    
+    # 로컬 캐시 설정
+    CACHE_DIR = os.getenv('CACHE_DIR', str(Path(__file__).parent / '.cache'))
+    POST_INDEX_BLOOM = os.getenv('POST_INDEX_BLOOM', 'true').lower() == 'true'  # 중복 체크 블룸 필터 사용
+
     @classmethod
     def validate(cls):
         """
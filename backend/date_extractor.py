@@ -0,0 +1,166 @@
+"""
+한국어 일정 날짜 추출 모듈
+"3월 15일", "12/25", "다음주 금요일" 같은 날짜 표현을 규칙으로 찾아서
+LLM 없이 일정 날짜를 결정할 수 있는지 판단합니다.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+
+WEEKDAYS = '월화수목금토일'
+
+# 날짜 표현 패턴 (미리 컴파일)
+FULL_DATE_PATTERNS = [
+    # 2025년 3월 15일
+    re.compile(r'(20\d{2})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일'),
+    # 2025-03-15, 2025.03.15, 2025/03/15
+    re.compile(r'(?<!\d)(20\d{2})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})(?!\d)'),
+]
+# (패턴, 확실한 표현인지) - 12/25 형식은 분수(1/2)와 헷갈릴 수 있어 확신하지 않음
+MONTH_DAY_PATTERNS = [
+    # 3월 15일
+    (re.compile(r'(?<!\d)(\d{1,2})\s*월\s*(\d{1,2})\s*일'), True),
+    # 12/25 (URL 경로와 헷갈리지 않도록 앞뒤에 숫자와 / 없음)
+    (re.compile(r'(?<![\d/.])(\d{1,2})/(\d{1,2})(?![\d/])'), False),
+    # 3.15(토), 3.15 (토)
+    (re.compile(r'(?<![\d.])(\d{1,2})\.(\d{1,2})\s*\(\s*[' + WEEKDAYS + r']'), True),
+]
+RELATIVE_WEEK_PATTERN = re.compile(
+    r'(이번\s*주|금주|다음\s*주|담주|차주|다다음\s*주)\s*([' + WEEKDAYS + r'])요일'
+)
+RELATIVE_WEEKEND_PATTERN = re.compile(r'(이번|다음)\s*주말')
+RELATIVE_DAY_WORDS = {'오늘': 0, '내일': 1, '모레': 2, '글피': 3}
+# "내일 저녁 7시", "모레(수)", "오늘부터"처럼 시각 / 요일 / 기간 조사가 바로 붙을 때만 날짜로 봄
+# ("내일은 없다", "오늘 오픈한 카페"처럼 일상적인 쓰임은 아래 VAGUE_CUE_PATTERN으로 LLM에 맡김)
+RELATIVE_DAY_PATTERN = re.compile(
+    r'(?<![가-힣])(오늘|내일|모레|글피)'
+    r'(?=\s*(?:\d{1,2}\s*시|\d{1,2}:\d{2}|오전|오후|아침|낮|저녁|밤|새벽|정오|자정|\(\s*[' + WEEKDAYS + r']\s*\))'
+    r'|부터|까지)'
+)
+
+ENGLISH_MONTHS = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?'
+
+# 날짜를 특정할 수 없지만 일정이 있을 수 있는 표현
+VAGUE_CUE_PATTERN = re.compile(
+    r'(다음\s*주|이번\s*주|다음\s*달|이번\s*달|[' + WEEKDAYS + r']요일|\d{1,2}\s*월\s*(초|중순|말|중)|주말|조만간|곧|D-\d+|디데이'
+    # 일만 있는 날짜 (15일, 15일(토))
+    r'|(?<!\d)\d{1,2}\s*일'
+    # 요일 없는 월.일 (12.25)
+    r'|(?<![\d.])\d{1,2}\.\d{1,2}(?![\d.])'
+    # 영어 월 이름 + 일 (March 15, 15th March)
+    r'|\b' + ENGLISH_MONTHS + r'\s+\d{1,2}(?!\d)|(?<!\d)\d{1,2}(?:st|nd|rd|th)?\s+(?:of\s+)?' + ENGLISH_MONTHS + r'\b'
+    # 시각 / 요일 없이 쓰인 오늘·내일 등
+    r'|(?<![가-힣])(?:오늘|내일|모레|글피))',
+    re.IGNORECASE,
+)
+
+# 일정 관련 키워드
+EVENT_KEYWORD_PATTERN = re.compile(
+    r'(콘서트|팬미팅|팬싸|공연|컴백|발매|방송|라이브|이벤트|쇼케이스|투어|개최|예매|티켓|오픈|출연|생일|기념|행사|페스티벌|축제|전시|상영|개봉|마감|신청|모집)'
+)
+
+# 연도가 없는 날짜가 이만큼 지났으면 내년으로 해석
+PAST_DATE_TOLERANCE = timedelta(days=180)
+
+
+class KoreanDateExtractor:
+    """규칙 기반 한국어 일정 날짜 추출기"""
+    
+    def extract(self, text, today=None):
+        """
+        텍스트에서 일정 날짜 추출
+        
+        Args:
+            text (str): 제목 + 내용 (HTML 제거된 텍스트)
+            today (date): 기준 날짜 (기본: 오늘)
+            
+        Returns:
+            dict: {
+                hasDateCue: 날짜 관련 표현이 하나라도 있는지,
+                dates: 찾은 날짜 목록 (YYYY-MM-DD),
+                scheduleDate: 확실한 일정 날짜 (없으면 None),
+                confident: LLM 없이 scheduleDate를 바로 써도 되는지
+            }
+        """
+        today = today or datetime.now().date()
+        if isinstance(today, datetime):
+            today = today.date()
+        text = text or ''
+        
+        dates = []
+        consumed = []
+        has_weak_date = False
+        
+        def add(found_date, span, strong=True):
+            nonlocal has_weak_date
+            # 다른 패턴에 이미 잡힌 부분은 무시 (예: "2025년 3월 15일" 안의 "3월 15일")
+            if any(start <= span[0] < end for start, end in consumed):
+                return
+            consumed.append(span)
+            if not strong:
+                has_weak_date = True
+            if found_date and found_date not in dates:
+                dates.append(found_date)
+        
+        for pattern in FULL_DATE_PATTERNS:
+            for match in pattern.finditer(text):
+                year, month, day = (int(g) for g in match.groups())
+                add(_safe_date(year, month, day), match.span())
+        
+        for pattern, strong in MONTH_DAY_PATTERNS:
+            for match in pattern.finditer(text):
+                month, day = int(match.group(1)), int(match.group(2))
+                add(self._resolve_month_day(month, day, today), match.span(), strong)
+        
+        for match in RELATIVE_WEEK_PATTERN.finditer(text):
+            week_word = re.sub(r'\s', '', match.group(1))
+            weeks = {'이번주': 0, '금주': 0, '다음주': 1, '담주': 1, '차주': 1, '다다음주': 2}[week_word]
+            weekday = WEEKDAYS.index(match.group(2))
+            add(_week_start(today) + timedelta(weeks=weeks, days=weekday), match.span())
+        
+        for match in RELATIVE_WEEKEND_PATTERN.finditer(text):
+            weeks = 0 if match.group(1) == '이번' else 1
+            # 주말은 토요일로 봄
+            add(_week_start(today) + timedelta(weeks=weeks, days=5), match.span())
+        
+        for match in RELATIVE_DAY_PATTERN.finditer(text):
+            add(today + timedelta(days=RELATIVE_DAY_WORDS[match.group(1)]), match.span())
+        
+        has_vague_cue = bool(VAGUE_CUE_PATTERN.search(text))
+        has_event = bool(EVENT_KEYWORD_PATTERN.search(text))
+        date_strings = [d.strftime('%Y-%m-%d') for d in dates]
+        
+        # 확실한 형식의 날짜가 딱 하나이고 일정 키워드가 함께 있을 때만 확실하다고 판단
+        confident = len(dates) == 1 and has_event and not has_weak_date
+        
+        return {
+            'hasDateCue': bool(dates) or has_vague_cue,
+            'dates': date_strings,
+            'scheduleDate': date_strings[0] if confident else None,
+            'confident': confident
+        }
+    
+    def _resolve_month_day(self, month, day, today):
+        """연도 없는 월/일을 날짜로 변환 (많이 지난 날짜는 내년으로)"""
+        found = _safe_date(today.year, month, day)
+        if found and found < today - PAST_DATE_TOLERANCE:
+            found = _safe_date(today.year + 1, month, day)
+        return found
+
+
+def _safe_date(year, month, day):
+    """잘못된 날짜(13월, 2월 30일 등)는 None"""
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _week_start(today):
+    """해당 주의 월요일"""
+    return today - timedelta(days=today.weekday())
+
+
+# 싱글톤 인스턴스
+date_extractor = KoreanDateExtractor()
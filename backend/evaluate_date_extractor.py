@@ -0,0 +1,93 @@
+"""
+날짜 추출기 평가 스크립트
+라벨링된 코퍼스(data/date_extractor_corpus.json)로 규칙 기반 날짜 추출기를 평가합니다.
+
+실행:
+    python evaluate_date_extractor.py          # 라벨과 비교
+    python evaluate_date_extractor.py --llm    # 같은 코퍼스를 LLM에도 보내서 일치율 측정
+"""
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+from date_extractor import date_extractor
+
+
+CORPUS_PATH = Path(__file__).parent / 'data' / 'date_extractor_corpus.json'
+
+
+def evaluate_labels(corpus):
+    """
+    라벨과 비교한 추출기 성능
+    
+    - 확신 정확도: 확신한 날짜가 라벨과 맞은 비율
+    - 놓친 일정: 라벨에는 날짜가 있는데 날짜 표현이 없다고 판단한 수
+      (이 경우 LLM 없이 일정 없음으로 처리되므로 가장 치명적)
+    """
+    today = datetime.strptime(corpus['today'], '%Y-%m-%d').date()
+    confident = correct = missed = deferred = 0
+    
+    for item in corpus['items']:
+        result = date_extractor.extract(item['text'], today)
+        expected = item['scheduleDate']
+        
+        if result['confident']:
+            confident += 1
+            if result['scheduleDate'] == expected:
+                correct += 1
+            else:
+                print(f"  ❌ 확신 오답: {item['text']} → {result['scheduleDate']} (정답: {expected})")
+        elif not result['hasDateCue']:
+            if expected:
+                missed += 1
+                print(f"  ❌ 놓친 일정: {item['text']} (정답: {expected})")
+        else:
+            deferred += 1
+    
+    total = len(corpus['items'])
+    print(f"\n📊 코퍼스 {total}개 (기준일 {corpus['today']})")
+    print(f"  확신: {confident}개, 정확도 {correct}/{confident}")
+    print(f"  LLM에 맡김: {deferred}개")
+    print(f"  날짜 표현 없음: {total - confident - deferred}개, 놓친 일정 {missed}개")
+
+
+def evaluate_llm(corpus):
+    """
+    추출기와 LLM의 일치율 (오늘 날짜 기준으로 둘 다 실행)
+    """
+    from ai_summarizer import ai_summarizer
+    
+    agree = compared = 0
+    for item in corpus['items']:
+        result = date_extractor.extract(item['text'])
+        if not result['confident'] and result['hasDateCue']:
+            continue
+        
+        response = ai_summarizer._request_completion([
+            {"role": "system", "content": ai_summarizer.SYSTEM_PROMPT},
+            {"role": "user", "content": ai_summarizer._create_prompt('', item['text'])}
+        ])
+        llm = json.loads(response.choices[0].message.content)
+        llm_date = llm.get('scheduleDate') if llm.get('hasSchedule') else None
+        
+        compared += 1
+        if llm_date == result['scheduleDate']:
+            agree += 1
+        else:
+            print(f"  ⚠️  불일치: {item['text']} → 추출기 {result['scheduleDate']} / LLM {llm_date}")
+    
+    print(f"\n🤖 LLM 일치율: {agree}/{compared} (추출기가 LLM 없이 결정한 항목 기준)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="날짜 추출기 평가")
+    parser.add_argument('--llm', action='store_true', help="LLM 결과와 일치율 측정 (API 비용 발생)")
+    args = parser.parse_args()
+    
+    with open(CORPUS_PATH, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+    
+    evaluate_labels(corpus)
+    if args.llm:
+        evaluate_llm(corpus)
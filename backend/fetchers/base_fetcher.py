@@ -3,28 +3,38 @@
 모든 플랫폼 Fetcher의 부모 클래스
 """
 
-from datetime import datetime, timedelta
-from dateutil import parser as date_parser
+import time
+import feedparser
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 from abc import ABC, abstractmethod
+from fetchers.http_transport import HttpTransport
+from fetchers.feed_dates import parse_date, parse_iso8601, to_utc
+from metrics import FEED_FETCH_SECONDS, FEED_BYTES, FEED_ENTRIES
 
 
 class BaseFetcher(ABC):
     """모든 Fetcher의 기본 클래스"""
     
-    def __init__(self, days_to_fetch=7, max_entries=10):
+    def __init__(self, days_to_fetch=7, max_entries=10, feed_cache=None, transport=None):
         """
         Args:
             days_to_fetch (int): 수집할 최근 일수
             max_entries (int): 최대 수집 게시물 수
+            feed_cache (FeedValidatorCache): 조건부 요청 캐시 (없으면 매번 전체 수집)
+            transport (HttpTransport): 공용 HTTP 전송 계층 (없으면 새로 생성)
         """
         self.days_to_fetch = days_to_fetch
         self.max_entries = max_entries
-        now = datetime.now()
-        if now.tzinfo:
-            now = now.replace(tzinfo=None)
-        self.cutoff_date = now - timedelta(days=self.days_to_fetch)
+        self.feed_cache = feed_cache
+        self.transport = transport or HttpTransport()
         print(f"📅 {self.days_to_fetch}일 이내 게시물 최대 {self.max_entries}개 수집")
     
+    @property
+    def cutoff_date(self) -> datetime:
+        """수집 기준 시각 (UTC, 확인할 때마다 현재 시각 기준으로 계산)"""
+        return datetime.now(timezone.utc) - timedelta(days=self.days_to_fetch)
+    
     @abstractmethod
     def can_handle(self, url: str) -> bool:
         """
@@ -39,18 +49,134 @@ class BaseFetcher(ABC):
         pass
     
     @abstractmethod
-    def fetch_feed(self, url: str) -> list:
+    def fetch_feed(self, url: str, since: dict = None, subscriptions: list = None) -> list:
         """
         피드를 수집하여 게시물 리스트 반환
         
         Args:
             url (str): 피드 URL
+            since (dict): 이미 수집한 가장 최근 게시물 {id, publishedAt} (여기 도달하면 중단)
+            subscriptions (list): 이 피드로 게시물을 받을 구독들 (조건부 요청 판단용, 없으면 전체 수집)
             
         Returns:
             list: 게시물 리스트
         """
         pass
     
+    @staticmethod
+    def reached_mark(post: dict, mark: dict) -> bool:
+        """
+        게시물이 이미 수집한 지점(high-water mark)에 도달했는지 확인
+        
+        Args:
+            post (dict): 게시물 데이터 (entryId, published 포함)
+            mark (dict): {id, publishedAt} (없으면 항상 False)
+            
+        Returns:
+            bool: 이미 수집한 게시물이거나 그보다 오래된 게시물이면 True
+        """
+        if not mark:
+            return False
+        if mark.get('id') and post.get('entryId') == mark['id']:
+            return True
+        
+        mark_time = parse_iso8601(mark.get('publishedAt'))
+        # 시간대가 없는 예전 기록은 피드 현지 시각이라 UTC와 비교할 수 없으므로 ID로만 판단
+        if mark_time is None or mark_time.tzinfo is None:
+            return False
+        
+        published = post.get('published')
+        published = parse_date(published) if isinstance(published, str) else to_utc(published)
+        if published is None:
+            return False
+        return published < mark_time
+    
+    @staticmethod
+    def high_water_mark(posts: list) -> dict:
+        """
+        게시물 중 가장 최근 게시물로 high-water mark 생성
+        
+        Args:
+            posts (list): 게시물 리스트
+            
+        Returns:
+            dict: {id, publishedAt} (날짜 있는 게시물이 없으면 None)
+        """
+        dated = [post for post in posts if isinstance(post.get('published'), datetime)]
+        if not dated:
+            return None
+        newest = max(dated, key=lambda post: to_utc(post['published']))
+        return {'id': newest.get('entryId'), 'publishedAt': to_utc(newest['published']).isoformat()}
+
+    def get_host(self, url: str) -> str:
+        """
+        동시 요청 수 제한에 사용할 호스트 이름 반환
+
+        Args:
+            url (str): 피드 URL
+
+        Returns:
+            str: 실제로 요청이 나가는 호스트
+        """
+        host = urlparse(url).netloc.lower()
+        for prefix in ('www.', 'm.'):
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+        return host
+
+    def _parse_feed(self, rss_url: str, subscriptions: list = None):
+        """
+        공용 연결 풀로 RSS 피드를 받아서 파싱 (조건부 요청)
+        
+        Args:
+            rss_url (str): RSS 피드 URL
+            subscriptions (list): 이 피드로 게시물을 받을 구독들 (없으면 조건부 요청 안 함)
+            
+        Returns:
+            피드 객체 (변경 없으면(304) None)
+        """
+        host = self.get_host(rss_url)
+        started = time.monotonic()
+        status = 'error'
+        try:
+            headers = self.feed_cache.request_headers(rss_url, subscriptions) if self.feed_cache else None
+            response = self.transport.get(rss_url, headers=headers)
+            status = str(response.status_code)
+            
+            if self.feed_cache and self.feed_cache.record(rss_url, response.status_code, response.headers,
+                                                          subscriptions):
+                print(f"♻️  변경 없음 (304): {rss_url}")
+                return None
+            
+            response.raise_for_status()
+            
+            # 인코딩 판별은 feedparser에 맡김 (Content-Type 헤더 전달)
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            response_headers['content-location'] = response.url
+            feed = feedparser.parse(response.content, response_headers=response_headers)
+            self._record_fetch(host, None, status, len(response.content), len(feed.entries))
+            return feed
+        finally:
+            self._record_fetch(host, started, status)
+    
+    def _record_fetch(self, host, started=None, status=None, body_bytes=0, entries=0):
+        """
+        피드 수집 계측 기록 (/api/metrics)
+        
+        Args:
+            host (str): 요청한 호스트
+            started (float): time.monotonic() 시작 시각 (있으면 소요 시간 기록)
+            status (str): HTTP 상태 코드 / '304' / 'error'
+            body_bytes (int): 받은 본문 크기
+            entries (int): 파싱한 항목 수
+        """
+        if started is not None:
+            FEED_FETCH_SECONDS.observe(time.monotonic() - started, host=host, status=status)
+        if body_bytes:
+            FEED_BYTES.inc(body_bytes, host=host)
+        if entries:
+            FEED_ENTRIES.inc(entries, host=host)
+    
     def _is_recent(self, post: dict) -> bool:
         """
         게시물이 최근 N일 이내인지 확인
@@ -68,12 +194,12 @@ class BaseFetcher(ABC):
                 print(f"  ⚠️  날짜 없음 → 제외: {post.get('title', '')[:40]}...")
                 return False
             
-            if isinstance(published, str):
-                published = date_parser.parse(published)
-                if published.tzinfo:
-                    published = published.replace(tzinfo=None)
+            published = parse_date(published) if isinstance(published, str) else to_utc(published)
+            if published is None:
+                print(f"  ⚠️  날짜 형식 오류 → 제외: {post.get('title', '')[:40]}...")
+                return False
             
-            # 날짜만 비교
+            # 날짜만 비교 (UTC 기준)
             published_date = published.date()
             cutoff_date = self.cutoff_date.date()
             
@@ -4,10 +4,9 @@ RSS 기반 블로그 플랫폼 지원
 """
 
 import re
-import feedparser
 from datetime import datetime
-from dateutil import parser as date_parser
 from fetchers.base_fetcher import BaseFetcher
+from fetchers.feed_dates import entry_date
 
 
 class BlogFetcher(BaseFetcher):
@@ -23,6 +22,16 @@ class BlogFetcher(BaseFetcher):
             'velog.io'
         ]
         return any(domain in url for domain in blog_domains)
+
+    def get_host(self, url: str) -> str:
+        """블로그 플랫폼별 실제 RSS 호스트 반환"""
+        # 네이버 블로그는 모두 rss.blog.naver.com 한 곳으로 요청됨
+        if 'blog.naver.com' in url:
+            return 'rss.blog.naver.com'
+        # 티스토리는 서브도메인만 다르고 같은 서버
+        if 'tistory.com' in url:
+            return 'tistory.com'
+        return super().get_host(url)
     
     def convert_to_rss_url(self, url: str) -> str:
         """
@@ -74,12 +83,14 @@ class BlogFetcher(BaseFetcher):
         print(f"ℹ️  RSS 자동 변환 불가: {url}")
         return url
     
-    def fetch_feed(self, url: str) -> list:
+    def fetch_feed(self, url: str, since: dict = None, subscriptions: list = None) -> list:
         """
         블로그 RSS 피드 수집
         
         Args:
             url (str): 블로그 URL
+            since (dict): 이미 수집한 가장 최근 게시물 {id, publishedAt} (여기 도달하면 중단)
+            subscriptions (list): 이 피드로 게시물을 받을 구독들 (조건부 요청 판단용, 없으면 전체 수집)
             
         Returns:
             list: 게시물 리스트
@@ -89,8 +100,11 @@ class BlogFetcher(BaseFetcher):
             rss_url = self.convert_to_rss_url(url)
             print(f"🔍 피드 수집 중: {rss_url}")
             
-            # RSS 파싱
-            feed = feedparser.parse(rss_url)
+            # RSS 파싱 (변경 없으면 파싱 생략)
+            feed = self._parse_feed(rss_url, subscriptions)
+            
+            if feed is None:
+                return []
             
             if feed.bozo:
                 print(f"⚠️  피드 파싱 경고: {feed.bozo_exception}")
@@ -108,6 +122,9 @@ class BlogFetcher(BaseFetcher):
                     break
                     
                 post = self._parse_entry(entry)
+                if post and self.reached_mark(post, since):
+                    print(f"ℹ️  이미 수집한 게시물 도달, 수집 중단")
+                    break
                 if post and self._is_recent(post):
                     posts.append(post)
                     count += 1
@@ -137,6 +154,7 @@ class BlogFetcher(BaseFetcher):
             post = {
                 'title': entry.get('title', '제목 없음'),
                 'url': entry.get('link', ''),
+                'entryId': entry.get('id') or entry.get('link', ''),
                 'content': self._extract_content(entry),
                 'published': self._extract_date(entry),
                 'thumbnail': self._extract_thumbnail(entry)
@@ -158,22 +176,5 @@ class BlogFetcher(BaseFetcher):
             return entry.get('title', '')
     
     def _extract_date(self, entry) -> datetime:
-        """게시물 날짜 추출"""
-        date_fields = ['published', 'updated', 'created']
-        
-        for field in date_fields:
-            if hasattr(entry, field):
-                try:
-                    date_str = getattr(entry, field)
-                    parsed_date = date_parser.parse(date_str)
-                    
-                    # timezone 제거
-                    if parsed_date.tzinfo:
-                        parsed_date = parsed_date.replace(tzinfo=None)
-                    
-                    return parsed_date
-                except Exception as e:
-                    continue
-        
-        # 날짜 없으면 None
-        return None
\ No newline at end of file
+        """게시물 날짜 추출 (UTC, 날짜 없으면 None)"""
+        return entry_date(entry, ('published', 'updated', 'created'))
\ No newline at end of file
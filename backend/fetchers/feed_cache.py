@@ -0,0 +1,106 @@
+"""
+피드 조건부 요청 캐시
+RSS URL별 ETag / Last-Modified 값을 저장해서 변경 없는 피드는 다시 받지 않음
+
+같은 피드를 여러 구독이 나눠 받으므로, 검증값과 함께 그 응답을 받은 구독 ID도 저장합니다.
+304는 "그 구독들이 이미 받은 내용과 같음"이라는 뜻이라서, 새 구독이나 지난번 수집에서
+빠졌던 구독이 섞여 있으면 조건부 요청을 보내지 않고 전체를 받습니다.
+"""
+
+import threading
+from local_store import JsonStore
+
+
+class FeedValidatorCache:
+    """피드별 검증값(ETag, Last-Modified) 저장소"""
+    
+    def __init__(self, store=None):
+        """
+        Args:
+            store (JsonStore): 검증값을 저장할 로컬 저장소
+        """
+        self.store = store or JsonStore('feed_validators.json')
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def request_headers(self, rss_url: str, subscriptions: list = None) -> dict:
+        """
+        조건부 요청 헤더
+        
+        Args:
+            rss_url (str): RSS 피드 URL
+            subscriptions (list): 이번 응답으로 게시물을 받을 구독들
+            
+        Returns:
+            dict: If-None-Match / If-Modified-Since 헤더
+                (저장된 값이 없거나, 동기화 기록이 없는 구독 / 저장한 응답을 받지 않은 구독이 있으면 빈 dict)
+        """
+        if not subscriptions or not all(sub.get('lastSyncedAt') for sub in subscriptions):
+            return {}
+        validators = self.store.get(rss_url) or {}
+        covered = set(validators.get('subscriptions') or ())
+        if not {sub.get('id') for sub in subscriptions} <= covered:
+            return {}
+        
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('modified'):
+            headers['If-Modified-Since'] = validators['modified']
+        return headers
+    
+    def record(self, rss_url: str, status: int, headers, subscriptions: list = None) -> bool:
+        """
+        응답 결과를 기록
+        
+        Args:
+            rss_url (str): RSS 피드 URL
+            status (int): HTTP 상태 코드
+            headers: 응답 헤더 (대소문자 구분 없는 dict)
+            subscriptions (list): 이번 응답으로 게시물을 받은 구독들
+            
+        Returns:
+            bool: 변경 없음(304) 여부
+        """
+        if status == 304:
+            with self._lock:
+                self.hits += 1
+            return True
+        
+        etag = headers.get('ETag')
+        modified = headers.get('Last-Modified')
+        
+        with self._lock:
+            self.misses += 1
+            # 검증값이 없어도 덮어써서, 이번에 빠진 구독에 예전 검증값이 쓰이지 않게 함
+            self._pending[rss_url] = {
+                'etag': etag,
+                'modified': modified,
+                'subscriptions': sorted({sub.get('id') for sub in subscriptions or () if sub.get('id')}),
+            }
+        return False
+    
+    def commit(self):
+        """
+        이번 동기화에서 받은 검증값을 파일에 저장
+        
+        게시물 저장까지 끝난 뒤에 호출해야 합니다. 중간에 실패한 동기화의
+        검증값이 남으면 다음 실행에서 304를 받아 게시물을 놓치게 됩니다.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if pending:
+            self.store.update(pending)
+        self.store.save()
+    
+    def discard(self):
+        """저장하지 않은 검증값 버리기"""
+        with self._lock:
+            self._pending = {}
+    
+    def stats(self) -> dict:
+        """적중/미스 횟수"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,148 @@
+"""
+피드 날짜 정규화
+모든 Fetcher가 게시 시각을 같은 방식(UTC, 시간대 포함)으로 만듭니다.
+
+feedparser가 미리 파싱해 둔 *_parsed 값을 먼저 쓰고, 문자열은 형식별 빠른 파서
+(ISO 8601 / RFC 822 / Twitter)로 읽습니다. dateutil은 모두 실패했을 때만 사용합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+
+# 로캘과 관계없는 영문 월 이름 (Twitter API 형식)
+_MONTHS = {name: index for index, name in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), start=1)}
+
+
+def to_utc(value):
+    """
+    datetime을 UTC(시간대 포함)로 변환
+
+    시간대가 없는 값은 UTC로 간주합니다 (feedparser와 같은 기준).
+
+    Args:
+        value (datetime): 변환할 시각
+
+    Returns:
+        datetime: UTC 시각 (None이면 None)
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def from_struct_time(value):
+    """
+    feedparser의 *_parsed 값(UTC struct_time) → UTC datetime
+
+    Returns:
+        datetime: UTC 시각 (값이 없거나 잘못됐으면 None)
+    """
+    if not value:
+        return None
+    try:
+        return datetime(*value[:6], tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_iso8601(text):
+    """
+    ISO 8601 문자열 파싱 (Atom / YouTube / 저장된 publishedAt)
+
+    Returns:
+        datetime: 파싱 결과 (시간대는 문자열 그대로, 형식이 다르면 None)
+    """
+    try:
+        return datetime.fromisoformat(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rfc822(text):
+    """
+    RFC 822 문자열 파싱 (RSS pubDate, 예: "Tue, 14 Oct 2025 10:00:00 +0900")
+
+    Returns:
+        datetime: 파싱 결과 (형식이 다르면 None)
+    """
+    try:
+        return parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def parse_twitter(text):
+    """
+    Twitter API 고정 형식 파싱 (예: "Tue Oct 14 10:00:00 +0000 2025")
+
+    Returns:
+        datetime: UTC 시각 (형식이 다르면 None)
+    """
+    try:
+        _, month, day, clock, offset, year = text.split()
+        hour, minute, second = clock.split(':')
+        sign = -1 if offset[0] == '-' else 1
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5])) * sign
+        value = datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second),
+                         tzinfo=timezone(delta))
+    except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+        return None
+    return value.astimezone(timezone.utc)
+
+
+def parse_date(text):
+    """
+    날짜 문자열 → UTC datetime (빠른 파서 → dateutil 순서)
+
+    Args:
+        text (str): 날짜 문자열
+
+    Returns:
+        datetime: UTC 시각 (읽을 수 없으면 None)
+    """
+    if not text or not isinstance(text, str):
+        return None
+    text = text.strip()
+
+    # 숫자로 시작하면 ISO 8601, 아니면 요일로 시작하는 RFC 822 / Twitter 형식일 가능성이 높음
+    if text[:1].isdigit():
+        parsers = (parse_iso8601, parse_rfc822)
+    else:
+        parsers = (parse_rfc822, parse_twitter)
+    for parser in parsers:
+        value = parser(text)
+        if value is not None:
+            return to_utc(value)
+
+    from dateutil import parser as date_parser
+    try:
+        return to_utc(date_parser.parse(text))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def entry_date(entry, fields=('published', 'updated')):
+    """
+    feedparser 엔트리의 게시 시각
+
+    필드마다 feedparser가 파싱해 둔 {field}_parsed를 먼저 쓰고,
+    없을 때만 원본 문자열을 파싱합니다.
+
+    Args:
+        entry: feedparser entry 객체
+        fields (tuple): 확인할 날짜 필드 (앞쪽 우선)
+
+    Returns:
+        datetime: UTC 시각 (날짜가 없으면 None)
+    """
+    for field in fields:
+        value = from_struct_time(entry.get(f'{field}_parsed'))
+        if value is None:
+            value = parse_date(entry.get(field))
+        if value is not None:
+            return value
+    return None
@@ -0,0 +1,128 @@
+"""
+공용 HTTP 전송 계층
+모든 Fetcher가 호스트별 연결 풀을 공유해서 Keep-Alive로 연결을 재사용합니다.
+"""
+
+import threading
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from config import config
+from metrics import HTTP_CONNECTIONS, HTTP_REQUESTS
+
+
+# brotli 패키지가 있을 때만 br 압축 요청 (없으면 urllib3가 풀 수 없음)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 DIYNews/1.0'
+
+
+class _ConnectionCounting:
+    """새 연결을 만들 때 계측 기록 (요청한 스레드에서 호출되므로 실행별 통계에도 들어감)"""
+    
+    def _new_conn(self):
+        HTTP_CONNECTIONS.inc(host=self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPConnectionPool(_ConnectionCounting, HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_ConnectionCounting, HTTPSConnectionPool):
+    pass
+
+
+def _count_response(response, *args, **kwargs):
+    """응답 훅: 요청 수 기록 (리다이렉트도 한 번씩)"""
+    HTTP_REQUESTS.inc(host=urlparse(response.url).hostname or '')
+
+
+class HttpTransport:
+    """호스트별 연결 풀을 가진 HTTP 클라이언트 (스레드 안전)"""
+    
+    def __init__(self, connect_timeout=None, read_timeout=None, pool_size=None):
+        """
+        Args:
+            connect_timeout (float): 연결 타임아웃 (초)
+            read_timeout (float): 응답 읽기 타임아웃 (초)
+            pool_size (int): 호스트당 유지할 최대 연결 수
+        """
+        self.timeout = (
+            connect_timeout or config.HTTP_CONNECT_TIMEOUT,
+            read_timeout or config.HTTP_READ_TIMEOUT,
+        )
+        self.pool_size = pool_size or config.FETCH_PER_HOST_LIMIT
+        self._sessions = {}
+        self._lock = threading.Lock()
+    
+    def _session_for(self, url):
+        """호스트별 세션 (처음 요청할 때 생성)"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                adapter.poolmanager.pool_classes_by_scheme = {
+                    'http': _CountingHTTPConnectionPool,
+                    'https': _CountingHTTPSConnectionPool,
+                }
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update({
+                    'User-Agent': USER_AGENT,
+                    'Accept-Encoding': ACCEPT_ENCODING,
+                })
+                session.hooks['response'].append(_count_response)
+                self._sessions[host] = session
+            return session
+    
+    def get(self, url, headers=None, params=None):
+        """
+        GET 요청
+        
+        Args:
+            url (str): 요청 URL
+            headers (dict): 추가 헤더
+            params (dict): 쿼리 파라미터
+            
+        Returns:
+            requests.Response: 응답 (본문은 압축 해제된 상태)
+        """
+        return self._session_for(url).get(url, headers=headers, params=params, timeout=self.timeout)
+    
+    def stats(self):
+        """
+        연결 재사용 통계 (프로세스 전체 누적, 한 번 수집한 값은 RSSFetcher.last_transport_stats)
+        
+        Returns:
+            dict: {requests, connections, hosts: {host: {requests, connections}}}
+                connections는 새로 맺은 연결(TCP+TLS 핸드셰이크) 수
+        """
+        hosts = {}
+        with self._lock:
+            sessions = list(self._sessions.items())
+        
+        for host, session in sessions:
+            host_stats = {'requests': 0, 'connections': 0}
+            adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        host_stats['requests'] += pool.num_requests
+                        host_stats['connections'] += pool.num_connections
+            hosts[host] = host_stats
+        
+        return {
+            'requests': sum(h['requests'] for h in hosts.values()),
+            'connections': sum(h['connections'] for h in hosts.values()),
+            'hosts': hosts,
+        }
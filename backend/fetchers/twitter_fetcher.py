@@ -4,23 +4,27 @@ Twitter API.io 전용 - extendedEntities에서 이미지 추출
 """
 
 import re
-import requests
-from datetime import datetime
-from dateutil import parser as date_parser
+import time
+from datetime import datetime, timezone
 from fetchers.base_fetcher import BaseFetcher
+from fetchers.feed_dates import parse_date, parse_twitter
 from config import config
 
 
 class TwitterFetcher(BaseFetcher):
     """Twitter Fetcher (Twitter API.io 전용)"""
     
-    def __init__(self, days_to_fetch=None, max_entries=3):
+    def __init__(self, days_to_fetch=None, max_entries=3, feed_cache=None, transport=None):
         """초기화"""
-        super().__init__(days_to_fetch, max_entries)
+        super().__init__(days_to_fetch, max_entries, feed_cache, transport)
     
     def can_handle(self, url: str) -> bool:
         """트위터 URL인지 확인"""
         return 'twitter.com' in url or 'x.com' in url
+
+    def get_host(self, url: str) -> str:
+        """트윗은 모두 Twitter API.io로 요청됨"""
+        return 'api.twitterapi.io'
     
     def _extract_username(self, url: str) -> str:
         """URL에서 트위터 사용자명 추출"""
@@ -39,12 +43,14 @@ class TwitterFetcher(BaseFetcher):
         
         return None
     
-    def fetch_feed(self, url: str) -> list:
+    def fetch_feed(self, url: str, since: dict = None, subscriptions: list = None) -> list:
         """
         트위터 피드 수집 (Twitter API.io 전용)
         
         Args:
             url (str): 트위터 URL
+            since (dict): 이미 수집한 가장 최근 게시물 {id, publishedAt} (여기 도달하면 중단)
+            subscriptions (list): 이 피드로 게시물을 받을 구독들 (조건부 요청 판단용, 없으면 전체 수집)
             
         Returns:
             list: 트윗 리스트
@@ -61,10 +67,10 @@ class TwitterFetcher(BaseFetcher):
             print(f"  ❌ Twitter API 키가 필요합니다")
             return []
         
-        return self._fetch_via_api(username)
+        return self._fetch_via_api(username, since)
     
 
-    def _fetch_via_api(self, username: str) -> list:
+    def _fetch_via_api(self, username: str, since: dict = None) -> list:
         """
         Twitter API.io를 사용하여 트윗 수집
         """
@@ -81,17 +87,25 @@ class TwitterFetcher(BaseFetcher):
                 'count': 3
             }
             
-            response = requests.get(api_url, headers=headers, params=params, timeout=10)
+            host = self.get_host(api_url)
+            started = time.monotonic()
+            try:
+                response = self.transport.get(api_url, headers=headers, params=params)
+            except Exception:
+                self._record_fetch(host, started, 'error')
+                raise
             
             print(f"  🔍 상태 코드: {response.status_code}")
             
             if response.status_code != 200:
+                self._record_fetch(host, started, str(response.status_code))
                 print(f"  ❌ API 오류: {response.status_code}")
                 return []
             
             data = response.json()
             response_data = data.get('data', {})
             tweets = response_data.get('tweets', [])
+            self._record_fetch(host, started, '200', len(response.content), len(tweets))
             
             if not tweets:
                 print(f"  ℹ️  트윗 없음")
@@ -105,6 +119,9 @@ class TwitterFetcher(BaseFetcher):
                     break
                 
                 post = self._parse_api_tweet(tweet, username)
+                if post and self.reached_mark(post, since):
+                    print(f"ℹ️  이미 수집한 트윗 도달, 수집 중단")
+                    break
                 if post:
                     if self._is_recent(post):
                         posts.append(post)
@@ -127,19 +144,14 @@ class TwitterFetcher(BaseFetcher):
         Twitter API.io 트윗을 게시물 데이터로 변환
         """
         try:
-            # 날짜 파싱
+            # 날짜 파싱 (API 고정 형식 → 다른 형식이면 일반 파서, 실패하면 현재 시각)
             created_at = tweet.get('createdAt')
             published = None
             
             if created_at:
-                try:
-                    published = date_parser.parse(created_at)
-                    if published.tzinfo:
-                        published = published.replace(tzinfo=None)
-                except:
-                    published = datetime.now()
-            else:
-                published = datetime.now()
+                published = parse_twitter(created_at) or parse_date(created_at)
+            if published is None:
+                published = datetime.now(timezone.utc)
             
             # URL 생성
             tweet_id = tweet.get('id', '')
@@ -169,6 +181,7 @@ class TwitterFetcher(BaseFetcher):
             post = {
                 'title': f"@{username} 트윗",
                 'url': tweet_url,
+                'entryId': str(tweet_id),
                 'content': tweet_text,
                 'published': published,
                 'thumbnail': thumbnail
@@ -4,15 +4,40 @@ YouTube Fetcher
 """
 
 import re
-import feedparser
+import threading
+import time
 from datetime import datetime
-from dateutil import parser as date_parser
 from fetchers.base_fetcher import BaseFetcher
+from fetchers.feed_dates import entry_date
+from local_store import JsonStore
+
+
+# YouTube Data API 클라이언트 (스레드마다 하나)
+# googleapiclient가 쓰는 httplib2.Http는 스레드 안전하지 않아서 수집 워커끼리 공유하면 안 됨
+_youtube_clients = threading.local()
+
+
+def _get_youtube_client(api_key):
+    """현재 스레드의 YouTube Data API 클라이언트 반환 (스레드에서 처음 호출할 때 생성)"""
+    client = getattr(_youtube_clients, 'client', None)
+    if client is None:
+        from googleapiclient.discovery import build
+        # 디스커버리 문서는 패키지에 포함된 것을 사용 (스레드마다 네트워크로 받지 않음)
+        client = build('youtube', 'v3', developerKey=api_key, static_discovery=True)
+        _youtube_clients.client = client
+    return client
 
 
 class YouTubeFetcher(BaseFetcher):
     """YouTube RSS Fetcher"""
     
+    def __init__(self, days_to_fetch=7, max_entries=10, feed_cache=None, transport=None, channel_id_cache=None):
+        """초기화"""
+        super().__init__(days_to_fetch, max_entries, feed_cache, transport)
+        
+        # @사용자명 → 채널 ID 캐시
+        self.channel_id_cache = channel_id_cache or JsonStore('youtube_channel_ids.json')
+    
     def can_handle(self, url: str) -> bool:
         """유튜브 URL인지 확인"""
         return 'youtube.com' in url or 'youtu.be' in url
@@ -60,7 +85,40 @@ class YouTubeFetcher(BaseFetcher):
     
     def _get_channel_id_from_username(self, username: str) -> str:
         """
-        @사용자명에서 채널 ID 추출
+        @사용자명에서 채널 ID 추출 (캐시 우선)
+        
+        찾은 채널 ID는 오래 캐시하고, 찾지 못한 경우도 잠시 캐시해서
+        매번 API 할당량을 쓰거나 채널 페이지를 받지 않도록 합니다.
+        
+        Args:
+            username (str): 유튜브 사용자명
+            
+        Returns:
+            str: 채널 ID (찾지 못하면 None)
+        """
+        from config import config
+        
+        key = username.lower()
+        cached = self.channel_id_cache.get(key)
+        if cached:
+            age = time.time() - cached.get('resolvedAt', 0)
+            if cached.get('channelId') and age < config.YOUTUBE_CHANNEL_CACHE_DAYS * 86400:
+                print(f"  💾 캐시된 채널 ID 사용")
+                return cached['channelId']
+            if not cached.get('channelId') and age < config.YOUTUBE_CHANNEL_NEGATIVE_CACHE_HOURS * 3600:
+                print(f"  💾 최근에 찾지 못한 채널 (캐시)")
+                return None
+        
+        channel_id = self._resolve_channel_id(username)
+        
+        self.channel_id_cache.set(key, {'channelId': channel_id, 'resolvedAt': time.time()})
+        self.channel_id_cache.save()
+        
+        return channel_id
+    
+    def _resolve_channel_id(self, username: str) -> str:
+        """
+        YouTube API / 웹 스크래핑으로 채널 ID 조회
         
         Args:
             username (str): 유튜브 사용자명
@@ -74,9 +132,7 @@ class YouTubeFetcher(BaseFetcher):
         if config.YOUTUBE_API_KEY:
             try:
                 print(f"  🔑 YouTube API 사용")
-                from googleapiclient.discovery import build
-                
-                youtube = build('youtube', 'v3', developerKey=config.YOUTUBE_API_KEY)
+                youtube = _get_youtube_client(config.YOUTUBE_API_KEY)
                 
                 # @사용자명으로 검색
                 request = youtube.search().list(
@@ -100,15 +156,10 @@ class YouTubeFetcher(BaseFetcher):
         # 방법 2: 웹 스크래핑 (폴백)
         try:
             print(f"  🌐 웹 스크래핑 사용")
-            import requests
             
-            # 유튜브 채널 페이지 요청
+            # 유튜브 채널 페이지 요청 (공용 연결 풀 사용)
             url = f"https://www.youtube.com/@{username}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.transport.get(url)
             
             if response.status_code != 200:
                 print(f"  ⚠️  페이지 로드 실패: {response.status_code}")
@@ -133,12 +184,14 @@ class YouTubeFetcher(BaseFetcher):
             print(f"  ⚠️  채널 ID 추출 실패: {e}")
             return None
     
-    def fetch_feed(self, url: str) -> list:
+    def fetch_feed(self, url: str, since: dict = None, subscriptions: list = None) -> list:
         """
         유튜브 RSS 피드 수집
         
         Args:
             url (str): 유튜브 URL
+            since (dict): 이미 수집한 가장 최근 게시물 {id, publishedAt} (여기 도달하면 중단)
+            subscriptions (list): 이 피드로 게시물을 받을 구독들 (조건부 요청 판단용, 없으면 전체 수집)
             
         Returns:
             list: 비디오 리스트
@@ -152,8 +205,11 @@ class YouTubeFetcher(BaseFetcher):
             
             print(f"🔍 피드 수집 중: {rss_url}")
             
-            # RSS 파싱
-            feed = feedparser.parse(rss_url)
+            # RSS 파싱 (변경 없으면 파싱 생략)
+            feed = self._parse_feed(rss_url, subscriptions)
+            
+            if feed is None:
+                return []
             
             if feed.bozo:
                 print(f"⚠️  피드 파싱 경고: {feed.bozo_exception}")
@@ -171,6 +227,9 @@ class YouTubeFetcher(BaseFetcher):
                     break
                     
                 post = self._parse_entry(entry)
+                if post and self.reached_mark(post, since):
+                    print(f"ℹ️  이미 수집한 비디오 도달, 수집 중단")
+                    break
                 if post and self._is_recent(post):
                     posts.append(post)
                     count += 1
@@ -213,6 +272,7 @@ class YouTubeFetcher(BaseFetcher):
             post = {
                 'title': entry.get('title', '제목 없음'),
                 'url': entry.get('link', ''),
+                'entryId': video_id or entry.get('link', ''),
                 'content': self._extract_description(entry),
                 'published': self._extract_date(entry),
                 'thumbnail': thumbnail,
@@ -235,21 +295,5 @@ class YouTubeFetcher(BaseFetcher):
             return entry.get('title', '')
     
     def _extract_date(self, entry) -> datetime:
-        """비디오 업로드 날짜 추출"""
-        date_fields = ['published', 'updated']
-        
-        for field in date_fields:
-            if hasattr(entry, field):
-                try:
-                    date_str = getattr(entry, field)
-                    parsed_date = date_parser.parse(date_str)
-                    
-                    # timezone 제거
-                    if parsed_date.tzinfo:
-                        parsed_date = parsed_date.replace(tzinfo=None)
-                    
-                    return parsed_date
-                except Exception as e:
-                    continue
-        
-        return None
\ No newline at end of file
+        """비디오 업로드 날짜 추출 (UTC, 날짜 없으면 None)"""
+        return entry_date(entry)
\ No newline at end of file
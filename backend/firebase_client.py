@@ -3,11 +3,17 @@ Firebase 클라이언트 모듈
 Firestore 데이터베이스와 상호작용합니다.
 """
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+import re
+import threading
 from datetime import datetime
 from pathlib import Path
 from config import config
+from post_index import post_index
+from post_cache import post_page_cache
+from post_ids import post_doc_id
+
+# 일정 색인에 넣을 수 있는 scheduleDate 형식 (YYYY-MM-DD로 시작)
+SCHEDULE_DATE_PATTERN = re.compile(r'^(\d{4}-\d{2})-\d{2}')
 
 
 class FirebaseClient:
@@ -15,6 +21,10 @@ class FirebaseClient:
     
     def __init__(self):
         """Firebase 초기화"""
+        # firebase_admin은 import만 해도 오래 걸려서 클라이언트를 처음 만들 때 불러옴
+        import firebase_admin
+        from firebase_admin import credentials, firestore
+        
         if not firebase_admin._apps:
             # 서비스 계정 키 파일 경로
             cred_path = Path(__file__).parent / config.FIREBASE_CREDENTIALS_PATH
@@ -25,8 +35,32 @@ class FirebaseClient:
         
         # Firestore 클라이언트
         self.db = firestore.client()
+        
+        # 중복 체크용 로컬 색인
+        self.post_index = post_index
+        
+        # /api/posts 조회 캐시 (게시물을 저장하면 무효화)
+        self.post_cache = post_page_cache
         print("✅ Firebase 초기화 완료!")
     
+    def verify_id_token(self, id_token):
+        """
+        Firebase ID 토큰 검증 (프론트엔드 로그인 사용자 확인)
+        
+        Args:
+            id_token (str): 클라이언트가 보낸 ID 토큰
+            
+        Returns:
+            str: 토큰의 사용자 ID (uid). 토큰이 잘못됐거나 만료됐으면 None
+        """
+        from firebase_admin import auth
+        
+        try:
+            return auth.verify_id_token(id_token)['uid']
+        except (ValueError, auth.InvalidIdTokenError) as e:
+            print(f"⚠️  ID 토큰 검증 실패: {e}")
+            return None
+    
     def get_subscriptions(self, user_id=None):
         """
         구독 목록 가져오기
@@ -62,26 +96,189 @@ class FirebaseClient:
             print(f"❌ 구독 목록 가져오기 실패: {e}")
             return []
     
-    def get_existing_post_urls(self):
+    def get_subscriptions_by_ids(self, subscription_ids):
         """
-        이미 저장된 게시물 URL 목록 가져오기 (중복 체크용)
+        구독 ID로 구독 정보 가져오기
         
+        Args:
+            subscription_ids (list): 구독 ID 목록
+            
         Returns:
-            set: 게시물 URL 집합
+            list: 구독 정보 리스트 (없는 ID는 제외)
         """
         try:
-            posts_ref = self.db.collection('posts')
-            docs = posts_ref.stream()
+            subscriptions_ref = self.db.collection('subscriptions')
+            refs = [subscriptions_ref.document(subscription_id) for subscription_id in dict.fromkeys(subscription_ids)]
             
-            # URL만 추출하여 set으로 저장
-            existing_urls = {doc.to_dict().get('url') for doc in docs if doc.to_dict().get('url')}
+            subscriptions = []
+            for start in range(0, len(refs), 300):
+                for doc in self.db.get_all(refs[start:start + 300]):
+                    if doc.exists:
+                        data = doc.to_dict()
+                        data['id'] = doc.id
+                        subscriptions.append(data)
+            
+            print(f"📋 {len(subscriptions)}개 구독 계정 발견")
+            return subscriptions
+            
+        except Exception as e:
+            print(f"❌ 구독 목록 가져오기 실패: {e}")
+            return []
+    
+    def get_posts(self, user_id, platform=None, limit=50, cursor=None):
+        """
+        사용자의 게시물을 최신순으로 한 페이지 가져오기
+        
+        (userId, createdAt) 복합 색인을 사용하고, platform을 주면
+        (userId, platform, createdAt) 복합 색인이 필요합니다.
+        
+        Args:
+            user_id (str): 사용자 ID
+            platform (str, optional): 플랫폼 필터 (blog / youtube / twitter)
+            limit (int): 페이지 크기
+            cursor (tuple, optional): 이전 페이지의 마지막 (createdAt, 문서 ID)
+            
+        Returns:
+            tuple: (게시물 리스트, 다음 페이지 커서 또는 None)
+        """
+        from firebase_admin import firestore
+        
+        query = self.db.collection('posts').where('userId', '==', user_id)
+        if platform:
+            query = query.where('platform', '==', platform)
+        
+        # 생성 시각이 같은 게시물도 빠지지 않도록 문서 ID로 순서 고정
+        query = query.order_by('createdAt', direction=firestore.Query.DESCENDING) \
+                     .order_by('__name__', direction=firestore.Query.DESCENDING)
+        if cursor:
+            created_at, post_id = cursor
+            query = query.start_after({'createdAt': created_at, '__name__': post_id})
+        
+        # 한 개 더 읽어서 다음 페이지가 있는지 확인
+        docs = list(query.limit(limit + 1).stream())
+        posts = [{'id': doc.id, **doc.to_dict()} for doc in docs[:limit]]
+        
+        next_cursor = None
+        if len(docs) > limit:
+            last = posts[-1]
+            next_cursor = (last.get('createdAt'), last['id'])
+        return posts, next_cursor
+    
+    def iter_post_ids(self):
+        """
+        저장된 모든 게시물의 문서 ID 순회 (url, userId 필드만 읽음)
+        
+        예전에 자동 ID로 저장된 게시물도 같은 기준으로 비교할 수 있도록
+        URL과 사용자 ID에서 계산한 ID를 돌려줍니다.
+        
+        Yields:
+            str: 게시물 문서 ID
+        """
+        posts_ref = self.db.collection('posts')
+        for doc in posts_ref.select(['url', 'userId']).stream():
+            data = doc.to_dict() or {}
+            if data.get('url'):
+                yield post_doc_id(data['url'], data.get('userId'))
+    
+    def rebuild_post_index(self):
+        """
+        Firestore에서 게시물 색인 재생성
+        
+        Returns:
+            int: 색인된 게시물 수
+        """
+        print("🗂️  Firestore에서 게시물 색인 재생성 중...")
+        return self.post_index.rebuild(self.iter_post_ids())
+    
+    def find_existing_post_ids(self, post_ids):
+        """
+        Firestore에 이미 있는 게시물 문서 ID 조회 (해당 문서만 get_all로 읽음)
+        
+        Args:
+            post_ids (iterable): 확인할 게시물 문서 ID 목록
             
-            print(f"🔍 기존 게시물 {len(existing_urls)}개 확인")
-            return existing_urls
+        Returns:
+            set: 이미 존재하는 게시물 문서 ID 집합
+        """
+        posts_ref = self.db.collection('posts')
+        post_ids = list(post_ids)
+        existing = set()
+        
+        for i in range(0, len(post_ids), 300):
+            refs = [posts_ref.document(post_id) for post_id in post_ids[i:i + 300]]
+            for snapshot in self.db.get_all(refs, field_paths=['url']):
+                if snapshot.exists:
+                    existing.add(snapshot.id)
+        
+        return existing
+    
+    def filter_new_posts(self, posts, rebuild_index=False):
+        """
+        이미 저장된 게시물 제외
+        
+        로컬 색인에 없는 후보만 Firestore에서 문서 ID로 확인하므로
+        비용은 전체 게시물 수가 아니라 이번에 수집한 게시물 수에 비례합니다.
+        
+        Args:
+            posts (list): 수집한 게시물 리스트 (userId 포함)
+            rebuild_index (bool): 색인을 Firestore에서 다시 만들지 여부
             
+        Returns:
+            list: 새 게시물 리스트
+        """
+        # 색인이 없으면 처음 한 번만 Firestore에서 생성
+        if rebuild_index or not self.post_index.is_built():
+            self.rebuild_post_index()
+        
+        # 이번 실행 안에서 겹치는 게시물은 하나만 남김
+        candidates = {}
+        for post in posts:
+            post_id = post_doc_id(post.get('url'), post.get('userId'))
+            candidates.setdefault(post_id, post)
+        
+        known_ids = self.post_index.find_existing(candidates.keys())
+        unknown_ids = [post_id for post_id in candidates if post_id not in known_ids]
+        
+        try:
+            remote_ids = self.find_existing_post_ids(unknown_ids)
         except Exception as e:
             print(f"❌ 기존 게시물 확인 실패: {e}")
-            return set()
+            remote_ids = set()
+        
+        # 색인에 빠져 있던 게시물은 색인에 채워둠
+        self.post_index.add_many(remote_ids)
+        
+        print(f"🔍 기존 게시물 {len(known_ids) + len(remote_ids)}개 확인 "
+              f"(색인 {len(known_ids)}개, Firestore 조회 {len(unknown_ids)}개)")
+        
+        existing_ids = known_ids | remote_ids
+        return [post for post_id, post in candidates.items() if post_id not in existing_ids]
+    
+    def _prepare_post(self, post_data):
+        """
+        저장 전 게시물 데이터 검증 및 정리
+        
+        Args:
+            post_data (dict): 저장할 게시물 데이터
+            
+        Returns:
+            bool: 저장 가능 여부
+        """
+        # 필수 필드 확인
+        required_fields = ['title', 'url', 'platform', 'author']
+        for field in required_fields:
+            if field not in post_data:
+                print(f"❌ 필수 필드 누락: {field}")
+                return False
+        
+        # createdAt 타임스탬프 추가
+        post_data['createdAt'] = datetime.now().isoformat()
+        
+        # 일정 정보 디버깅
+        if post_data.get('hasSchedule'):
+            print(f"  📅 일정 있음: {post_data.get('scheduleDate')} - {post_data['title'][:30]}...")
+        
+        return True
     
     def save_post(self, post_data):
         """
@@ -93,35 +290,32 @@ class FirebaseClient:
         Returns:
             bool: 저장 성공 여부
         """
+        from google.api_core.exceptions import AlreadyExists
+        
         try:
-            # 필수 필드 확인
-            required_fields = ['title', 'url', 'platform', 'author']
-            for field in required_fields:
-                if field not in post_data:
-                    print(f"❌ 필수 필드 누락: {field}")
-                    return False
-            
-            # createdAt 타임스탬프 추가
-            post_data['createdAt'] = datetime.now().isoformat()
+            if not self._prepare_post(post_data):
+                return False
             
-            # 일정 정보 디버깅
-            if post_data.get('hasSchedule'):
-                print(f"  📅 일정 있음: {post_data.get('scheduleDate')} - {post_data['title'][:30]}...")
-            
-            # Firestore에 저장
-            posts_ref = self.db.collection('posts')
-            posts_ref.add(post_data)
+            # Firestore에 저장 (URL 기준 문서 ID, 이미 있으면 건너뜀)
+            post_id = post_doc_id(post_data['url'], post_data.get('userId'))
+            self.db.collection('posts').document(post_id).create(post_data)
+            self.post_index.add_many([post_id])
+            self.update_schedule_index({post_id: post_data})
+            self.post_cache.invalidate([post_data.get('userId')])
             
             print(f"✅ 저장 완료: {post_data['title'][:30]}...")
             return True
             
+        except AlreadyExists:
+            print(f"ℹ️  이미 저장된 게시물: {post_data['title'][:30]}...")
+            return False
         except Exception as e:
             print(f"❌ 게시물 저장 실패: {e}")
             return False
     
     def save_posts_batch(self, posts_list):
         """
-        여러 게시물을 한 번에 저장
+        여러 게시물을 한 번에 저장 (WriteBatch로 묶어서 커밋)
         
         Args:
             posts_list (list): 저장할 게시물 리스트
@@ -129,32 +323,192 @@ class FirebaseClient:
         Returns:
             int: 저장 성공한 게시물 개수
         """
-        success_count = 0
+        posts_ref = self.db.collection('posts')
+        writer = self._writer()
+        queued = []
+        queued_posts = []
         
         for post in posts_list:
-            if self.save_post(post):
-                success_count += 1
+            if self._prepare_post(post):
+                # 같은 게시물은 항상 같은 문서 ID → 재실행해도 중복 저장되지 않음
+                post_id = post_doc_id(post['url'], post.get('userId'))
+                writer.create(posts_ref.document(post_id), post)
+                queued.append(post)
+                queued_posts.append(post_id)
+        
+        results = writer.commit()
+        saved_ids = [post_id for post_id, ok in zip(queued_posts, results) if ok]
+        success_count = len(saved_ids)
+        
+        # 저장한 게시물을 색인에 반영하고 조회 캐시 무효화
+        self.post_index.add_many(saved_ids)
+        if saved_ids:
+            saved = set(saved_ids)
+            saved_posts = {post_id: post for post, post_id in zip(queued, queued_posts) if post_id in saved}
+            self.update_schedule_index(saved_posts)
+            self.post_cache.invalidate({post.get('userId') for post in saved_posts.values()})
         
         print(f"📊 총 {len(posts_list)}개 중 {success_count}개 저장 성공")
         return success_count
     
-    def update_subscription_sync_time(self, subscription_id):
+    def update_schedule_index(self, posts_by_id):
         """
-        구독 계정의 마지막 동기화 시간 업데이트
+        일정 색인 갱신 (사용자·월마다 문서 하나: schedules/{userId}_{YYYY-MM})
+        
+        캘린더는 게시물을 훑지 않고 이 문서 하나만 읽습니다.
+        게시물 ID를 키로 병합하므로 같은 게시물을 다시 넣어도 중복되지 않습니다.
         
         Args:
-            subscription_id (str): 구독 ID
+            posts_by_id (dict): {게시물 문서 ID: 게시물 데이터} (일정 없는 게시물은 무시)
+            
+        Returns:
+            int: 색인에 넣은 일정 개수
         """
-        try:
-            sub_ref = self.db.collection('subscriptions').document(subscription_id)
-            sub_ref.update({
-                'lastSyncedAt': datetime.now().isoformat()
-            })
-            print(f"🔄 동기화 시간 업데이트: {subscription_id}")
+        months = {}
+        for post_id, post in posts_by_id.items():
+            match = SCHEDULE_DATE_PATTERN.match(str(post.get('scheduleDate') or ''))
+            if not post.get('hasSchedule') or not match:
+                continue
+            items = months.setdefault((post.get('userId'), match.group(1)), {})
+            items[post_id] = {
+                'date': post['scheduleDate'],
+                'title': post.get('title'),
+                'author': post.get('author'),
+                'platform': post.get('platform'),
+                'url': post.get('url'),
+            }
+        
+        if not months:
+            return 0
+        
+        schedules_ref = self.db.collection('schedules')
+        writer = self._writer()
+        updated_at = datetime.now().isoformat()
+        for (user_id, month), items in months.items():
+            writer.set(schedules_ref.document(self._schedule_doc_id(user_id, month)), {
+                'userId': user_id,
+                'month': month,
+                'items': items,
+                'updatedAt': updated_at,
+            }, merge=True)
+        
+        total = sum(len(items) for items in months.values())
+        results = writer.commit()
+        if not all(results):
+            print(f"⚠️  일정 색인 갱신 일부 실패: {results.count(False)}/{len(results)}개 월")
+        print(f"📅 일정 색인 갱신: {total}개 ({len(months)}개 월)")
+        return total
+    
+    def remove_from_schedule_index(self, user_id, posts):
+        """
+        삭제된 게시물을 일정 색인에서 제거
+        
+        클라이언트가 알려준 목록이므로, posts 컬렉션에 아직 남아 있는 게시물은 건너뜁니다.
+        
+        Args:
+            user_id (str): 사용자 ID
+            posts (list): [{id, scheduleDate}] 삭제된 게시물
             
-        except Exception as e:
-            print(f"❌ 동기화 시간 업데이트 실패: {e}")
+        Returns:
+            int: 제거한 일정 개수
+        """
+        from firebase_admin import firestore
+        from google.cloud.firestore_v1.field_path import FieldPath
+        
+        posts = [post for post in posts if isinstance(post.get('id'), str) and post['id']]
+        still_exists = self.find_existing_post_ids({post['id'] for post in posts}) if posts else set()
+        
+        schedules_ref = self.db.collection('schedules')
+        writer = self._writer()
+        for post in posts:
+            match = SCHEDULE_DATE_PATTERN.match(str(post.get('scheduleDate') or ''))
+            if match and post['id'] not in still_exists:
+                writer.update(schedules_ref.document(self._schedule_doc_id(user_id, match.group(1))), {
+                    FieldPath('items', post['id']).to_api_repr(): firestore.DELETE_FIELD
+                })
+        
+        if not len(writer):
+            return 0
+        return sum(writer.commit())
+    
+    def get_schedules(self, user_id, month):
+        """
+        한 달치 일정 가져오기 (일정 색인 문서 하나만 읽음)
+        
+        Args:
+            user_id (str): 사용자 ID
+            month (str): YYYY-MM
+            
+        Returns:
+            list: [{postId, date, title, author, platform, url}] 날짜순
+        """
+        doc = self.db.collection('schedules').document(self._schedule_doc_id(user_id, month)).get()
+        items = (doc.to_dict() or {}).get('items', {}) if doc.exists else {}
+        schedules = [{'postId': post_id, **item} for post_id, item in items.items()]
+        schedules.sort(key=lambda item: (item.get('date') or '', item['postId']))
+        return schedules
+    
+    def rebuild_schedule_index(self):
+        """
+        기존 게시물로 일정 색인 다시 만들기 (색인 도입 전 게시물 반영용)
+        
+        Returns:
+            int: 색인에 넣은 일정 개수
+        """
+        print("🗂️  Firestore 게시물로 일정 색인 재생성 중...")
+        query = self.db.collection('posts').where('hasSchedule', '==', True) \
+                    .select(['userId', 'hasSchedule', 'scheduleDate', 'title', 'author', 'platform', 'url'])
+        posts_by_id = {doc.id: doc.to_dict() or {} for doc in query.stream()}
+        return self.update_schedule_index(posts_by_id)
+    
+    def _writer(self):
+        """묶음 쓰기 객체 (bulk_writer는 google.api_core를 불러오므로 쓸 때 import)"""
+        from bulk_writer import BulkWriter
+        return BulkWriter(self.db)
+    
+    def _schedule_doc_id(self, user_id, month):
+        """일정 색인 문서 ID ({userId}_{YYYY-MM})"""
+        return f"{user_id}_{month}"
+    
+    def update_subscription_states(self, states):
+        """
+        여러 구독의 동기화 상태(수집 스케줄 기록 포함)를 배치로 업데이트
+        
+        Args:
+            states (dict): {구독 ID: 업데이트할 필드 dict}
+            
+        Returns:
+            int: 업데이트 성공한 구독 개수
+        """
+        subscriptions_ref = self.db.collection('subscriptions')
+        writer = self._writer()
+        
+        for subscription_id, fields in states.items():
+            writer.update(subscriptions_ref.document(subscription_id), fields)
+        
+        total = len(writer)
+        success_count = sum(writer.commit())
+        print(f"🔄 구독 동기화 상태 업데이트: {success_count}/{total}개")
+        return success_count
+
+
+# 싱글톤 인스턴스 (처음 사용할 때 생성)
+_firebase_client = None
+_firebase_client_lock = threading.Lock()
+
+
+def get_firebase_client():
+    """FirebaseClient 싱글톤 (처음 호출할 때 Firebase 초기화)"""
+    global _firebase_client
+    if _firebase_client is None:
+        with _firebase_client_lock:
+            if _firebase_client is None:
+                _firebase_client = FirebaseClient()
+    return _firebase_client
 
 
-# 싱글톤 인스턴스
-firebase_client = FirebaseClient()
\ No newline at end of file
+def __getattr__(name):
+    # `from firebase_client import firebase_client`도 처음 접근할 때 생성
+    if name == 'firebase_client':
+        return get_firebase_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+로컬 저장소 모듈
+동기화 사이에 유지해야 하는 작은 상태를 JSON 파일로 저장합니다.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from config import config
+
+
+class JsonStore:
+    """JSON 파일 기반 키-값 저장소 (스레드 안전)"""
+    
+    def __init__(self, filename):
+        """
+        Args:
+            filename (str): 캐시 디렉토리 안의 파일 이름
+        """
+        self.path = Path(config.CACHE_DIR) / filename
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._dirty = False
+    
+    def _load(self):
+        """파일에서 데이터 읽기 (없거나 깨졌으면 빈 dict)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️  로컬 저장소 로드 실패 ({self.path.name}): {e}")
+            return {}
+    
+    def get(self, key, default=None):
+        """값 조회"""
+        with self._lock:
+            return self._data.get(key, default)
+    
+    def set(self, key, value):
+        """값 저장 (save() 호출 전까지는 메모리에만 반영)"""
+        with self._lock:
+            self._data[key] = value
+            self._dirty = True
+    
+    def update(self, items):
+        """여러 값을 한 번에 저장"""
+        with self._lock:
+            self._data.update(items)
+            self._dirty = True
+    
+    def delete(self, key):
+        """값 삭제"""
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._dirty = True
+    
+    def keys(self):
+        """저장된 키 목록"""
+        with self._lock:
+            return list(self._data.keys())
+    
+    def save(self):
+        """
+        변경 사항을 파일에 기록
+        임시 파일에 쓴 뒤 교체하므로 중간에 중단돼도 기존 파일이 깨지지 않습니다.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except Exception as e:
+                print(f"⚠️  로컬 저장소 저장 실패 ({self.path.name}): {e}")
@@ -0,0 +1,364 @@
+"""
+동기화 계측 모듈
+단계별 / 피드별 / LLM 호출별 / Firestore 커밋별 소요 시간과 개수를 기록하고
+Prometheus 텍스트 형식으로 내보냅니다.
+
+동기화 1회 요약은 전역 지표의 차이가 아니라 RunMetrics에 따로 모읍니다.
+record_run() 범위 안의 스레드(와 bind_run()으로 넘긴 작업)가 기록한 값만 들어가므로
+여러 동기화가 동시에 실행돼도 서로의 값이 섞이지 않습니다.
+"""
+
+import bisect
+import contextlib
+import threading
+
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def _escape(value):
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=None):
+    """{name="value",...} 형식 라벨 문자열"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_number(value):
+    """Prometheus 숫자 표기 (정수는 소수점 없이)"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 스레드별로 지금 기록 중인 RunMetrics (바깥 범위부터)
+_active = threading.local()
+
+
+def _active_runs():
+    """현재 스레드의 RunMetrics 튜플"""
+    return getattr(_active, 'runs', ())
+
+
+class RunMetrics:
+    """동기화 1회(또는 수집 1회) 동안 기록된 카운터 / 히스토그램 값"""
+
+    def __init__(self):
+        self._values = {}  # 지표 이름 → {라벨 값 튜플: 값 또는 [합계, 개수]}
+        self._lock = threading.Lock()
+
+    def _add(self, name, key, amount):
+        """카운터 값 더하기"""
+        with self._lock:
+            values = self._values.setdefault(name, {})
+            values[key] = values.get(key, 0) + amount
+
+    def _observe(self, name, key, value):
+        """히스토그램 값 하나 기록"""
+        with self._lock:
+            state = self._values.setdefault(name, {}).setdefault(key, [0.0, 0])
+            state[0] += value
+            state[1] += 1
+
+    def values(self, name):
+        """
+        지표 하나의 값
+
+        Returns:
+            dict: {라벨 값 튜플: 누적 값} (히스토그램은 {라벨 값 튜플: (합계, 개수)})
+        """
+        with self._lock:
+            return {key: tuple(value) if isinstance(value, list) else value
+                    for key, value in self._values.get(name, {}).items()}
+
+
+@contextlib.contextmanager
+def record_run(run=None):
+    """
+    with 범위 안에서 현재 스레드가 기록하는 값을 run에도 모음
+
+    Args:
+        run (RunMetrics): 값을 모을 객체 (없으면 새로 생성)
+
+    Yields:
+        RunMetrics: 값을 모으는 객체
+    """
+    run = run or RunMetrics()
+    previous = _active_runs()
+    _active.runs = previous + (run,)
+    try:
+        yield run
+    finally:
+        _active.runs = previous
+
+
+def bind_run(function, run=None):
+    """
+    다른 스레드에서 실행할 함수가 지금 스레드의 RunMetrics(+ run)에 기록하도록 감쌈
+
+    스레드 / ThreadPoolExecutor에 넘기는 작업에 사용합니다.
+
+    Args:
+        function (callable): 감쌀 함수
+        run (RunMetrics): 추가로 값을 모을 객체 (선택)
+
+    Returns:
+        callable: 감싼 함수 (기록할 RunMetrics가 없으면 function 그대로)
+    """
+    runs = _active_runs() + ((run,) if run is not None else ())
+    if not runs:
+        return function
+
+    def bound(*args, **kwargs):
+        previous = _active_runs()
+        _active.runs = runs
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _active.runs = previous
+    return bound
+
+
+class Metric:
+    """라벨별 값을 가지는 지표 공통 부분"""
+
+    kind = None
+
+    def __init__(self, name, description, label_names=()):
+        """
+        Args:
+            name (str): 지표 이름 (diynews_ 접두사)
+            description (str): HELP에 표시할 설명
+            label_names (tuple): 라벨 이름
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        """라벨 dict → 라벨 값 튜플 (라벨 이름이 틀리면 ValueError)"""
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} 라벨은 {self.label_names}이어야 합니다: {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self):
+        """Prometheus 텍스트 형식 줄 목록"""
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key, value):
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_number(value)}"]
+
+
+class Counter(Metric):
+    """누적 개수"""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        """amount만큼 증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        for run in _active_runs():
+            run._add(self.name, key, amount)
+
+
+class Gauge(Metric):
+    """현재 값"""
+
+    kind = 'gauge'
+
+    def set(self, value, **labels):
+        """값 설정"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """값 분포 (구간별 개수 + 합계 + 개수)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, description, label_names=(), buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets (tuple): 구간 상한 (오름차순, +Inf는 자동 추가)
+        """
+        super().__init__(name, description, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        """값 하나 기록"""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+        for run in _active_runs():
+            run._observe(self.name, key, value)
+
+    def _render_value(self, key, state):
+        counts, total, count = state
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts + [count - sum(counts)]):
+            cumulative += bucket_count
+            labels = _format_labels(self.label_names, key, f'le="{_format_number(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.label_names, key)
+        lines.append(f"{self.name}_sum{labels} {_format_number(round(total, 6))}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, description, label_names=()):
+        return self._register(Counter(name, description, label_names))
+
+    def gauge(self, name, description, label_names=()):
+        return self._register(Gauge(name, description, label_names))
+
+    def histogram(self, name, description, label_names=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, description, label_names, buckets))
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self):
+        """
+        Prometheus 텍스트 형식 (/api/metrics 응답 본문)
+
+        Returns:
+            str: 모든 지표
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# 싱글톤 인스턴스
+metrics = MetricsRegistry()
+
+# ---- 지표 정의 ----
+
+SYNC_RUNS = metrics.counter(
+    'diynews_sync_runs_total', '끝난 동기화 실행 수', ('status',))
+SYNC_SECONDS = metrics.histogram(
+    'diynews_sync_duration_seconds', '동기화 1회 전체 소요 시간', ('status',),
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800))
+STAGE_BATCH_SECONDS = metrics.histogram(
+    'diynews_stage_batch_seconds', '파이프라인 단계가 묶음 하나를 처리한 시간', ('stage',))
+STAGE_ITEMS = metrics.counter(
+    'diynews_stage_items_total', '파이프라인 단계가 처리한 게시물 수', ('stage', 'direction'))
+
+FEED_FETCH_SECONDS = metrics.histogram(
+    'diynews_feed_fetch_seconds', '피드 하나를 받아서 파싱하는 데 걸린 시간', ('host', 'status'))
+FEED_BYTES = metrics.counter(
+    'diynews_feed_bytes_total', '받은 피드 본문 크기 (압축 해제 후)', ('host',))
+FEED_ENTRIES = metrics.counter(
+    'diynews_feed_entries_total', '파싱한 피드 항목 수', ('host',))
+
+LLM_REQUEST_SECONDS = metrics.histogram(
+    'diynews_llm_request_seconds', 'LLM 요청 하나의 응답 시간', ('model', 'outcome'))
+LLM_TOKENS = metrics.counter(
+    'diynews_llm_tokens_total', 'LLM 사용 토큰 수', ('model', 'kind'))
+
+FIRESTORE_COMMIT_SECONDS = metrics.histogram(
+    'diynews_firestore_commit_seconds', 'Firestore 배치 커밋 하나의 소요 시간', ('collection', 'outcome'))
+FIRESTORE_WRITES = metrics.counter(
+    'diynews_firestore_writes_total', 'Firestore 배치 커밋에 담긴 쓰기 수', ('collection', 'outcome'))
+
+HTTP_REQUESTS = metrics.counter(
+    'diynews_http_requests_total', '공용 HTTP 연결 풀로 보낸 요청 수 (리다이렉트 포함)', ('host',))
+HTTP_CONNECTIONS = metrics.counter(
+    'diynews_http_connections_total', '새로 맺은 HTTP 연결 수 (TCP+TLS 핸드셰이크)', ('host',))
+
+SYNC_JOBS = metrics.gauge(
+    'diynews_sync_jobs', '상태별 동기화 작업 수', ('state',))
+
+
+def summarize(run):
+    """
+    RunMetrics로 동기화 1회 요약 만들기
+
+    Args:
+        run (RunMetrics): record_run()으로 모은 이번 실행의 값
+
+    Returns:
+        dict: {feeds, llm, firestore} 요약
+    """
+    values = run.values
+
+    fetches = values(FEED_FETCH_SECONDS.name)
+    hosts = {}
+    for (host, status), (seconds, count) in fetches.items():
+        entry = hosts.setdefault(host, {'host': host, 'requests': 0, 'seconds': 0.0})
+        entry['requests'] += count
+        entry['seconds'] += seconds
+    slowest = sorted(hosts.values(), key=lambda entry: entry['seconds'], reverse=True)[:5]
+
+    llm_requests = values(LLM_REQUEST_SECONDS.name)
+    llm_tokens = values(LLM_TOKENS.name)
+    commits = values(FIRESTORE_COMMIT_SECONDS.name)
+    writes = values(FIRESTORE_WRITES.name)
+
+    return {
+        'feeds': {
+            'requests': sum(count for _, count in fetches.values()),
+            'notModified': sum(count for (_, status), (_, count) in fetches.items() if status == '304'),
+            'errors': sum(count for (_, status), (_, count) in fetches.items() if status == 'error'),
+            'seconds': round(sum(seconds for seconds, _ in fetches.values()), 3),
+            'bytes': sum(values(FEED_BYTES.name).values()),
+            'entries': sum(values(FEED_ENTRIES.name).values()),
+            'slowestHosts': [
+                {**entry, 'seconds': round(entry['seconds'], 3)} for entry in slowest
+            ],
+        },
+        'llm': {
+            'requests': sum(count for (_, outcome), (_, count) in llm_requests.items() if outcome == 'ok'),
+            'failures': sum(count for (_, outcome), (_, count) in llm_requests.items() if outcome != 'ok'),
+            'seconds': round(sum(seconds for seconds, _ in llm_requests.values()), 3),
+            'promptTokens': sum(count for (_, kind), count in llm_tokens.items() if kind == 'prompt'),
+            'completionTokens': sum(count for (_, kind), count in llm_tokens.items() if kind == 'completion'),
+        },
+        'firestore': {
+            'commits': sum(count for _, count in commits.values()),
+            'seconds': round(sum(seconds for seconds, _ in commits.values()), 3),
+            'writes': sum(count for (_, outcome), count in writes.items() if outcome == 'ok'),
+            'failedWrites': sum(count for (_, outcome), count in writes.items() if outcome == 'error'),
+        },
+    }
@@ -0,0 +1,172 @@
+"""
+구독별 적응형 수집 스케줄러
+피드마다 관측한 게시 주기로 다음 수집 시점을 정해서, 수집할 때가 된 피드만 가져옵니다.
+"""
+
+from datetime import datetime, timedelta
+from dateutil import parser as date_parser
+from config import config
+from fetchers.feed_dates import parse_iso8601
+
+
+class PollScheduler:
+    """게시 주기 기반 수집 스케줄러"""
+
+    # 게시 주기 이동 평균에서 새 관측값의 비중
+    SMOOTHING = 0.3
+
+    def __init__(self, enabled=None, min_interval_minutes=None, max_interval_hours=None, interval_factor=None):
+        """
+        Args:
+            enabled (bool): 스케줄러 사용 여부 (False면 매번 모든 피드 수집)
+            min_interval_minutes (int): 같은 피드를 다시 수집하기까지 최소 간격 (분)
+            max_interval_hours (int): 최대 수집 간격 = 허용하는 최대 지연 (시간)
+            interval_factor (float): 예상 게시 주기에 곱할 비율 (작을수록 자주 수집)
+        """
+        self.enabled = config.POLL_SCHEDULER if enabled is None else enabled
+        self.min_interval = timedelta(minutes=min_interval_minutes or config.POLL_MIN_INTERVAL_MINUTES)
+        self.max_interval = timedelta(hours=max_interval_hours or config.POLL_MAX_INTERVAL_HOURS)
+        self.interval_factor = interval_factor or config.POLL_INTERVAL_FACTOR
+
+    def select_due(self, subscriptions, force=False, now=None):
+        """
+        이번 동기화에서 수집할 구독 고르기
+
+        Args:
+            subscriptions (list): 구독 정보 리스트
+            force (bool): True면 일정과 관계없이 모두 수집
+            now (datetime): 기준 시각 (테스트용)
+
+        Returns:
+            tuple: (수집할 구독 리스트, 건너뛴 구독 리스트)
+                수집할 구독은 지난번 수집이 오래 걸린 피드부터 정렬
+        """
+        if force or not self.enabled:
+            return list(subscriptions), []
+
+        now = now or datetime.now()
+        due, skipped = [], []
+        for sub in subscriptions:
+            next_poll = self._next_poll_at(sub)
+            if next_poll is None or next_poll <= now:
+                due.append(sub)
+            else:
+                skipped.append(sub)
+
+        # 느린 피드를 먼저 시작해서 전체 수집 시간의 꼬리를 줄임
+        due.sort(key=lambda sub: sub.get('fetchDurationMs') or 0, reverse=True)
+
+        if skipped:
+            print(f"⏭️  수집 일정 전인 구독 {len(skipped)}개 건너뜀 (수집 대상 {len(due)}개)")
+        return due, skipped
+
+    def next_state(self, sub, post_times=(), fetch_seconds=None, now=None):
+        """
+        수집 결과로 구독의 스케줄 상태 계산
+
+        Args:
+            sub (dict): 구독 정보 (이전 상태 포함)
+            post_times (iterable): 이번에 받은 게시물들의 작성 시각
+            fetch_seconds (float): 피드를 받는 데 걸린 시간 (초)
+            now (datetime): 기준 시각 (테스트용)
+
+        Returns:
+            dict: 구독 문서에 저장할 필드
+                (lastSyncedAt, lastPostAt, avgPostIntervalHours, pollIntervalMinutes, emptyPolls, fetchDurationMs)
+        """
+        now = now or datetime.now()
+        last_post_at = self._parse_time(sub.get('lastPostAt'))
+        avg_hours = sub.get('avgPostIntervalHours')
+        empty_polls = sub.get('emptyPolls') or 0
+
+        # 미래 시각으로 표시된 게시물은 지금으로 취급
+        post_times = [min(t, now) for t in (self._to_local(t) for t in post_times) if t is not None]
+        newer = [t for t in post_times if last_post_at is None or t > last_post_at]
+
+        if newer:
+            newest_post_at = max(newer)
+            sample = None
+            if last_post_at is not None:
+                # 지난번 이후 게시물이 여러 개면 그만큼 주기가 짧음
+                sample = (newest_post_at - last_post_at).total_seconds() / 3600 / len(newer)
+            elif len(newer) > 1:
+                # 처음 수집한 피드는 받은 게시물들의 간격으로 시작
+                sample = (newest_post_at - min(newer)).total_seconds() / 3600 / (len(newer) - 1)
+            if sample is not None:
+                avg_hours = sample if avg_hours is None else (
+                    self.SMOOTHING * sample + (1 - self.SMOOTHING) * avg_hours
+                )
+            last_post_at = newest_post_at
+            empty_polls = 0
+        else:
+            empty_polls += 1
+
+        interval = self._interval(avg_hours, last_post_at, empty_polls, now)
+        state = {
+            'lastSyncedAt': now.isoformat(),
+            'pollIntervalMinutes': round(interval.total_seconds() / 60),
+            'emptyPolls': empty_polls,
+        }
+        if last_post_at is not None:
+            state['lastPostAt'] = last_post_at.isoformat()
+        if avg_hours is not None:
+            state['avgPostIntervalHours'] = round(avg_hours, 2)
+        if fetch_seconds is not None:
+            state['fetchDurationMs'] = round(fetch_seconds * 1000)
+        return state
+
+    def _interval(self, avg_hours, last_post_at, empty_polls, now):
+        """
+        다음 수집까지 간격
+
+        예상 게시 주기와 마지막 게시 후 지난 시간 중 긴 쪽을 기준으로 해서,
+        평소보다 오래 조용한 피드는 점점 덜 자주 수집합니다.
+        게시물을 한 번도 보지 못한 피드는 빈 수집이 이어질 때마다 간격을 두 배로 늘립니다.
+        """
+        expected_hours = avg_hours or 0
+        if last_post_at is not None:
+            expected_hours = max(expected_hours, (now - last_post_at).total_seconds() / 3600)
+
+        interval = timedelta(hours=expected_hours * self.interval_factor)
+        if last_post_at is None:
+            interval = max(interval, self.min_interval * (2 ** min(empty_polls, 16)))
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def _next_poll_at(self, sub):
+        """다음 수집 시각 (기록이 없으면 None = 바로 수집)"""
+        last_synced = self._parse_time(sub.get('lastSyncedAt'))
+        if last_synced is None:
+            return None
+
+        interval_minutes = sub.get('pollIntervalMinutes')
+        if interval_minutes is None:
+            return None
+
+        interval = min(max(timedelta(minutes=interval_minutes), self.min_interval), self.max_interval)
+        return last_synced + interval
+
+    def _parse_time(self, value):
+        """저장된 시각 문자열을 로컬 naive datetime으로 변환"""
+        if not value:
+            return None
+        try:
+            if isinstance(value, str):
+                # 저장된 값은 isoformat()이므로 대부분 빠른 경로로 읽힘
+                value = parse_iso8601(value) or date_parser.parse(value)
+            return self._to_local(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    def _to_local(self, value):
+        """시간대가 있는 시각은 로컬 시각으로 바꾸고 시간대 정보 제거"""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return self._parse_time(value)
+        if value.tzinfo:
+            return value.astimezone().replace(tzinfo=None)
+        return value
+
+
+# 싱글톤 인스턴스
+poll_scheduler = PollScheduler()
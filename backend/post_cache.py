@@ -0,0 +1,121 @@
+"""
+게시물 조회 캐시
+/api/posts 응답 페이지를 메모리에 보관해서, 같은 피드를 다시 열 때 Firestore를 읽지 않습니다.
+게시물이 저장되면 해당 사용자의 페이지를 모두 지웁니다.
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from config import config
+
+
+class PostPage:
+    """캐시된 응답 페이지 하나 (직렬화된 본문 + ETag 값)"""
+
+    def __init__(self, payload):
+        """
+        Args:
+            payload (dict): 응답 본문 {posts, nextCursor, ...}
+        """
+        self.payload = payload
+        self.body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.etag = hashlib.sha1(self.body).hexdigest()[:20]
+        self._gzipped = None
+
+    @property
+    def gzipped(self):
+        """gzip으로 압축한 본문 (처음 요청할 때 한 번만 압축)"""
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6)
+        return self._gzipped
+
+
+class PostPageCache:
+    """TTL + LRU 게시물 페이지 캐시"""
+
+    def __init__(self, ttl_seconds=None, max_entries=None):
+        """
+        Args:
+            ttl_seconds (int): 페이지를 보관할 시간 (초)
+            max_entries (int): 보관할 최대 페이지 수 (넘으면 오래 안 쓴 것부터 삭제)
+        """
+        self.ttl_seconds = config.POSTS_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_entries = max_entries or config.POSTS_CACHE_MAX_ENTRIES
+
+        self._pages = OrderedDict()  # (userId, platform, cursor, limit) → (만료 시각, PostPage)
+        self._generations = {}       # userId → 무효화 횟수 (조회 중에 저장되면 결과를 캐시하지 않기 위함)
+        self._generation = 0         # 전체 무효화 횟수
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, user_id, platform, cursor, limit, loader):
+        """
+        캐시된 페이지를 반환하고, 없으면 loader로 만들어서 보관
+
+        Args:
+            user_id (str): 사용자 ID
+            platform (str): 플랫폼 필터 (None이면 전체)
+            cursor (str): 페이지 커서 (None이면 첫 페이지)
+            limit (int): 페이지 크기
+            loader (callable): 페이지 본문 dict를 만드는 함수
+
+        Returns:
+            tuple: (PostPage, 캐시 적중 여부)
+        """
+        key = (user_id, platform, cursor, limit)
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return cached[1], True
+            self.misses += 1
+            generation = self._generation_of(user_id)
+
+        page = PostPage(loader())
+
+        with self._lock:
+            # 조회하는 동안 새 게시물이 저장됐으면 오래된 결과이므로 보관하지 않음
+            if self.ttl_seconds > 0 and generation == self._generation_of(user_id):
+                self._pages[key] = (time.monotonic() + self.ttl_seconds, page)
+                self._pages.move_to_end(key)
+                while len(self._pages) > self.max_entries:
+                    self._pages.popitem(last=False)
+        return page, False
+
+    def invalidate(self, user_ids=None):
+        """
+        캐시된 페이지 삭제
+
+        Args:
+            user_ids (iterable): 게시물이 바뀐 사용자 ID 목록 (None이 들어 있거나 생략하면 전체 삭제)
+        """
+        user_ids = None if user_ids is None else set(user_ids)
+        with self._lock:
+            if user_ids is None or None in user_ids:
+                self._pages.clear()
+                self._generation += 1
+                return
+
+            for key in [key for key in self._pages if key[0] in user_ids]:
+                del self._pages[key]
+            for user_id in user_ids:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def stats(self):
+        """캐시 통계 {pages, hits, misses}"""
+        with self._lock:
+            return {'pages': len(self._pages), 'hits': self.hits, 'misses': self.misses}
+
+    def _generation_of(self, user_id):
+        """사용자별 + 전체 무효화 횟수 (_lock 안에서 호출)"""
+        return self._generation, self._generations.get(user_id, 0)
+
+
+# 싱글톤 인스턴스
+post_page_cache = PostPageCache()
@@ -0,0 +1,77 @@
+"""
+게시물 문서 ID 모듈
+정규화한 URL의 해시로 게시물 문서 ID를 만들어서
+같은 게시물은 항상 같은 문서에 저장되도록 합니다.
+"""
+
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+# 게시물을 구분하는 데 쓰이지 않는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'ref', 'ref_src', 'feature', 'si'}
+
+# 같은 사이트의 다른 도메인
+HOST_ALIASES = {
+    'x.com': 'twitter.com',
+    'youtu.be': 'youtube.com',
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    게시물 URL 정규화
+    
+    - 스킴은 https, 호스트는 소문자로 통일하고 www. / m. 접두어 제거
+    - 프래그먼트와 utm_* 등 추적용 쿼리 파라미터 제거
+    - 남은 쿼리 파라미터는 정렬, 경로 끝의 / 제거
+    
+    Args:
+        url (str): 원본 URL
+        
+    Returns:
+        str: 정규화된 URL
+    """
+    if not url:
+        return ''
+    
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    host = HOST_ALIASES.get(host, host)
+    
+    path = parts.path.rstrip('/') or '/'
+    
+    # youtu.be/VIDEO_ID → youtube.com/watch?v=VIDEO_ID
+    query_items = parse_qsl(parts.query, keep_blank_values=True)
+    if parts.netloc.lower().endswith('youtu.be') and path != '/':
+        query_items.append(('v', path.lstrip('/')))
+        path = '/watch'
+    
+    query_items = sorted(
+        (key, value) for key, value in query_items
+        if key not in TRACKING_PARAMS and not key.startswith('utm_')
+    )
+    
+    return urlunsplit(('https', host, path, urlencode(query_items), ''))
+
+
+def post_doc_id(url: str, user_id: str = None) -> str:
+    """
+    게시물 문서 ID 생성
+    
+    게시물은 사용자별 문서이므로 같은 URL이라도 사용자가 다르면 다른 ID가 됩니다.
+    
+    Args:
+        url (str): 게시물 URL
+        user_id (str): 게시물을 받을 사용자 ID
+        
+    Returns:
+        str: 40자리 16진수 문서 ID
+    """
+    key = canonicalize_url(url)
+    if user_id:
+        key = f"{user_id}\n{key}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
@@ -0,0 +1,175 @@
+"""
+게시물 색인 모듈
+이미 저장된 게시물의 문서 ID를 로컬 SQLite에 보관해서 중복 체크 때
+Firestore posts 컬렉션 전체를 읽지 않도록 합니다.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from config import config
+
+
+class BloomFilter:
+    """키 존재 여부를 빠르게 걸러내는 블룸 필터"""
+    
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Args:
+            capacity (int): 예상 원소 수
+            error_rate (float): 허용 오탐률
+        """
+        capacity = max(capacity, 1000)
+        # m = -n·ln(p) / (ln2)^2, k = m/n · ln2
+        self.size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2)) + 1
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(self.size // 8 + 1)
+    
+    def _positions(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class PostIndex:
+    """저장된 게시물 문서 ID 로컬 색인"""
+    
+    def __init__(self, path=None, use_bloom=None):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (기본: 캐시 디렉토리/post_index.sqlite3)
+            use_bloom (bool): 블룸 필터 사용 여부
+        """
+        self.path = Path(path or Path(config.CACHE_DIR) / 'post_index.sqlite3')
+        self.use_bloom = config.POST_INDEX_BLOOM if use_bloom is None else use_bloom
+        self._lock = threading.Lock()
+        self._bloom = None
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            # URL 기준이던 이전 색인은 문서 ID 색인으로 대체됨
+            conn.execute("DROP TABLE IF EXISTS post_urls")
+            conn.execute("CREATE TABLE IF NOT EXISTS post_ids (id TEXT PRIMARY KEY)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+    
+    def _connect(self):
+        return sqlite3.connect(str(self.path), timeout=30)
+    
+    def is_built(self) -> bool:
+        """Firestore에서 한 번이라도 색인을 만들었는지 여부"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'ids_built_at'").fetchone()
+        return row is not None
+    
+    def count(self) -> int:
+        """색인된 게시물 수"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM post_ids").fetchone()[0]
+    
+    def rebuild(self, post_ids):
+        """
+        색인 전체를 다시 생성
+        
+        Args:
+            post_ids (iterable): 저장된 모든 게시물 문서 ID
+            
+        Returns:
+            int: 색인된 게시물 수
+        """
+        with self._lock:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM post_ids")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO post_ids (id) VALUES (?)",
+                    ((post_id,) for post_id in post_ids if post_id)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('ids_built_at', ?)",
+                    (datetime.now().isoformat(),)
+                )
+            self._bloom = None
+        
+        total = self.count()
+        print(f"🗂️  게시물 색인 재생성 완료: {total}개")
+        return total
+    
+    def add_many(self, post_ids):
+        """
+        새로 저장한 게시물 추가
+        
+        Args:
+            post_ids (iterable): 게시물 문서 ID 목록
+        """
+        post_ids = [post_id for post_id in post_ids if post_id]
+        if not post_ids:
+            return
+        
+        with self._lock:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO post_ids (id) VALUES (?)",
+                    ((post_id,) for post_id in post_ids)
+                )
+            if self._bloom is not None:
+                for post_id in post_ids:
+                    self._bloom.add(post_id)
+    
+    def _get_bloom(self):
+        """블룸 필터 (처음 사용할 때 SQLite에서 생성)"""
+        if self._bloom is None:
+            with self._connect() as conn:
+                total = conn.execute("SELECT COUNT(*) FROM post_ids").fetchone()[0]
+                bloom = BloomFilter(total * 2)
+                for (post_id,) in conn.execute("SELECT id FROM post_ids"):
+                    bloom.add(post_id)
+            self._bloom = bloom
+        return self._bloom
+    
+    def find_existing(self, post_ids) -> set:
+        """
+        색인에 이미 있는 게시물만 골라내기
+        
+        Args:
+            post_ids (iterable): 확인할 게시물 문서 ID 목록
+            
+        Returns:
+            set: 이미 저장된 게시물 문서 ID 집합
+        """
+        candidates = {post_id for post_id in post_ids if post_id}
+        
+        with self._lock:
+            if self.use_bloom:
+                # 블룸 필터에 없으면 확실히 새 게시물
+                bloom = self._get_bloom()
+                candidates = {post_id for post_id in candidates if post_id in bloom}
+        
+        if not candidates:
+            return set()
+        
+        existing = set()
+        candidates = list(candidates)
+        with self._connect() as conn:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for i in range(0, len(candidates), 500):
+                chunk = candidates[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT id FROM post_ids WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                existing.update(row[0] for row in rows)
+        return existing
+
+
+# 싱글톤 인스턴스
+post_index = PostIndex()
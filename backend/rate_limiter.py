@@ -0,0 +1,83 @@
+"""
+요청 속도 제한 모듈
+분당 요청 수 / 분당 토큰 수를 토큰 버킷으로 제한합니다.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 (분당 보충량 기준)"""
+    
+    def __init__(self, per_minute):
+        """
+        Args:
+            per_minute (float): 분당 보충되는 양 (버킷 크기도 같음)
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+    
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def wait_time(self, amount, now):
+        """amount만큼 꺼내려면 기다려야 하는 시간 (초)"""
+        self._refill(now)
+        # 버킷보다 큰 요청은 가득 찼을 때 통과시킴
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+    
+    def consume(self, amount):
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """분당 요청 수 + 분당 토큰 수 제한기 (스레드 안전)"""
+    
+    def __init__(self, requests_per_minute, tokens_per_minute):
+        """
+        Args:
+            requests_per_minute (int): 분당 최대 요청 수
+            tokens_per_minute (int): 분당 최대 토큰 수
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+    
+    def acquire(self, tokens=0):
+        """
+        요청 하나를 보낼 수 있을 때까지 대기
+        
+        Args:
+            tokens (int): 이번 요청의 예상 토큰 수
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = max(
+                    self._paused_until - now,
+                    self.requests.wait_time(1, now),
+                    self.tokens.wait_time(tokens, now),
+                )
+                if wait <= 0:
+                    self.requests.consume(1)
+                    self.tokens.consume(tokens)
+                    return
+            time.sleep(min(wait, 1.0))
+    
+    def pause(self, seconds):
+        """
+        모든 요청을 잠시 멈춤 (429 응답의 Retry-After 반영)
+        
+        Args:
+            seconds (float): 멈출 시간 (초)
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
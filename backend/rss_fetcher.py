@@ -4,90 +4,366 @@ RSS 피드 통합 관리자
 """
 
 # 수정
-from fetchers.blog_fetcher import BlogFetcher
-from fetchers.youtube_fetcher import YouTubeFetcher
-from fetchers.twitter_fetcher import TwitterFetcher
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from fetchers.feed_cache import FeedValidatorCache
+from local_store import JsonStore
+from metrics import HTTP_CONNECTIONS, HTTP_REQUESTS, RunMetrics, bind_run
+from post_ids import canonicalize_url
 from config import config
 
 
 class RSSFetcher:
     """RSS 피드 통합 관리 클래스"""
     
-    def __init__(self, days_to_fetch=None, max_entries=3):
+    def __init__(self, days_to_fetch=None, max_entries=3, max_workers=None, per_host_limit=None,
+                 transport=None, feed_store=None, channel_id_cache=None):
         """
         Args:
             days_to_fetch (int): 수집할 최근 일수
             max_entries (int): 최대 수집 게시물 수
+            max_workers (int): 병렬 수집 워커 수
+            per_host_limit (int): 호스트당 최대 동시 요청 수
+            transport (HttpTransport): 공유할 HTTP 연결 풀 (없으면 새로 생성)
+            feed_store (JsonStore): 공유할 피드 검증값 저장소 (없으면 새로 생성)
+            channel_id_cache (JsonStore): 공유할 YouTube 채널 ID 캐시 (없으면 새로 생성)
         """
         self.max_entries = max_entries
         self.days_to_fetch = days_to_fetch or config.DAYS_TO_FETCH
+        self.max_workers = max_workers or config.FETCH_MAX_WORKERS
+        self.per_host_limit = per_host_limit or config.FETCH_PER_HOST_LIMIT
+        self.last_cache_stats = {'hits': 0, 'misses': 0}
+        self.last_transport_stats = {'requests': 0, 'connections': 0}
+        self.last_fanout_stats = {'subscriptions': 0, 'feeds': 0}
+        self.last_fetch_seconds = {}  # 구독 ID → 피드를 받는 데 걸린 시간 (초)
+        
+        # 플랫폼별 Fetcher는 feedparser / requests를 불러오므로 처음 만들 때 import
+        from fetchers.blog_fetcher import BlogFetcher
+        from fetchers.youtube_fetcher import YouTubeFetcher
+        from fetchers.twitter_fetcher import TwitterFetcher
+        from fetchers.http_transport import HttpTransport
+        
+        # 피드 조건부 요청 캐시 (ETag / Last-Modified)
+        self.feed_cache = FeedValidatorCache(feed_store)
+        
+        # 모든 Fetcher가 공유하는 HTTP 연결 풀 (호스트당 최대 동시 요청 수만큼 연결 유지)
+        self.transport = transport or HttpTransport(pool_size=self.per_host_limit)
+        self.channel_id_cache = channel_id_cache or JsonStore('youtube_channel_ids.json')
         
         # 플랫폼별 Fetcher 등록
         self.fetchers = [
-        BlogFetcher(self.days_to_fetch, self.max_entries),
-        YouTubeFetcher(self.days_to_fetch, self.max_entries),
-        TwitterFetcher(self.days_to_fetch, self.max_entries),
+        BlogFetcher(self.days_to_fetch, self.max_entries, self.feed_cache, self.transport),
+        YouTubeFetcher(self.days_to_fetch, self.max_entries, self.feed_cache, self.transport, self.channel_id_cache),
+        TwitterFetcher(self.days_to_fetch, self.max_entries, self.feed_cache, self.transport),
            
         ]
         
         print(f"✅ {len(self.fetchers)}개 플랫폼 Fetcher 초기화 완료")
     
-    def fetch_feed(self, url: str) -> list:
+    def for_run(self):
+        """
+        동기화 1회용 Fetcher 생성
+        
+        연결 풀과 캐시 파일은 공유하고, 이번 실행의 통계와 아직 저장하지 않은
+        피드 검증값만 따로 가집니다. 여러 동기화를 동시에 실행해도 서로의
+        검증값을 버리거나 먼저 저장하지 않습니다.
+        
+        Returns:
+            RSSFetcher: 새 Fetcher
+        """
+        return RSSFetcher(
+            self.days_to_fetch, self.max_entries, self.max_workers, self.per_host_limit,
+            transport=self.transport,
+            feed_store=self.feed_cache.store,
+            channel_id_cache=self.channel_id_cache,
+        )
+    
+    def fetch_feed(self, url: str, since: dict = None, subscriptions: list = None) -> list:
         """
         URL에 맞는 Fetcher를 찾아서 피드 수집
         
         Args:
             url (str): 피드 URL
+            since (dict): 이미 수집한 가장 최근 게시물 {id, publishedAt} (여기 도달하면 중단)
+            subscriptions (list): 이 피드로 게시물을 받을 구독들 (조건부 요청 판단용, 없으면 전체 수집)
             
         Returns:
             list: 게시물 리스트
         """
         # 적합한 Fetcher 찾기
-        for fetcher in self.fetchers:
-            if fetcher.can_handle(url):
-                return fetcher.fetch_feed(url)
+        fetcher = self._find_fetcher(url)
+        if fetcher:
+            return fetcher.fetch_feed(url, since, subscriptions)
         
         # 처리할 수 없는 URL
         print(f"❌ 지원하지 않는 플랫폼: {url}")
         return []
     
-    def fetch_multiple_feeds(self, subscriptions: list) -> dict:
+    def _find_fetcher(self, url: str):
+        """URL을 처리할 수 있는 Fetcher 반환 (없으면 None)"""
+        for fetcher in self.fetchers:
+            if fetcher.can_handle(url):
+                return fetcher
+        return None
+    
+    def _host_of(self, url: str) -> str:
+        """호스트별 동시 요청 제한에 사용할 키"""
+        fetcher = self._find_fetcher(url)
+        if fetcher:
+            return fetcher.get_host(url)
+        return url
+    
+    def _attach_subscription(self, posts: list, sub: dict) -> list:
+        """게시물에 구독 정보 추가"""
+        for post in posts:
+            post['subscription_id'] = sub.get('id')
+            post['platform'] = sub.get('platform', 'blog')
+            post['author'] = sub.get('name')
+            post['accountId'] = sub.get('accountId')
+            post['userId'] = sub.get('userId')
+        return posts
+    
+    def _feed_key(self, url: str) -> str:
+        """같은 피드를 구독한 구독들을 묶을 키 (정규화된 URL)"""
+        try:
+            return canonicalize_url(url)
+        except Exception:
+            return url
+    
+    def _group_mark(self, group: list) -> dict:
+        """
+        같은 피드를 구독한 구독들 중 가장 오래된 high-water mark
+        
+        한 구독이라도 기록이 없거나, 시각을 읽을 수 없거나, 시간대가 없는 예전 기록이면
+        None (처음부터 수집). publishedAt은 시간대가 다를 수 있어서 문자열이 아니라 시각으로 비교합니다.
+        """
+        from fetchers.feed_dates import parse_iso8601
+        
+        oldest, oldest_time = None, None
+        for sub in group:
+            mark = sub.get('highWaterMark')
+            mark_time = parse_iso8601(mark.get('publishedAt')) if mark else None
+            if mark_time is None or mark_time.tzinfo is None:
+                return None
+            if oldest_time is None or mark_time < oldest_time:
+                oldest, oldest_time = mark, mark_time
+        return oldest
+    
+    def next_high_water_mark(self, posts: list) -> dict:
+        """
+        이번에 수집한 게시물로 구독의 새 high-water mark 계산
+        
+        Args:
+            posts (list): 이번에 구독 하나로 수집한 게시물
+            
+        Returns:
+            dict: {id, publishedAt} (새 게시물이 없으면 None = 기존 값 유지)
+        """
+        from fetchers.base_fetcher import BaseFetcher
+        return BaseFetcher.high_water_mark(posts)
+    
+    def _fetch_subscription(self, sub: dict, since: dict = None, group: list = None) -> list:
+        """
+        구독 하나의 피드 수집 (예외는 빈 리스트로 처리)
+        
+        group은 같은 피드를 받을 구독 전체입니다. 조건부 요청은 이 구독들이
+        모두 지난번 수집에 포함됐을 때만 보냅니다.
+        """
+        print(f"\n📡 [{sub.get('name')}] 수집 시작...")
+        started = time.monotonic()
+        try:
+            return self.fetch_feed(sub.get('rssUrl'), since, group or [sub])
+        except Exception as e:
+            print(f"❌ [{sub.get('name')}] 수집 실패: {e}")
+            return []
+        finally:
+            self.last_fetch_seconds[sub.get('id')] = time.monotonic() - started
+    
+    def fetch_multiple_feeds(self, subscriptions: list, parallel=True) -> dict:
         """
         여러 구독의 피드를 한 번에 수집
         
+        같은 피드 URL을 구독한 사용자가 여럿이면 피드는 한 번만 받고,
+        게시물을 구독마다 복사해서 각 사용자 정보를 붙입니다.
+        
         Args:
             subscriptions (list): 구독 정보 리스트
+            parallel (bool): 병렬 수집 여부 (False면 한 개씩 순서대로)
             
         Returns:
             dict: {subscription_id: [posts]} 형태
         """
-        all_posts = {}
+        results = {}
+        for feed_posts in self.iter_feeds(subscriptions, parallel):
+            results.update(feed_posts)
         
-        for sub in subscriptions:
-            sub_id = sub.get('id')
-            rss_url = sub.get('rssUrl')
+        # 구독 순서 유지
+        return {sub.get('id'): results[sub.get('id')] for sub in subscriptions if sub.get('id') in results}
+    
+    def iter_feeds(self, subscriptions: list, parallel=True):
+        """
+        피드를 수집하면서 끝나는 순서대로 결과를 하나씩 반환 (제너레이터)
+        
+        먼저 끝난 피드의 게시물을 바로 다음 단계로 넘길 수 있습니다.
+        받는 쪽이 처리하는 동안에는 새 피드 요청을 제출하지 않으므로
+        동시에 메모리에 올라가는 피드 수도 제한됩니다.
+        
+        Args:
+            subscriptions (list): 구독 정보 리스트
+            parallel (bool): 병렬 수집 여부 (False면 한 개씩 순서대로)
             
-            if not rss_url:
+        Yields:
+            dict: 피드 하나의 {subscription_id: [posts]} (같은 피드의 모든 구독 포함)
+        """
+        from fetchers.base_fetcher import BaseFetcher
+        
+        # 이전 실행에서 저장하지 못한 검증값은 버림
+        self.feed_cache.discard()
+        cache_before = self.feed_cache.stats()
+        self.last_fetch_seconds = {}
+        
+        # 연결 풀은 다른 동기화와 공유하므로, 이번 수집이 보낸 요청 / 맺은 연결만 따로 셈
+        run_metrics = RunMetrics()
+        fetch = bind_run(self._fetch_subscription, run_metrics)
+        
+        # 같은 피드를 구독한 구독끼리 묶기 (피드 URL 정규화 기준)
+        groups = {}
+        for sub in subscriptions:
+            if not sub.get('rssUrl'):
                 print(f"⚠️  RSS URL 없음: {sub.get('name')}")
                 continue
-            
-            print(f"\n📡 [{sub.get('name')}] 수집 시작...")
-            posts = self.fetch_feed(rss_url)
-            
-            # 구독 정보 추가
-            for post in posts:
-                post['subscription_id'] = sub_id
-                post['platform'] = sub.get('platform', 'blog')
-                post['author'] = sub.get('name')
-                post['accountId'] = sub.get('accountId')
-            
-            all_posts[sub_id] = posts
+            groups.setdefault(self._feed_key(sub.get('rssUrl')), []).append(sub)
+        
+        # 피드마다 대표 구독 하나만 수집
+        targets = [group[0] for group in groups.values()]
+        groups_by_target = {group[0].get('id'): group for group in groups.values()}
+        marks = {target_id: self._group_mark(group) for target_id, group in groups_by_target.items()}
+        subscription_count = sum(len(group) for group in groups.values())
+        self.last_fanout_stats = {'subscriptions': subscription_count, 'feeds': len(targets)}
+        if subscription_count > len(targets):
+            print(f"🔗 구독 {subscription_count}개 → 고유 피드 {len(targets)}개만 수집")
+        
+        if parallel and self.max_workers > 1 and len(targets) > 1:
+            completed = self._fetch_parallel(targets, marks, fetch, groups_by_target)
+        else:
+            completed = ((sub, fetch(sub, marks[sub.get('id')], groups_by_target[sub.get('id')])) for sub in targets)
+        
+        total_posts = 0
+        for target, posts in completed:
+            # 수집 결과를 같은 피드의 모든 구독에 복사
+            feed_posts = {}
+            fetch_seconds = self.last_fetch_seconds.get(target.get('id'))
+            for sub in groups_by_target[target.get('id')]:
+                self.last_fetch_seconds[sub.get('id')] = fetch_seconds
+                # 이 구독이 이미 받은 게시물은 제외 (피드는 가장 오래된 mark 기준으로 받았으므로)
+                mark = sub.get('highWaterMark')
+                sub_posts = [dict(post) for post in posts if not BaseFetcher.reached_mark(post, mark)]
+                feed_posts[sub.get('id')] = self._attach_subscription(sub_posts, sub)
+                total_posts += len(sub_posts)
+            yield feed_posts
         
         # 통계
-        total_posts = sum(len(posts) for posts in all_posts.values())
-        print(f"\n📊 총 {len(subscriptions)}개 피드에서 {total_posts}개 게시물 수집 완료")
+        print(f"\n📊 총 {len(subscriptions)}개 구독 ({len(targets)}개 피드)에서 {total_posts}개 게시물 수집 완료")
+        
+        cache_after = self.feed_cache.stats()
+        self.last_cache_stats = {
+            'hits': cache_after['hits'] - cache_before['hits'],
+            'misses': cache_after['misses'] - cache_before['misses'],
+        }
+        print(f"♻️  피드 캐시: 변경 없음 {self.last_cache_stats['hits']}개 / 새로 받음 {self.last_cache_stats['misses']}개")
+        
+        requests_by_host = run_metrics.values(HTTP_REQUESTS.name)
+        self.last_transport_stats = {
+            'requests': sum(requests_by_host.values()),
+            'connections': sum(run_metrics.values(HTTP_CONNECTIONS.name).values()),
+        }
+        print(f"🔌 HTTP: 요청 {self.last_transport_stats['requests']}회 / 새 연결 {self.last_transport_stats['connections']}개 "
+              f"({len(requests_by_host)}개 호스트)")
+    
+    def commit_feed_cache(self):
+        """
+        피드 검증값 저장 (게시물 저장이 끝난 뒤 호출)
+        """
+        self.feed_cache.commit()
+    
+    def _fetch_parallel(self, targets: list, marks: dict, fetch=None, groups: dict = None):
+        """
+        워커 풀에서 피드를 병렬 수집 (끝나는 순서대로 반환하는 제너레이터)
+        
+        호스트별로 대기열을 나눠서, 한 호스트에 동시에 per_host_limit개까지만
+        요청이 나가도록 작업을 제출합니다. 제한에 걸린 작업이 워커를 붙잡고
+        기다리지 않으므로 다른 호스트의 피드는 계속 수집됩니다.
+        
+        Args:
+            targets (list): RSS URL이 있는 구독 리스트
+            marks (dict): {구독 ID: high-water mark}
+            fetch (callable): 구독 하나를 수집할 함수 (기본: _fetch_subscription)
+            groups (dict): {대표 구독 ID: 같은 피드를 받을 구독 리스트}
+            
+        Yields:
+            tuple: (구독, [posts])
+        """
+        fetch = fetch or bind_run(self._fetch_subscription)
+        # 호스트별 대기열
+        pending = {}
+        for sub in targets:
+            host = self._host_of(sub.get('rssUrl'))
+            pending.setdefault(host, deque()).append(sub)
+        
+        in_flight = {host: 0 for host in pending}
+        
+        print(f"⚡ {len(targets)}개 피드 병렬 수집 "
+              f"(워커 {self.max_workers}개, 호스트당 {self.per_host_limit}개, 호스트 {len(pending)}곳)")
         
-        return all_posts
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            
+            def submit_ready():
+                # 호스트별 한도와 워커 수 안에서 가능한 만큼 제출
+                for host, queue in pending.items():
+                    while queue and in_flight[host] < self.per_host_limit and len(futures) < self.max_workers:
+                        sub = queue.popleft()
+                        future = executor.submit(fetch, sub, marks.get(sub.get('id')),
+                                                 (groups or {}).get(sub.get('id')))
+                        futures[future] = (host, sub)
+                        in_flight[host] += 1
+            
+            submit_ready()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                finished = []
+                for future in done:
+                    host, sub = futures.pop(future)
+                    in_flight[host] -= 1
+                    try:
+                        finished.append((sub, future.result()))
+                    except Exception as e:
+                        print(f"❌ [{sub.get('name')}] 수집 실패: {e}")
+                        finished.append((sub, []))
+                # 결과를 넘기기 전에 다음 요청부터 제출
+                submit_ready()
+                yield from finished
     
    # ✅ 클래스 밖! (들여쓰기 없음)
-rss_fetcher = RSSFetcher()
\ No newline at end of file
+# 싱글톤 인스턴스 (처음 사용할 때 생성)
+_rss_fetcher = None
+_rss_fetcher_lock = threading.Lock()
+
+
+def get_rss_fetcher():
+    """RSSFetcher 싱글톤 (처음 호출할 때 플랫폼별 Fetcher 생성)"""
+    global _rss_fetcher
+    if _rss_fetcher is None:
+        with _rss_fetcher_lock:
+            if _rss_fetcher is None:
+                _rss_fetcher = RSSFetcher()
+    return _rss_fetcher
+
+
+def __getattr__(name):
+    # `from rss_fetcher import rss_fetcher`도 처음 접근할 때 생성
+    if name == 'rss_fetcher':
+        return get_rss_fetcher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,6 +1,6 @@
 """
 메인 동기화 스크립트
-RSS 피드 수집 → AI 분석 → Firebase 저장 전체 프로세스 실행
+RSS 피드 수집 → AI 분석 → Firebase 저장 전체 프로세스 실행 (스트리밍 파이프라인)
 """
 
 from datetime import datetime
@@ -8,10 +8,18 @@ from config import config
 from firebase_client import firebase_client
 from rss_fetcher import rss_fetcher
 from ai_summarizer import ai_summarizer
+from sync_pipeline import SyncPipeline
+from poll_scheduler import poll_scheduler
 
 
-def main():
-    """메인 동기화 프로세스"""
+def main(rebuild_index=False, force=False):
+    """
+    메인 동기화 프로세스
+    
+    Args:
+        rebuild_index (bool): 중복 체크 색인을 Firestore에서 다시 만들지 여부
+        force (bool): 수집 일정과 관계없이 모든 구독 수집
+    """
     
     print("=" * 60)
     print("🚀 DIY News 동기화 시작")
@@ -20,89 +28,43 @@ def main():
     
     try:
         # 1️⃣ 설정 검증
-        print("\n[1/5] 설정 검증 중...")
+        print("\n[1/3] 설정 검증 중...")
         config.validate()
         
         # 2️⃣ Firebase에서 구독 목록 가져오기
-        print("\n[2/5] 구독 목록 가져오는 중...")
+        print("\n[2/3] 구독 목록 가져오는 중...")
         subscriptions = firebase_client.get_subscriptions()
         
         if not subscriptions:
             print("⚠️  구독 계정이 없습니다. 먼저 계정을 추가하세요.")
             return
         
-        # 3️⃣ RSS 피드 수집
-        print("\n[3/5] RSS 피드 수집 중...")
-        all_posts = rss_fetcher.fetch_multiple_feeds(subscriptions)
+        # 3️⃣ 수집 → 중복 체크 → AI 분석 → 저장 (단계별로 동시에 진행)
+        print("\n[3/3] 수집 · 분석 · 저장 파이프라인 실행 중...")
+        pipeline = SyncPipeline(rss_fetcher, firebase_client, ai_summarizer, poll_scheduler)
+        stats = pipeline.run(subscriptions, rebuild_index=rebuild_index, force=force)
         
-        # 수집된 게시물을 하나의 리스트로 합치기
-        posts_to_process = []
-        for sub_id, posts in all_posts.items():
-            posts_to_process.extend(posts)
+        if stats['skipped']:
+            print(f"⏭️  수집 일정 전이라 건너뛴 구독: {stats['skipped']}개 (--force로 전체 수집)")
         
-        if not posts_to_process:
+        if not stats['collected']:
             print("ℹ️  새로운 게시물이 없습니다.")
             return
         
-        print(f"\n📊 총 {len(posts_to_process)}개 게시물 수집됨")
-        
-        # 4️⃣ 중복 체크 (이미 저장된 게시물 제외)
-        print("\n[4/5] 중복 게시물 확인 중...")
-        existing_urls = firebase_client.get_existing_post_urls()
-        
-        new_posts = [
-            post for post in posts_to_process 
-            if post.get('url') not in existing_urls
-        ]
-        
-        print(f"🆕 새 게시물: {len(new_posts)}개 (중복 제외: {len(posts_to_process) - len(new_posts)}개)")
-        
-        if not new_posts:
+        if not stats['new']:
             print("ℹ️  저장할 새 게시물이 없습니다.")
             return
         
-        # 5️⃣ AI 분석 (요약 + 일정 추출)
-        print("\n[5/5] AI 분석 중...")
-        analyzed_posts = ai_summarizer.analyze_batch(new_posts)
-        
-        # 6️⃣ Firebase에 저장
-        print("\n[6/6] Firebase에 저장 중...")
-        
-        # 게시물 데이터 정리
-        for post in analyzed_posts:
-            # publishedAt 형식 변환
-            if 'published' in post:
-                published = post['published']
-                if isinstance(published, datetime):
-                    post['publishedAt'] = published.isoformat()
-                else:
-                    post['publishedAt'] = str(published)
-            
-            # userId 추가 (subscription에서 가져오기)
-            # accountId로 subscription 찾기
-            for sub in subscriptions:
-                if sub.get('accountId') == post.get('accountId'):
-                    post['userId'] = sub.get('userId')
-                    break
-            
-            # 필요없는 필드 제거
-            post.pop('published', None)
-            # subscription_id는 유지하지 않음 (accountId로 충분)
-        
-        # 배치 저장
-        saved_count = firebase_client.save_posts_batch(analyzed_posts)
-        
-        # 7️⃣ 구독 동기화 시간 업데이트
-        for sub_id in all_posts.keys():
-            firebase_client.update_subscription_sync_time(sub_id)
-        
         # 완료 메시지
         print("\n" + "=" * 60)
         print("✅ 동기화 완료!")
-        print(f"📥 수집: {len(posts_to_process)}개")
-        print(f"🆕 새 게시물: {len(new_posts)}개")
-        print(f"💾 저장: {saved_count}개")
-        print(f"📅 일정 감지: {sum(1 for p in analyzed_posts if p.get('hasSchedule'))}개")
+        print(f"📥 수집: {stats['collected']}개")
+        print(f"🆕 새 게시물: {stats['new']}개")
+        print(f"💾 저장: {stats['saved']}개")
+        print(f"📅 일정 감지: {stats['schedules']}개")
+        print(f"♻️  피드 캐시: 적중 {stats['feedCacheHits']}개 / 미스 {stats['feedCacheMisses']}개")
+        print(f"🔗 고유 피드: {stats['uniqueFeeds']}개")
+        print(f"🔌 HTTP: 요청 {stats['httpRequests']}회 / 새 연결 {stats['httpConnections']}개")
         print(f"⏰ 종료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 60)
         
@@ -115,4 +77,18 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="DIY News 동기화")
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help="중복 체크용 게시물 색인을 Firestore에서 다시 생성")
+    parser.add_argument('--force', action='store_true',
+                        help="수집 일정과 관계없이 모든 구독을 수집")
+    parser.add_argument('--rebuild-schedules', action='store_true',
+                        help="기존 게시물로 캘린더 일정 색인을 다시 만들고 종료")
+    args = parser.parse_args()
+    
+    if args.rebuild_schedules:
+        firebase_client.rebuild_schedule_index()
+    else:
+        main(rebuild_index=args.rebuild_index, force=args.force)
\ No newline at end of file
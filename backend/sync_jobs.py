@@ -0,0 +1,300 @@
+"""
+동기화 작업 큐
+동기화 요청을 작업(Job)으로 만들어 대기열에 넣고, 정해진 수의 워커가 순서대로 실행합니다.
+같은 범위의 대기 중인 요청은 하나로 합치고, 구독이 겹치는 작업은 동시에 실행하지 않습니다.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from config import config
+
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class SyncJob:
+    """동기화 작업 하나"""
+
+    def __init__(self, subscriptions, scope=None, force=False, rebuild_index=False):
+        """
+        Args:
+            subscriptions (list): 동기화할 구독 정보 리스트
+            scope (dict): 동기화 범위 {userId, subscriptionIds} (None이면 전체)
+            force (bool): 수집 일정과 관계없이 모든 구독 수집
+            rebuild_index (bool): 중복 체크 색인을 Firestore에서 다시 만들지 여부
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.subscriptions = subscriptions
+        self.subscription_ids = {sub['id'] for sub in subscriptions}
+        self.scope = scope
+        self.force = force
+        self.rebuild_index = rebuild_index
+        self.status = QUEUED
+        self.merged_requests = 1
+        self.created_at = datetime.now().isoformat()
+        self.enqueued_at = time.monotonic()  # 대기 시간 계산용
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+        # 설정되면 파이프라인이 다음 묶음을 처리하기 전에 중단
+        self.cancel_token = threading.Event()
+
+        # 진행 이벤트 기록 (늦게 연결한 클라이언트도 처음부터 받을 수 있도록 보관)
+        self._events = []
+        self._events_changed = threading.Condition()
+        self.publish('status', {'status': QUEUED})
+
+    def publish(self, event, data):
+        """
+        진행 이벤트 기록
+
+        Args:
+            event (str): 이벤트 종류 (status / start / stage / progress / done)
+            data (dict): 이벤트 내용
+        """
+        with self._events_changed:
+            self._events.append({'id': len(self._events), 'event': event, 'data': data})
+            self._events_changed.notify_all()
+
+    def wait_events(self, after=0, timeout=None):
+        """
+        after번째 이후 이벤트를 기다렸다가 반환
+
+        Args:
+            after (int): 이미 받은 이벤트 수
+            timeout (float): 새 이벤트가 없을 때 기다릴 최대 시간 (초)
+
+        Returns:
+            tuple: (이벤트 리스트, 작업이 끝나서 더 올 이벤트가 없는지 여부)
+        """
+        with self._events_changed:
+            # 'done' 이벤트가 기록된 뒤에만 끝난 것으로 봐서 마지막 이벤트를 놓치지 않음
+            closed = bool(self._events) and self._events[-1]['event'] == 'done'
+            if len(self._events) <= after and not closed:
+                self._events_changed.wait(timeout)
+                closed = bool(self._events) and self._events[-1]['event'] == 'done'
+            return self._events[after:], closed
+
+    @property
+    def merge_key(self):
+        """같은 요청인지 판단하는 키 (범위 + 동기화할 구독)"""
+        return frozenset(self.subscription_ids), self.rebuild_index
+
+    def to_dict(self):
+        """API 응답용 dict"""
+        return {
+            'id': self.id,
+            'status': self.status,
+            'scope': self.scope,
+            'subscriptions': len(self.subscription_ids),
+            'force': self.force,
+            'mergedRequests': self.merged_requests,
+            'cancelRequested': self.cancel_token.is_set(),
+            'createdAt': self.created_at,
+            'startedAt': self.started_at,
+            'finishedAt': self.finished_at,
+            'result': self.result,
+            'error': self.error,
+        }
+
+
+class SyncJobManager:
+    """동기화 작업 대기열 + 워커 풀"""
+
+    def __init__(self, runner, max_workers=None, history_size=None, max_wait_seconds=None):
+        """
+        Args:
+            runner (callable): 작업을 실행하는 함수 runner(job) → 결과 dict
+                job.cancel_token이 설정되면 SyncCancelled 등으로 중단해야 함
+            max_workers (int): 동시에 실행할 최대 작업 수
+            history_size (int): 끝난 작업을 보관할 개수
+            max_wait_seconds (float): 이보다 오래 기다린 작업은 뒤의 작업에 밀리지 않음 (초)
+        """
+        self.runner = runner
+        self.max_workers = max_workers or config.SYNC_JOB_WORKERS
+        self.max_wait_seconds = config.SYNC_JOB_MAX_WAIT_SECONDS if max_wait_seconds is None else max_wait_seconds
+        self.history_size = history_size or config.SYNC_JOB_HISTORY
+
+        self._jobs = OrderedDict()  # 작업 ID → SyncJob (최근 작업 조회용)
+        self._pending = []          # 대기 중인 작업 (도착 순서)
+        self._running = {}          # 실행 중인 작업 ID → SyncJob
+        self._condition = threading.Condition()
+        self._workers = []
+
+    def start(self):
+        """워커 스레드 시작 (여러 번 호출해도 한 번만 시작)"""
+        with self._condition:
+            if self._workers:
+                return
+            for index in range(self.max_workers):
+                worker = threading.Thread(target=self._work, name=f'sync-job-{index}', daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def submit(self, subscriptions, scope=None, force=False, rebuild_index=False):
+        """
+        동기화 요청 등록
+
+        같은 구독을 대상으로 한 작업이 이미 대기 중이면 새로 만들지 않고 그 작업에 합칩니다.
+        (force 요청이 하나라도 있으면 합친 작업도 force로 실행)
+
+        Args:
+            subscriptions (list): 동기화할 구독 정보 리스트
+            scope (dict): 동기화 범위 {userId, subscriptionIds}
+            force (bool): 수집 일정과 관계없이 모든 구독 수집
+            rebuild_index (bool): 중복 체크 색인을 Firestore에서 다시 만들지 여부
+
+        Returns:
+            tuple: (SyncJob, 기존 작업에 합쳐졌는지 여부)
+        """
+        job = SyncJob(subscriptions, scope, force, rebuild_index)
+        with self._condition:
+            for pending in self._pending:
+                if pending.merge_key == job.merge_key:
+                    pending.merged_requests += 1
+                    pending.force = pending.force or force
+                    return pending, True
+
+            self._pending.append(job)
+            self._remember(job)
+            self._condition.notify()
+        return job, False
+
+    def cancel(self, job_id):
+        """
+        작업 취소
+
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 파이프라인이
+        다음 묶음을 처리하기 전에 멈춥니다.
+
+        Returns:
+            SyncJob: 취소 요청한 작업 (없으면 None)
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED_STATES:
+                return job
+
+            job.cancel_token.set()
+            if job.status == QUEUED:
+                self._pending.remove(job)
+                self._finish(job, CANCELLED, error='실행 전에 취소되었습니다.')
+        return job
+
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        with self._condition:
+            return self._jobs.get(job_id)
+
+    def last_finished(self, user_id=None):
+        """
+        같은 범위에서 가장 최근에 끝난 작업
+
+        Args:
+            user_id (str): 이 사용자 범위의 작업 (None이면 범위 없는 전체 동기화)
+
+        Returns:
+            SyncJob: 작업 (없으면 None)
+        """
+        with self._condition:
+            finished = [
+                job for job in self._jobs.values()
+                if job.status in FINISHED_STATES
+                and ((job.scope or {}).get('userId') == user_id if user_id else job.scope is None)
+            ]
+        return max(finished, key=lambda job: job.finished_at, default=None)
+
+    def snapshot(self):
+        """
+        대기열 상태
+
+        Returns:
+            dict: {running: [job dict], queued: [job dict]}
+        """
+        with self._condition:
+            return {
+                'running': [job.to_dict() for job in self._running.values()],
+                'queued': [job.to_dict() for job in self._pending],
+            }
+
+    def _remember(self, job):
+        """작업 기록 (끝난 작업은 history_size개까지만 보관)"""
+        self._jobs[job.id] = job
+        finished = [job_id for job_id, item in self._jobs.items() if item.status in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self._jobs[job_id]
+
+    def _finish(self, job, status, result=None, error=None):
+        """작업 종료 처리 (_condition 안에서 호출)"""
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = datetime.now().isoformat()
+        job.publish('done', {'status': status, 'result': result, 'error': error})
+        self._running.pop(job.id, None)
+        self._remember(job)
+        self._condition.notify_all()
+
+    def _next_runnable(self):
+        """
+        실행 중인 작업과 구독이 겹치지 않는 가장 오래된 대기 작업 (_condition 안에서 호출)
+
+        겹치는 작업은 건너뛰고 뒤의 작업을 먼저 실행하므로,
+        전체 동기화가 도는 동안 다른 사용자의 동기화가 막히지 않습니다.
+        다만 max_wait_seconds보다 오래 기다린 작업의 구독은 예약해 두고, 그 구독과 겹치는
+        뒤의 작업은 실행하지 않습니다. 짧은 작업이 계속 들어와도 전체 동기화처럼 구독이 많은
+        작업이 무한히 밀리지 않고, 앞의 작업이 끝나는 대로 실행됩니다.
+        """
+        busy = set()
+        for running in self._running.values():
+            busy |= running.subscription_ids
+        now = time.monotonic()
+        for job in self._pending:
+            if not (job.subscription_ids & busy):
+                return job
+            if now - job.enqueued_at >= self.max_wait_seconds:
+                busy |= job.subscription_ids
+        return None
+
+    def _work(self):
+        """워커 루프: 실행 가능한 작업을 꺼내 실행"""
+        while True:
+            with self._condition:
+                job = self._next_runnable()
+                while job is None:
+                    self._condition.wait()
+                    job = self._next_runnable()
+
+                self._pending.remove(job)
+                self._running[job.id] = job
+                job.status = RUNNING
+                job.started_at = datetime.now().isoformat()
+            job.publish('status', {'status': RUNNING})
+
+            status, result, error = SUCCEEDED, None, None
+            try:
+                result = self.runner(job)
+                if result and result.get('cancelled'):
+                    status = CANCELLED
+                elif result and not result.get('success'):
+                    status = FAILED
+            except Exception as e:
+                status, error = FAILED, str(e)
+            if result and status != SUCCEEDED:
+                # 실패 / 취소 결과의 메시지를 작업 오류로 남김
+                error = result.get('error') or result.get('message')
+
+            with self._condition:
+                self._finish(job, status, result, error)
@@ -0,0 +1,455 @@
+"""
+스트리밍 동기화 파이프라인
+수집 → 중복 체크 → AI 분석 → 저장 단계를 크기 제한 큐로 연결해서 동시에 실행합니다.
+먼저 끝난 피드의 게시물은 느린 피드를 기다리지 않고 바로 분석·저장됩니다.
+"""
+
+import queue
+import threading
+import time
+from datetime import datetime
+from config import config
+from metrics import RunMetrics, bind_run, record_run, summarize, STAGE_BATCH_SECONDS, STAGE_ITEMS, SYNC_RUNS, SYNC_SECONDS
+from post_ids import post_doc_id
+from poll_scheduler import PollScheduler
+
+
+# 단계 사이에 흘려보내는 종료 신호
+_DONE = object()
+
+
+class SyncCancelled(Exception):
+    """취소 요청으로 동기화가 중단됨"""
+
+
+class StageStats:
+    """단계별 처리량 통계"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.batches = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+
+    def to_dict(self):
+        """통계 dict (처리량은 실제로 일한 시간 기준 초당 게시물 수)"""
+        throughput = self.items_in / self.busy_seconds if self.busy_seconds else 0.0
+        return {
+            'in': self.items_in,
+            'out': self.items_out,
+            'batches': self.batches,
+            'busySeconds': round(self.busy_seconds, 3),
+            'throughput': round(throughput, 1),
+            'maxQueueDepth': self.max_queue_depth,
+        }
+
+
+class SyncPipeline:
+    """수집 → 중복 체크 → 분석 → 저장 스트리밍 파이프라인"""
+
+    def __init__(self, fetcher, store, summarizer, scheduler=None, queue_size=None, analyze_batch_size=None,
+                 save_batch_size=None):
+        """
+        Args:
+            fetcher (RSSFetcher): 피드 수집기 (실행마다 for_run()으로 따로 만든 Fetcher 사용)
+            store (FirebaseClient): 중복 체크 / 저장소
+            summarizer (AISummarizer): AI 분석기
+            scheduler (PollScheduler): 수집 스케줄러 (없으면 설정값으로 생성)
+            queue_size (int): 단계 사이 큐에 쌓아둘 수 있는 최대 묶음 수
+            analyze_batch_size (int): 분석 단계에서 한 번에 처리할 최대 게시물 수
+            save_batch_size (int): 저장 단계에서 한 번에 커밋할 최대 게시물 수
+        """
+        self.fetcher = fetcher
+        self.store = store
+        self.summarizer = summarizer
+        self.scheduler = scheduler or PollScheduler()
+        self.queue_size = queue_size or config.SYNC_QUEUE_SIZE
+        self.analyze_batch_size = analyze_batch_size or config.SYNC_ANALYZE_BATCH_SIZE
+        self.save_batch_size = save_batch_size or config.SYNC_SAVE_BATCH_SIZE
+
+    def run(self, subscriptions, rebuild_index=False, force=False, cancel_token=None, progress=None):
+        """
+        파이프라인 실행
+
+        수집 일정이 된 구독만 수집합니다 (force=True면 모두 수집).
+        한 단계라도 실패하면 나머지 단계를 멈추고 첫 번째 오류를 다시 발생시킵니다.
+        이 경우 피드 검증값과 구독 동기화 상태는 기록하지 않습니다.
+
+        Args:
+            subscriptions (list): 구독 정보 리스트
+            rebuild_index (bool): 중복 체크 색인을 Firestore에서 다시 만들지 여부
+            force (bool): 수집 일정과 관계없이 모든 구독 수집
+            cancel_token (threading.Event): 설정되면 다음 묶음을 처리하기 전에 중단 (SyncCancelled 발생)
+            progress (callable): 진행 상황을 받을 함수 progress(event, data)
+                event는 'start' / 'stage' (단계 시작·종료) / 'progress' (피드·묶음 처리 후 누적 개수)
+
+        Returns:
+            dict: 동기화 통계 (collected, new, saved, schedules, pipeline, metrics, ...)
+        """
+        # 이번 실행의 스레드가 기록한 값만 모음 (동시에 도는 다른 동기화 값은 섞이지 않음)
+        self._run_metrics = RunMetrics()
+        started = time.monotonic()
+        status = 'failed'
+        try:
+            with record_run(self._run_metrics):
+                stats = self._run(subscriptions, rebuild_index, force, cancel_token, progress)
+            status = 'succeeded'
+            return stats
+        except SyncCancelled:
+            status = 'cancelled'
+            raise
+        finally:
+            SYNC_RUNS.inc(status=status)
+            SYNC_SECONDS.observe(time.monotonic() - started, status=status)
+
+    def _run(self, subscriptions, rebuild_index, force, cancel_token, progress):
+        """run() 본체"""
+        # 동시에 실행되는 다른 동기화와 통계/검증값이 섞이지 않도록 실행 전용 Fetcher 사용
+        self._fetcher = self.fetcher.for_run()
+        self._started_at = time.monotonic()
+        self._first_saved_at = None
+        self._abort = threading.Event()
+        self._cancel_token = cancel_token
+        self._progress = progress
+        self._errors = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._rebuild_index = rebuild_index
+        self._seen_ids = set()
+        self._poll_states = {}
+        self._counts = {'collected': 0, 'new': 0, 'saved': 0, 'schedules': 0}
+        self._analysis_cache = {'hits': 0, 'misses': 0}
+        self._analysis_routes = {}
+        self._stages = {name: StageStats(name) for name in ('fetch', 'dedup', 'analyze', 'save')}
+
+        subscriptions, skipped = self.scheduler.select_due(subscriptions, force=force)
+        self._skipped = len(skipped)
+        self._feeds = {'total': len(subscriptions), 'done': 0}
+        self._emit('start', {'subscriptions': len(subscriptions), 'skipped': self._skipped})
+
+        dedup_queue = queue.Queue(maxsize=self.queue_size)
+        analyze_queue = queue.Queue(maxsize=self.queue_size)
+        save_queue = queue.Queue(maxsize=self.queue_size)
+
+        threads = [
+            threading.Thread(target=bind_run(self._run_fetch), args=(subscriptions, dedup_queue), name='sync-fetch'),
+            threading.Thread(target=bind_run(self._run_stage),
+                             args=('dedup', dedup_queue, analyze_queue, self._dedup, None), name='sync-dedup'),
+            threading.Thread(target=bind_run(self._run_stage), args=('analyze', analyze_queue, save_queue,
+                                                                     self._analyze, self.analyze_batch_size),
+                             name='sync-analyze'),
+            threading.Thread(target=bind_run(self._run_stage), args=('save', save_queue, None, self._save,
+                                                                     self.save_batch_size), name='sync-save'),
+        ]
+        print(f"🚰 파이프라인 시작 (큐 {self.queue_size}묶음, 분석 {self.analyze_batch_size}개, "
+              f"저장 {self.save_batch_size}개 단위)")
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+
+        # 저장에 실패한 게시물이 있으면 다음에 다시 받도록 high-water mark는 올리지 않음
+        if self._counts['saved'] < self._counts['new']:
+            print(f"⚠️  저장 실패 {self._counts['new'] - self._counts['saved']}개 → 수집 위치(high-water mark) 유지")
+            for state in self._poll_states.values():
+                state.pop('highWaterMark', None)
+
+        # 저장까지 끝났으므로 구독 동기화 상태와 피드 검증값 기록
+        if self._poll_states:
+            self.store.update_subscription_states(self._poll_states)
+        self._fetcher.commit_feed_cache()
+
+        try:
+            self.summarizer.cache.evict()
+        except Exception as e:
+            print(f"⚠️  분석 캐시 정리 실패: {e}")
+
+        stats = self.stats()
+        self._print_stats(stats)
+        return stats
+
+    def stats(self):
+        """
+        마지막 실행 통계
+
+        Returns:
+            dict: 게시물 수, 피드/분석 캐시 통계, 단계별 처리량
+        """
+        elapsed = time.monotonic() - self._started_at
+        first_save = None
+        if self._first_saved_at is not None:
+            first_save = round(self._first_saved_at - self._started_at, 3)
+
+        return {
+            **self._counts,
+            'skipped': self._skipped,
+            'feedCacheHits': self._fetcher.last_cache_stats['hits'],
+            'feedCacheMisses': self._fetcher.last_cache_stats['misses'],
+            'httpRequests': self._fetcher.last_transport_stats['requests'],
+            'httpConnections': self._fetcher.last_transport_stats['connections'],
+            'uniqueFeeds': self._fetcher.last_fanout_stats['feeds'],
+            'analysisCacheHits': self._analysis_cache['hits'],
+            'analysisCacheMisses': self._analysis_cache['misses'],
+            'analysisRoutes': dict(self._analysis_routes),
+            'pipeline': {
+                'elapsedSeconds': round(elapsed, 3),
+                'firstSaveSeconds': first_save,
+                'peakPostsInFlight': self._peak_in_flight,
+                'stages': {name: stage.to_dict() for name, stage in self._stages.items()},
+            },
+            'metrics': summarize(self._run_metrics),
+        }
+
+    def _print_stats(self, stats):
+        """단계별 처리량 출력"""
+        pipeline = stats['pipeline']
+        first_save = pipeline['firstSaveSeconds']
+        print(f"\n🚰 파이프라인: 전체 {pipeline['elapsedSeconds']}초, "
+              f"첫 저장 {'-' if first_save is None else f'{first_save}초'}, "
+              f"동시에 처리 중인 게시물 최대 {pipeline['peakPostsInFlight']}개")
+        for name, stage in pipeline['stages'].items():
+            print(f"   {name:<8} 입력 {stage['in']:>5}개 → 출력 {stage['out']:>5}개 | "
+                  f"{stage['batches']}묶음, {stage['busySeconds']}초, {stage['throughput']}개/초, "
+                  f"큐 최대 {stage['maxQueueDepth']}")
+        feeds, llm, firestore = stats['metrics']['feeds'], stats['metrics']['llm'], stats['metrics']['firestore']
+        print(f"   피드 요청 {feeds['requests']}개 ({feeds['notModified']}개 304, 오류 {feeds['errors']}개, "
+              f"{feeds['bytes']:,}바이트) | LLM {llm['requests']}회 {llm['seconds']}초, "
+              f"토큰 {llm['promptTokens'] + llm['completionTokens']:,}개 | "
+              f"Firestore 커밋 {firestore['commits']}회 {firestore['seconds']}초")
+
+    # ---- 단계 실행 ----
+
+    def _fail(self, stage, error):
+        """오류 기록 후 모든 단계에 중단 신호"""
+        if isinstance(error, SyncCancelled):
+            print(f"🛑 파이프라인 [{stage}] 단계에서 취소됨")
+        else:
+            print(f"❌ 파이프라인 [{stage}] 단계 실패: {error}")
+        with self._lock:
+            self._errors.append(error)
+        self._abort.set()
+
+    def _stopped(self, stage):
+        """
+        중단해야 하는지 확인 (다른 단계 실패 또는 취소 요청)
+
+        취소 요청은 여기서 처음 발견한 단계가 SyncCancelled로 기록합니다.
+        """
+        if self._abort.is_set():
+            return True
+        if self._cancel_token is not None and self._cancel_token.is_set():
+            self._fail(stage, SyncCancelled('동기화가 취소되었습니다.'))
+            return True
+        return False
+
+    def _emit(self, event, data):
+        """진행 상황 전달 (받는 쪽 오류는 동기화를 멈추지 않음)"""
+        if self._progress is None:
+            return
+        try:
+            self._progress(event, data)
+        except Exception as e:
+            print(f"⚠️  진행 상황 전달 실패: {e}")
+
+    def _emit_progress(self, stage):
+        """단계 하나가 묶음을 처리한 뒤 누적 개수 전달"""
+        self._emit('progress', {
+            'stage': stage,
+            'feedsDone': self._feeds['done'],
+            'feedsTotal': self._feeds['total'],
+            **self._counts,
+            'postsInFlight': self._in_flight,
+        })
+
+    def _record_batch(self, stage, seconds, items_in, items_out):
+        """묶음 하나의 처리 시간 / 개수를 /api/metrics 지표에 기록"""
+        STAGE_BATCH_SECONDS.observe(seconds, stage=stage)
+        STAGE_ITEMS.inc(items_in, stage=stage, direction='in')
+        STAGE_ITEMS.inc(items_out, stage=stage, direction='out')
+
+    def _put(self, target, item):
+        """
+        다음 단계 큐에 넣기 (큐가 가득 차면 대기 = 역압)
+
+        Returns:
+            bool: 넣었으면 True, 중단 신호를 받았으면 False
+        """
+        while not self._abort.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _track(self, delta):
+        """수집됐지만 아직 저장/제외되지 않은 게시물 수 (메모리 사용량 지표)"""
+        with self._lock:
+            self._in_flight += delta
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _run_fetch(self, subscriptions, target):
+        """수집 단계: 피드가 끝나는 대로 게시물 묶음을 다음 단계로 전달"""
+        stage = self._stages['fetch']
+        subscriptions_by_id = {sub.get('id'): sub for sub in subscriptions}
+        feeds = self._fetcher.iter_feeds(subscriptions)
+        self._emit('stage', {'stage': 'fetch', 'state': 'started'})
+        try:
+            while not self._stopped('fetch'):
+                started = time.monotonic()
+                feed_posts = next(feeds, None)
+                stage.busy_seconds += time.monotonic() - started
+                if feed_posts is None:
+                    break
+
+                elapsed = time.monotonic() - started
+                posts = [post for sub_posts in feed_posts.values() for post in sub_posts]
+                for sub_id, sub_posts in feed_posts.items():
+                    state = self.scheduler.next_state(
+                        subscriptions_by_id[sub_id],
+                        [post.get('published') for post in sub_posts],
+                        self._fetcher.last_fetch_seconds.get(sub_id),
+                    )
+                    mark = self._fetcher.next_high_water_mark(sub_posts)
+                    if mark:
+                        state['highWaterMark'] = mark
+                    self._poll_states[sub_id] = state
+                stage.items_in += len(posts)
+                stage.items_out += len(posts)
+                stage.batches += 1
+                self._record_batch('fetch', elapsed, len(posts), len(posts))
+                self._counts['collected'] += len(posts)
+                self._feeds['done'] += len(feed_posts)
+                self._emit_progress('fetch')
+
+                if posts:
+                    self._track(len(posts))
+                    if not self._put(target, posts):
+                        break
+        except Exception as e:
+            self._fail('fetch', e)
+        finally:
+            feeds.close()
+            target.put(_DONE)
+            self._emit('stage', {'stage': 'fetch', 'state': 'finished'})
+
+    def _run_stage(self, name, source, target, handler, batch_size):
+        """
+        중간 단계 공통 루프
+
+        큐에 쌓인 묶음을 batch_size개까지 한꺼번에 꺼내 처리합니다.
+        앞 단계가 빠르면 묶음이 커지고, 느리면 도착하는 대로 바로 처리합니다.
+        """
+        stage = self._stages[name]
+        done = False
+        self._emit('stage', {'stage': name, 'state': 'started'})
+        try:
+            while not done:
+                batch, done = self._drain(source, batch_size)
+                stage.max_queue_depth = max(stage.max_queue_depth, source.qsize() + 1)
+                if self._stopped(name):
+                    break
+                if not batch:
+                    continue
+
+                started = time.monotonic()
+                results = handler(batch)
+                elapsed = time.monotonic() - started
+                stage.busy_seconds += elapsed
+                stage.items_in += len(batch)
+                stage.items_out += len(results)
+                stage.batches += 1
+                self._record_batch(name, elapsed, len(batch), len(results))
+                self._emit_progress(name)
+
+                if target is not None and results and not self._put(target, results):
+                    break
+        except Exception as e:
+            self._fail(name, e)
+        finally:
+            # 중단됐으면 앞 단계가 막히지 않도록 큐를 비움
+            while not done:
+                _, done = self._drain(source, None)
+            if target is not None:
+                target.put(_DONE)
+            self._emit('stage', {'stage': name, 'state': 'finished'})
+
+    def _drain(self, source, batch_size):
+        """
+        큐에서 묶음 하나를 기다렸다가, 이미 쌓여 있는 묶음을 batch_size개까지 더 꺼냄
+
+        Returns:
+            tuple: (게시물 리스트, 종료 신호를 받았는지 여부)
+        """
+        item = source.get()
+        if item is _DONE:
+            return [], True
+
+        batch = list(item)
+        while batch_size is None or len(batch) < batch_size:
+            try:
+                item = source.get_nowait()
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.extend(item)
+        return batch, False
+
+    # ---- 단계별 처리 ----
+
+    def _dedup(self, posts):
+        """중복 체크 단계: 이미 저장됐거나 이번 실행에서 이미 넘긴 게시물 제외"""
+        new_posts = self.store.filter_new_posts(posts, rebuild_index=self._rebuild_index)
+        self._rebuild_index = False
+
+        fresh = []
+        for post in new_posts:
+            post_id = post_doc_id(post.get('url'), post.get('userId'))
+            if post_id not in self._seen_ids:
+                self._seen_ids.add(post_id)
+                fresh.append(post)
+
+        self._counts['new'] += len(fresh)
+        self._track(len(fresh) - len(posts))
+        return fresh
+
+    def _analyze(self, posts):
+        """분석 단계: 요약 + 일정 추출 후 저장 형식으로 정리"""
+        analyzed_posts = self.summarizer.analyze_batch(posts, show_progress=False, evict_cache=False)
+
+        for name in ('hits', 'misses'):
+            self._analysis_cache[name] += self.summarizer.last_cache_stats[name]
+        for route, count in self.summarizer.last_route_stats.items():
+            self._analysis_routes[route] = self._analysis_routes.get(route, 0) + count
+
+        for post in analyzed_posts:
+            # publishedAt 형식 변환
+            if 'published' in post:
+                published = post['published']
+                if isinstance(published, datetime):
+                    post['publishedAt'] = published.isoformat()
+                else:
+                    post['publishedAt'] = str(published)
+
+            # 필요없는 필드 제거
+            post.pop('published', None)
+            post.pop('entryId', None)
+
+        self._counts['schedules'] += sum(1 for post in analyzed_posts if post.get('hasSchedule'))
+        return analyzed_posts
+
+    def _save(self, posts):
+        """저장 단계: Firestore에 배치 저장"""
+        saved_count = self.store.save_posts_batch(posts)
+        if saved_count and self._first_saved_at is None:
+            self._first_saved_at = time.monotonic()
+        self._counts['saved'] += saved_count
+        self._track(-len(posts))
+        return posts
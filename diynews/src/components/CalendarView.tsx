@@ -1,13 +1,23 @@
 import { Calendar as CalendarIcon } from "lucide-react";
 import { Calendar } from "@/components/ui/calendar";
 import { Card } from "@/components/ui/card";
-import { useState, useMemo } from "react";
+import { useState, useMemo, useEffect } from "react";
 import { Badge } from "@/components/ui/badge";
 import type { Post } from "@/pages/Index";
+import { auth } from "@/lib/firebase";
 
 interface CalendarViewProps {
   posts: Post[];
   bookmarks: string[];
+  userId?: string;
+}
+
+// 백엔드 일정 색인 (/api/schedules) 항목
+interface ScheduleItem {
+  postId: string;
+  date: string;
+  title: string;
+  author: string;
 }
 
 const extractDates = (text: string): Date[] => {
@@ -25,9 +35,43 @@ const formatDateTime = (date: Date): string => {
   });
 };
 
-const CalendarView = ({ posts, bookmarks }: CalendarViewProps) => {
+const CalendarView = ({ posts, bookmarks, userId }: CalendarViewProps) => {
   const [selectedDate, setSelectedDate] = useState<Date | undefined>(new Date());
   const [currentMonth, setCurrentMonth] = useState(new Date()); 
+  const [schedules, setSchedules] = useState<ScheduleItem[]>([]);
+
+  // 📅 보고 있는 달의 일정 가져오기 (사용자·월별 일정 색인 문서 하나만 읽음)
+  const monthKey = `${currentMonth.getFullYear()}-${String(currentMonth.getMonth() + 1).padStart(2, '0')}`;
+  useEffect(() => {
+    if (!userId) {
+      setSchedules([]);
+      return;
+    }
+
+    const fetchSchedules = async () => {
+      try {
+        // 서버는 ID 토큰의 사용자 일정만 돌려줌
+        const token = await auth.currentUser?.getIdToken();
+        if (!token) {
+          setSchedules([]);
+          return;
+        }
+        const params = new URLSearchParams({ month: monthKey });
+        const response = await fetch(`http://localhost:5000/api/schedules?${params}`, {
+          headers: { Authorization: `Bearer ${token}` },
+        });
+        if (!response.ok) {
+          throw new Error(`일정 조회 실패: ${response.status}`);
+        }
+        const data = await response.json();
+        setSchedules(data.schedules);
+      } catch (error) {
+        console.error('일정 조회 실패:', error);
+      }
+    };
+
+    fetchSchedules();
+  }, [userId, monthKey]);
 
   const scheduledEvents = useMemo(() => {
     const events: Array<{
@@ -40,25 +84,23 @@ const CalendarView = ({ posts, bookmarks }: CalendarViewProps) => {
     
     const colors = ["bg-rose-400", "bg-sky-400", "bg-emerald-400", "bg-amber-400", "bg-purple-400"];
     
-    posts.forEach((post, index) => {
-      // 1. scheduleDate 필드 확인 (우선순위)
-      if (post.hasSchedule && post.scheduleDate) {
-        try {
-          const scheduleDate = new Date(post.scheduleDate);
-          if (!isNaN(scheduleDate.getTime())) {
-            events.push({
-              date: scheduleDate,
-              title: post.title,
-              source: post.author,
-              bookmarked: bookmarks.includes(post.id),
-              color: colors[index % colors.length]
-            });
-          }
-        } catch (e) {
-          console.error('날짜 파싱 실패:', post.scheduleDate, e);
-        }
+    // 1. 백엔드 일정 색인 (우선순위)
+    schedules.forEach((item, index) => {
+      const scheduleDate = new Date(item.date);
+      if (!isNaN(scheduleDate.getTime())) {
+        events.push({
+          date: scheduleDate,
+          title: item.title,
+          source: item.author,
+          bookmarked: bookmarks.includes(item.postId),
+          color: colors[index % colors.length]
+        });
+      } else {
+        console.error('날짜 파싱 실패:', item.date);
       }
-      
+    });
+
+    posts.forEach((post, index) => {
       // 2. 텍스트에서 날짜 추출 (폴백)
       const dates = extractDates(post.title + " " + post.content);
       dates.forEach(d => {
@@ -73,7 +115,7 @@ const CalendarView = ({ posts, bookmarks }: CalendarViewProps) => {
     });
     
     return events;
-  }, [posts, bookmarks]);
+  }, [schedules, posts, bookmarks]);
 
   // 🎯 선택된 날짜의 일정만 필터링
   const selectedDateEvents = useMemo(() => {
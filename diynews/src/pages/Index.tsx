@@ -1,5 +1,5 @@
 import { useState, useEffect, useMemo } from "react";
-import { collection, query, where, orderBy, limit, getDocs, deleteDoc, doc } from "firebase/firestore";
+import { deleteDoc, doc } from "firebase/firestore";
 import { db, auth } from "@/lib/firebase";
 import { onAuthStateChanged } from "firebase/auth";
 import Navigation from "@/components/Navigation";
@@ -45,13 +45,11 @@ const Index = () => {
     return () => unsubscribe();
   }, []);
   
-  // 🔥 Firestore에서 posts 가져오기
+  // 🔥 API 서버에서 posts 가져오기 (서버 캐시 + ETag로 다시 열 때는 Firestore를 읽지 않음)
   useEffect(() => {
     const fetchPosts = async () => {
       try {
         setLoading(true);
-        
-        const postsRef = collection(db, 'posts');
 
         // 로그인한 사용자의 게시물만 가져오기
         if (!user) {
@@ -60,20 +58,20 @@ const Index = () => {
           return;
         }
 
-        const q = query(
-          postsRef,
-          where('userId', '==', user.uid),  // 활성화!
-          orderBy('createdAt', 'desc'),
-         limit(50)
-        );
-        
-        const querySnapshot = await getDocs(q);
+        // 서버는 ID 토큰의 사용자 게시물만 돌려줌
+        const token = await user.getIdToken();
+        const params = new URLSearchParams({ limit: '50' });
+        const response = await fetch(`http://localhost:5000/api/posts?${params}`, {
+          headers: { Authorization: `Bearer ${token}` },
+        });
+        if (!response.ok) {
+          throw new Error(`게시물 조회 실패: ${response.status}`);
+        }
+        const { posts: postDocs } = await response.json();
         
-        const fetchedPosts = querySnapshot.docs.map(doc => {
-          const data = doc.data();
-          
+        const fetchedPosts = postDocs.map((data: any) => {
           return {
-            id: doc.id,
+            id: data.id,
             platform: data.platform as "twitter" | "youtube" | "blog",
             author: data.author,
             authorAvatar: `https://api.dicebear.com/7.x/avataaars/svg?seed=${data.author}`,
@@ -104,6 +102,20 @@ const Index = () => {
     try {
       // Firebase의 'posts' 컬렉션에서 해당 게시물 삭제
       await deleteDoc(doc(db, 'posts', postId));
+
+      // 서버의 게시물 조회 캐시와 일정 색인에서도 제거 (새로고침해도 다시 보이지 않도록)
+      const deleted = posts.find(p => p.id === postId);
+      const token = await user?.getIdToken();
+      await fetch('http://localhost:5000/api/posts/invalidate', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          Authorization: `Bearer ${token}`,
+        },
+        body: JSON.stringify({
+          deletedPosts: [{ id: postId, scheduleDate: deleted?.scheduleDate }],
+        }),
+      });
       
       // UI에서 즉시 제거 (새로고침 없이 바로 사라짐)
       setPosts(posts.filter(p => p.id !== postId));
@@ -154,8 +166,12 @@ const Index = () => {
     setLoading(true);
     
     console.log('동기화 요청 시작...');
+    // 내 구독만 동기화 (다른 사용자의 동기화와 동시에 실행 가능)
+    // 직접 누른 동기화이므로 수집 일정과 관계없이 모든 구독을 수집
     const response = await fetch('http://localhost:5000/api/sync', {
       method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ userId: user?.uid, force: true }),
     });
 
     if (!response.ok) {
@@ -163,12 +179,41 @@ const Index = () => {
     }
 
     const data = await response.json();
-    console.log('동기화 성공:', data);
+    console.log('동기화 예약:', data);
 
-    // 3초 후 데이터 새로고침
-    setTimeout(() => {
+    // 진행 상황 스트림을 받다가 작업이 끝나면 데이터 새로고침
+    const events = new EventSource(`http://localhost:5000/api/jobs/${data.jobId}/events`);
+    events.addEventListener('progress', (event) => {
+      const progress = JSON.parse((event as MessageEvent).data);
+      console.log(
+        `동기화 진행 [${progress.stage}] 피드 ${progress.feedsDone}/${progress.feedsTotal}, ` +
+        `수집 ${progress.collected} · 새 게시물 ${progress.new} · 저장 ${progress.saved}`
+      );
+    });
+    events.addEventListener('done', (event) => {
+      events.close();
+      console.log('동기화 종료:', JSON.parse((event as MessageEvent).data));
       window.location.reload();
-    }, 3000);
+    });
+    // 스트림이 끊기면(서버 재시작 / 네트워크 오류) 재연결하지 않고 작업 상태를 한 번만 확인
+    events.onerror = async () => {
+      events.close();
+      setLoading(false);
+      setIsSyncing(false);
+      try {
+        const jobResponse = await fetch(`http://localhost:5000/api/jobs/${data.jobId}`);
+        const { job } = await jobResponse.json();
+        if (job && job.status !== 'queued' && job.status !== 'running') {
+          console.log('동기화 종료:', job);
+          window.location.reload();
+          return;
+        }
+        console.warn('진행 상황 연결이 끊겼습니다. 동기화는 서버에서 계속됩니다:', job);
+      } catch (error) {
+        console.error('동기화 상태 확인 실패:', error);
+        alert('동기화 진행 상황을 확인할 수 없습니다.');
+      }
+    };
 
   } catch (error) {
     console.error('동기화 오류:', error);
@@ -217,6 +262,7 @@ const Index = () => {
           <CalendarView 
             posts={posts}
             bookmarks={bookmarks}
+            userId={user?.uid}
           />
         )}
         